@@ -6,15 +6,21 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST, CONF_URL, Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from httpx import TimeoutException
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
-from .coordinator import GaggiuinoDataUpdateCoordinator
+from .const import DATA_FLEET, DOMAIN
+from .coordinator import GaggiuinoDataUpdateCoordinator, snapshot_store
+from .fleet import GaggiuinoFleet
+from .heatup import heatup_store
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,34 +33,115 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+# Platforms left out while the user has disabled all of their entities
+OPTIONAL_PLATFORMS: set[Platform] = {
+    Platform.LIGHT,
+    Platform.NUMBER,
+    Platform.SWITCH,
+}
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the Gaggiuino services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Gaggiuino from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    if (fleet := hass.data[DOMAIN].get(DATA_FLEET)) is None:
+        fleet = hass.data[DOMAIN][DATA_FLEET] = GaggiuinoFleet(hass)
 
-    _LOGGER.debug("Gaggiuino async_config_entry_first_refresh")
-    _coordinator = GaggiuinoDataUpdateCoordinator(hass, entry)
+    fleet.pending_setups += 1
     try:
-        await _coordinator.async_config_entry_first_refresh()
-    except (TimeoutError, TimeoutException) as ex:
-        raise ConfigEntryNotReady from ex
-
-    _LOGGER.debug("Gaggiuino async_forward_entry_setups")
-    hass.data[DOMAIN][entry.entry_id] = _coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        _coordinator = GaggiuinoDataUpdateCoordinator(hass, entry, fleet)
+        # Start from the last known state and fetch the live one in the background,
+        # so setup does not wait for a machine that may be switched off
+        await _coordinator.heatup.async_load()
+        restored = await _coordinator.async_restore()
+        if not restored:
+            _LOGGER.debug("Gaggiuino async_config_entry_first_refresh")
+            try:
+                await _coordinator.async_config_entry_first_refresh()
+            except TimeoutError as ex:
+                raise ConfigEntryNotReady from ex
+
+        _LOGGER.debug("Gaggiuino async_forward_entry_setups")
+        hass.data[DOMAIN][entry.entry_id] = _coordinator
+        _coordinator.platforms = async_get_enabled_platforms(hass, entry)
+        await hass.config_entries.async_forward_entry_setups(
+            entry, _coordinator.platforms
+        )
+        fleet.async_add(_coordinator, poll_now=restored)
+    finally:
+        fleet.pending_setups -= 1
+        # A failed setup leaves no machine behind to stop the fleet on unload
+        _async_release_fleet(hass)
+    _coordinator.async_start_stream()
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     _LOGGER.debug("Gaggiuino async_setup_entry True")
     return True
 
 
+@callback
+def async_get_enabled_platforms(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> list[Platform]:
+    """
+    Return the platforms to set up.
+
+    An optional platform is skipped if the registry has entities of it and all of
+    them are disabled. Enabling one of them reloads the entry, which sets it up.
+    """
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    disabled = {
+        platform
+        for platform in OPTIONAL_PLATFORMS
+        if (of_platform := [entity for entity in entities if entity.domain == platform])
+        and all(entity.disabled for entity in of_platform)
+    }
+    return [platform for platform in PLATFORMS if platform not in disabled]
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator: GaggiuinoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
+    ):
         hass.data[DOMAIN].pop(entry.entry_id)
+        fleet: GaggiuinoFleet = hass.data[DOMAIN][DATA_FLEET]
+        fleet.async_remove(coordinator)
+        await coordinator.async_shutdown()
+        _async_release_fleet(hass)
 
     return unload_ok
 
 
+@callback
+def _async_release_fleet(hass: HomeAssistant) -> None:
+    """Stop the fleet once no machine is polled by it or being set up."""
+    fleet: GaggiuinoFleet = hass.data[DOMAIN][DATA_FLEET]
+    if not fleet.machines and not fleet.pending_setups:
+        fleet.async_stop()
+        hass.data[DOMAIN].pop(DATA_FLEET)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved state and warm-up model of a deleted config entry."""
+    await snapshot_store(hass, entry).async_remove()
+    await heatup_store(hass, entry.entry_id).async_remove()
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     _LOGGER.debug(
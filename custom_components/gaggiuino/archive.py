@@ -0,0 +1,213 @@
+"""Indexed shot archive for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import astuple, fields
+from typing import TYPE_CHECKING, Final
+
+from .shots import ShotSummary
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from .shots import GaggiuinoShotStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_COLUMNS: Final = tuple(field.name for field in fields(ShotSummary))
+_SELECT: Final = f"SELECT {', '.join(_COLUMNS)} FROM shots"
+_SCHEMA: Final = (
+    """
+    CREATE TABLE IF NOT EXISTS shots (
+        id INTEGER PRIMARY KEY,
+        timestamp INTEGER NOT NULL,
+        profile_id INTEGER,
+        profile_name TEXT,
+        total_time REAL NOT NULL,
+        preinfusion_time REAL,
+        peak_pressure REAL,
+        yield_weight REAL,
+        dose REAL,
+        ratio REAL,
+        mean_flow REAL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS shots_timestamp ON shots (timestamp)",
+    "CREATE INDEX IF NOT EXISTS shots_profile ON shots (profile_id, timestamp)",
+)
+_ID_COLUMN: Final = _COLUMNS.index("id")
+_TIMESTAMP_COLUMN: Final = _COLUMNS.index("timestamp")
+
+
+def _filters(
+    start: int | None, end: int | None, profile_id: int | None
+) -> tuple[list[str], list[int]]:
+    """Return the WHERE conditions and parameters of a timestamp range and profile."""
+    conditions: list[str] = []
+    params: list[int] = []
+    if start is not None:
+        conditions.append("timestamp >= ?")
+        params.append(start)
+    if end is not None:
+        conditions.append("timestamp < ?")
+        params.append(end)
+    if profile_id is not None:
+        conditions.append("profile_id = ?")
+        params.append(profile_id)
+    return conditions, params
+
+
+class GaggiuinoShotArchive:
+    """
+    SQLite index of shot summaries.
+
+    Summaries are computed once at ingest, so lookups never touch the raw curves.
+    All methods do blocking I/O and must run in an executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize."""
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Imported on first use, keeping it out of the integration load time
+            import sqlite3
+
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def add(self, summary: ShotSummary) -> None:
+        """Add or replace a shot summary."""
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                f"INSERT OR REPLACE INTO shots ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                astuple(summary),
+            )
+            connection.commit()
+
+    def get(self, shot_id: int) -> ShotSummary | None:
+        """Return the summary of a shot."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(f"{_SELECT} WHERE id = ?", (shot_id,))
+                .fetchone()
+            )
+        return ShotSummary(*row) if row else None
+
+    def latest(self) -> ShotSummary | None:
+        """Return the summary of the newest shot."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(f"{_SELECT} ORDER BY id DESC LIMIT 1")
+                .fetchone()
+            )
+        return ShotSummary(*row) if row else None
+
+    def query(
+        self,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        profile_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ShotSummary]:
+        """Return summaries newest first, filtered by timestamp range and profile."""
+        conditions, params = _filters(start, end, profile_id)
+        sql = _SELECT
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += " ORDER BY timestamp DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [ShotSummary(*row) for row in rows]
+
+    def iter_summaries(
+        self,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        profile_id: int | None = None,
+        chunk_size: int = 100,
+    ) -> Iterator[ShotSummary]:
+        """
+        Yield summaries oldest first, filtered by timestamp range and profile.
+
+        Summaries are read chunk_size at a time, each chunk continuing after the
+        last shot of the previous one, so the lock is never held between chunks.
+        """
+        conditions, params = _filters(start, end, profile_id)
+        after: tuple[int, int] | None = None
+        while True:
+            chunk_conditions = list(conditions)
+            chunk_params = list(params)
+            if after is not None:
+                chunk_conditions.append("(timestamp, id) > (?, ?)")
+                chunk_params.extend(after)
+            sql = _SELECT
+            if chunk_conditions:
+                sql += f" WHERE {' AND '.join(chunk_conditions)}"
+            sql += " ORDER BY timestamp, id LIMIT ?"
+            chunk_params.append(chunk_size)
+
+            with self._lock:
+                rows = self._connect().execute(sql, chunk_params).fetchall()
+            for row in rows:
+                yield ShotSummary(*row)
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1]
+            after = (last[_TIMESTAMP_COLUMN], last[_ID_COLUMN])
+
+    def count(self, *, end: int | None = None) -> int:
+        """Return the number of shots, or of those taken before end."""
+        sql = "SELECT COUNT(*) FROM shots"
+        params: list[int] = []
+        if end is not None:
+            sql += " WHERE timestamp < ?"
+            params.append(end)
+        with self._lock:
+            return self._connect().execute(sql, params).fetchone()[0]
+
+    def shot_ids(self) -> set[int]:
+        """Return the IDs of all indexed shots."""
+        with self._lock:
+            rows = self._connect().execute("SELECT id FROM shots").fetchall()
+        return {row[0] for row in rows}
+
+    def index_store(self, store: GaggiuinoShotStore) -> int:
+        """Index stored shots missing from the archive. Return how many were added."""
+        missing = set(store.shot_ids()) - self.shot_ids()
+        for shot_id in sorted(missing):
+            if (shot := store.load(shot_id)) is not None:
+                self.add(ShotSummary.from_shot(shot))
+        if missing:
+            _LOGGER.debug("Indexed %s stored shots", len(missing))
+        return len(missing)
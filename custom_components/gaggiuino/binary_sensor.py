@@ -12,10 +12,10 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .common import get_status_attr
 from .const import DOMAIN
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -38,6 +38,7 @@ class BinarySensorEntityDescription(BinarySensorEntityDescription):
     device_class: BinarySensorDeviceClass | None = None
     entity_category: EntityCategory | None = None
     value_fn: Callable[[Any], bool] | None = None
+    attributes_fn: Callable[[Any], dict[str, Any] | None] | None = None
 
 
 BINARY_SENSORS = [
@@ -47,7 +48,8 @@ BINARY_SENSORS = [
         name="Availability",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: coordinator.gaggiuino_online,
+        value_fn=lambda coordinator: coordinator.data.online,
+        attributes_fn=lambda coordinator: coordinator.data.breaker,
     ),
     BinarySensorEntityDescription(
         key="health",
@@ -55,7 +57,16 @@ BINARY_SENSORS = [
         name="Health",
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda coordinator: not coordinator.healthy,
+        value_fn=lambda coordinator: not coordinator.data.healthy,
+    ),
+    BinarySensorEntityDescription(
+        key="ready",
+        translation_key="ready",
+        name="Ready",
+        icon="mdi:coffee-maker-check",
+        value_fn=lambda coordinator: (
+            coordinator.data.online and coordinator.heatup.ready
+        ),
     ),
     BinarySensorEntityDescription(
         key="brew_switch",
@@ -92,7 +103,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GaggiuinoBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class GaggiuinoBinarySensor(GaggiuinoEntity, BinarySensorEntity):
     """Representation of a Gaggiuino binary sensor."""
 
     entity_description: BinarySensorEntityDescription
@@ -118,3 +129,9 @@ class GaggiuinoBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
         return self.entity_description.value_fn(self.coordinator) is True
+
+    def _entity_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the binary sensor."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator)
@@ -0,0 +1,90 @@
+"""Circuit breaker for an unreachable Gaggiuino machine."""
+
+from __future__ import annotations
+
+import logging
+import random
+from typing import Any, Final
+
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Doublings past which any base interval exceeds the backoff cap. Bounding the
+# exponent keeps the delay a float however long the machine stays offline.
+_MAX_DOUBLINGS: Final = 16
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failed polls of a machine.
+
+    After threshold failures the breaker opens: the machine is only probed, with
+    a delay that doubles on every failed probe up to max_backoff. The delay is
+    jittered so machines switched off together are not probed in lockstep. The
+    first success closes the breaker again.
+    """
+
+    __slots__ = ("_base", "_max_backoff", "_threshold", "failures", "retry_in")
+
+    def __init__(
+        self,
+        base: float,
+        threshold: int = BREAKER_FAILURE_THRESHOLD,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize with base, the seconds between polls before opening."""
+        self._base = base
+        self._threshold = threshold
+        self._max_backoff = max(base, max_backoff)
+        self.failures = 0
+        # Seconds until the next probe while open
+        self.retry_in: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the breaker state."""
+        return BREAKER_OPEN if self.is_open else BREAKER_CLOSED
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while the machine is only probed."""
+        return self.failures >= self._threshold
+
+    def record_failure(self) -> None:
+        """Count a failed poll or probe and pick the delay until the next probe."""
+        self.failures += 1
+        if not self.is_open:
+            return
+
+        doublings = min(self.failures - self._threshold, _MAX_DOUBLINGS)
+        backoff = min(self._max_backoff, self._base * 2**doublings)
+        # Equal jitter: at least half of the backoff, at most all of it
+        self.retry_in = round(random.uniform(backoff / 2, backoff), 1)
+        if self.failures == self._threshold:
+            _LOGGER.info(
+                "Gaggiuino unreachable after %s polls, probing with backoff",
+                self.failures,
+            )
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        if self.is_open:
+            _LOGGER.info(
+                "Gaggiuino reachable again after %s failed polls", self.failures
+            )
+        self.failures = 0
+        self.retry_in = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state as a dict."""
+        return {
+            "circuit": self.state,
+            "consecutive_failures": self.failures,
+            "next_probe_in": self.retry_in,
+        }
@@ -2,28 +2,45 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from gaggiuino_api import GaggiuinoProfile
+
 
 def get_status_attr(
     attr_name: str = "",
     transform_fn: Callable[[Any], Any] | None = None,
 ) -> Callable[[Any], Any]:
     """Create a function to safely get and optionally transform status attributes."""
+    getter = attrgetter(attr_name)
 
     def get_value(coordinator: Any) -> Any:
-        if (
-            coordinator.data is None
-            or (status := coordinator.data.get("status", None)) is None
-        ):
+        if coordinator.data is None or (status := coordinator.data.status) is None:
             return None
 
-        value = getattr(status, attr_name, None)
+        value = getter(status)
         if value is not None and transform_fn is not None:
             return transform_fn(value)
         return value
 
     return get_value
+
+
+def get_shot_summary_attr(attr_name: str = "") -> Callable[[Any], Any]:
+    """Create a function to safely get an attribute of the last shot summary."""
+
+    def get_value(coordinator: Any) -> Any:
+        if (summary := coordinator.last_shot_summary) is None:
+            return None
+        return getattr(summary, attr_name, None)
+
+    return get_value
+
+
+def get_profile_display_name(profile: GaggiuinoProfile) -> str:
+    """Generate a unique display name for a profile."""
+    return f"{profile.name} (ID: {profile.id})"
@@ -10,12 +10,37 @@ from gaggiuino_api import GaggiuinoAPI
 from gaggiuino_api.const import DEFAULT_BASE_URL
 from homeassistant import config_entries
 from homeassistant.const import CONF_URL
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
+from .const import (
+    CONF_CONFIG_SCAN_INTERVAL,
+    CONF_FIRMWARE_SCAN_INTERVAL,
+    CONF_LIVE_SCAN_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_OFFLINE_SCAN_INTERVAL,
+    CONF_PROFILE_PUSH,
+    CONF_SHOT_SCAN_INTERVAL,
+    CONF_STATE_SCAN_INTERVAL,
+    CONF_STREAMING,
+    DEFAULT_CONFIG_SCAN_INTERVAL,
+    DEFAULT_FIRMWARE_SCAN_INTERVAL,
+    DEFAULT_LIVE_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MIN_WRITE_INTERVAL,
+    DEFAULT_OFFLINE_SCAN_INTERVAL,
+    DEFAULT_PROFILE_PUSH,
+    DEFAULT_SHOT_SCAN_INTERVAL,
+    DEFAULT_STATE_SCAN_INTERVAL,
+    DEFAULT_STREAMING,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS_LIMIT,
+    SENSOR_DEADBANDS,
+)
 
 if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigFlowResult
+    from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +50,45 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENT_REQUESTS_LIMIT)
+        ),
+        vol.Required(CONF_STREAMING, default=DEFAULT_STREAMING): bool,
+        vol.Required(
+            CONF_LIVE_SCAN_INTERVAL, default=DEFAULT_LIVE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+        vol.Required(
+            CONF_SHOT_SCAN_INTERVAL, default=DEFAULT_SHOT_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(float), vol.Range(min=0.25, max=60)),
+        vol.Required(
+            CONF_OFFLINE_SCAN_INTERVAL, default=DEFAULT_OFFLINE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+        vol.Required(
+            CONF_STATE_SCAN_INTERVAL, default=DEFAULT_STATE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+        vol.Required(
+            CONF_CONFIG_SCAN_INTERVAL, default=DEFAULT_CONFIG_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+        vol.Required(
+            CONF_FIRMWARE_SCAN_INTERVAL, default=DEFAULT_FIRMWARE_SCAN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+        **{
+            vol.Required(conf, default=default): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            )
+            for conf, default in SENSOR_DEADBANDS.values()
+        },
+        vol.Required(
+            CONF_MIN_WRITE_INTERVAL, default=DEFAULT_MIN_WRITE_INTERVAL
+        ): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+        vol.Required(CONF_PROFILE_PUSH, default=DEFAULT_PROFILE_PUSH): bool,
+    }
+)
+
 
 async def validate_input(data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -45,6 +109,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 2
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> GaggiuinoOptionsFlow:
+        """Create the options flow."""
+        return GaggiuinoOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -80,5 +152,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class GaggiuinoOptionsFlow(config_entries.OptionsFlow):
+    """Handle Gaggiuino options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            # noinspection PyTypeChecker
+            return self.async_create_entry(data=user_input)
+
+        # noinspection PyTypeChecker
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
+
+
 class CannotConnectError(HomeAssistantError):
     """Error to indicate we cannot connect."""
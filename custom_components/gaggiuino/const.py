@@ -4,3 +4,164 @@ from typing import Final
 
 DOMAIN: Final = "gaggiuino"
 CONF_PROFILE: Final = "profile"
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 3
+MAX_CONCURRENT_REQUESTS_LIMIT: Final = 6
+
+# Endpoints polled by the coordinator
+ENDPOINT_STATUS: Final = "status"
+ENDPOINT_PROFILES: Final = "profiles"
+ENDPOINT_HEALTH: Final = "health"
+ENDPOINT_LATEST_SHOT_ID: Final = "latest_shot_id"
+ENDPOINT_SETTINGS: Final = "settings"
+ENDPOINT_FIRMWARE_PROGRESS: Final = "firmware_progress"
+
+# Polling tiers, each refreshed at its own interval
+TIER_LIVE: Final = "live"
+TIER_STATE: Final = "state"
+TIER_CONFIG: Final = "config"
+TIER_FIRMWARE: Final = "firmware"
+
+CONF_LIVE_SCAN_INTERVAL: Final = "live_scan_interval"
+CONF_STATE_SCAN_INTERVAL: Final = "state_scan_interval"
+CONF_CONFIG_SCAN_INTERVAL: Final = "config_scan_interval"
+CONF_FIRMWARE_SCAN_INTERVAL: Final = "firmware_scan_interval"
+
+# Seconds. The defaults add up to fewer requests than the former single
+# 30 s interval that fetched every endpoint.
+DEFAULT_LIVE_SCAN_INTERVAL: Final = 10
+DEFAULT_STATE_SCAN_INTERVAL: Final = 60
+DEFAULT_CONFIG_SCAN_INTERVAL: Final = 300
+DEFAULT_FIRMWARE_SCAN_INTERVAL: Final = 3600
+
+TIER_SCAN_INTERVALS: Final = {
+    TIER_LIVE: (CONF_LIVE_SCAN_INTERVAL, DEFAULT_LIVE_SCAN_INTERVAL),
+    TIER_STATE: (CONF_STATE_SCAN_INTERVAL, DEFAULT_STATE_SCAN_INTERVAL),
+    TIER_CONFIG: (CONF_CONFIG_SCAN_INTERVAL, DEFAULT_CONFIG_SCAN_INTERVAL),
+    TIER_FIRMWARE: (CONF_FIRMWARE_SCAN_INTERVAL, DEFAULT_FIRMWARE_SCAN_INTERVAL),
+}
+
+ENDPOINT_TIERS: Final = {
+    ENDPOINT_STATUS: TIER_LIVE,
+    ENDPOINT_HEALTH: TIER_STATE,
+    ENDPOINT_LATEST_SHOT_ID: TIER_STATE,
+    ENDPOINT_PROFILES: TIER_CONFIG,
+    ENDPOINT_SETTINGS: TIER_CONFIG,
+    ENDPOINT_FIRMWARE_PROGRESS: TIER_FIRMWARE,
+}
+
+FIRMWARE_STATUS_IN_PROGRESS: Final = "IN_PROGRESS"
+
+# Adaptive live polling
+CONF_SHOT_SCAN_INTERVAL: Final = "shot_scan_interval"
+CONF_OFFLINE_SCAN_INTERVAL: Final = "offline_scan_interval"
+
+# Seconds
+DEFAULT_SHOT_SCAN_INTERVAL: Final = 0.5
+DEFAULT_OFFLINE_SCAN_INTERVAL: Final = 120
+WARMUP_SCAN_INTERVAL: Final = 2.0
+# DataUpdateCoordinator schedules on whole seconds, shorter intervals poll back to back
+MIN_UPDATE_INTERVAL: Final = 1.0
+# Degrees Celsius below the target temperature that count as warming up
+WARMUP_TEMPERATURE_BAND: Final = 1.0
+
+# Learned warm-up model
+# Targets below this are idle profiles, never ready for brewing (degrees Celsius)
+READY_MIN_TARGET_TEMPERATURE: Final = 60.0
+# Weight of the newest warm-up in the learned heating rate
+HEATUP_LEARNING_RATE: Final = 0.3
+# Shortest warm-up learned from (seconds, degrees Celsius)
+HEATUP_MIN_DURATION: Final = 60.0
+HEATUP_MIN_RISE: Final = 5.0
+# Samples further apart than this abort the warm-up being learned (seconds)
+HEATUP_MAX_SAMPLE_GAP: Final = 300.0
+# Status samples the current heating rate is fitted over
+HEATUP_SLOPE_WINDOW: Final = 15
+
+# Circuit breaker of an unreachable machine
+# Consecutive failed polls before only probing the machine
+BREAKER_FAILURE_THRESHOLD: Final = 3
+# Seconds
+BREAKER_MAX_BACKOFF: Final = 1800
+BREAKER_CLOSED: Final = "closed"
+BREAKER_OPEN: Final = "open"
+
+# Shot history
+SHOTS_DIRECTORY: Final = "shots"
+# Most shots downloaded when catching up on shots made while offline
+MAX_CATCH_UP_SHOTS: Final = 50
+SHOT_ARCHIVE_FILE: Final = "shots.db"
+# Shot exports go to <config>/gaggiuino/exports
+EXPORTS_DIRECTORY: Final = "exports"
+EXPORT_FORMAT_CSV: Final = "csv"
+EXPORT_FORMAT_JSON: Final = "json"
+EXPORT_FORMAT_PARQUET: Final = "parquet"
+EXPORT_FORMATS: Final = (EXPORT_FORMAT_CSV, EXPORT_FORMAT_JSON, EXPORT_FORMAT_PARQUET)
+# Shots loaded per archive query, and per Parquet row group
+EXPORT_CHUNK_SHOTS: Final = 50
+
+# Live status stream
+CONF_STREAMING: Final = "streaming"
+DEFAULT_STREAMING: Final = False
+
+# Recorder-friendly filtering of high-rate telemetry sensors
+CONF_PRESSURE_DEADBAND: Final = "pressure_deadband"
+CONF_WEIGHT_DEADBAND: Final = "weight_deadband"
+CONF_TEMPERATURE_DEADBAND: Final = "temperature_deadband"
+CONF_WATER_LEVEL_DEADBAND: Final = "water_level_deadband"
+CONF_MIN_WRITE_INTERVAL: Final = "min_write_interval"
+
+DEFAULT_PRESSURE_DEADBAND: Final = 0.05
+DEFAULT_WEIGHT_DEADBAND: Final = 0.1
+DEFAULT_TEMPERATURE_DEADBAND: Final = 0.1
+DEFAULT_WATER_LEVEL_DEADBAND: Final = 1
+# Seconds
+DEFAULT_MIN_WRITE_INTERVAL: Final = 1.0
+
+# Sensor key -> deadband option and default
+SENSOR_DEADBANDS: Final = {
+    "pressure": (CONF_PRESSURE_DEADBAND, DEFAULT_PRESSURE_DEADBAND),
+    "weight": (CONF_WEIGHT_DEADBAND, DEFAULT_WEIGHT_DEADBAND),
+    "temperature": (CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND),
+    "water_level": (CONF_WATER_LEVEL_DEADBAND, DEFAULT_WATER_LEVEL_DEADBAND),
+}
+
+# Machine lifecycle events fired on the Home Assistant bus
+EVENT_SHOT_STARTED: Final = f"{DOMAIN}_shot_started"
+EVENT_PREINFUSION_END: Final = f"{DOMAIN}_preinfusion_end"
+EVENT_SHOT_FINISHED: Final = f"{DOMAIN}_shot_finished"
+EVENT_STEAM_STARTED: Final = f"{DOMAIN}_steam_started"
+EVENT_STEAM_FINISHED: Final = f"{DOMAIN}_steam_finished"
+EVENT_HEATED_UP: Final = f"{DOMAIN}_heated_up"
+
+# Status samples the live shot flow and pressure slope are fitted over
+SHOT_METRICS_WINDOW: Final = 8
+
+# Settings groups written through the coalescing write queue
+SETTINGS_GROUP_BOILER: Final = "boiler"
+SETTINGS_GROUP_SYSTEM: Final = "system"
+SETTINGS_GROUP_LED: Final = "led"
+SETTINGS_GROUP_SCALES: Final = "scales"
+# Seconds field changes of one group are collected before they are written
+SETTINGS_WRITE_DEBOUNCE: Final = 0.3
+
+# Web UI route saving a profile; gaggiuino_api has no call for it
+PROFILE_SAVE_PATH: Final = "/profiles/save"
+# The route is not part of the documented API, so pushing profiles is opt-in
+CONF_PROFILE_PUSH: Final = "profile_push"
+DEFAULT_PROFILE_PUSH: Final = False
+
+# Fleet scheduler shared by all config entries, stored in hass.data[DOMAIN]
+DATA_FLEET: Final = "fleet"
+# Maximum concurrent requests across machines, a concurrency cap and not a rate limit
+FLEET_MAX_CONCURRENT_REQUESTS: Final = 8
+# Seconds kept between the polls of different machines, less for fast polls
+FLEET_STAGGER: Final = 1.0
+
+# Last known state, restored at startup
+SNAPSHOT_STORAGE_VERSION: Final = 1
+# Seconds between saves of the snapshot while polling
+SNAPSHOT_SAVE_DELAY: Final = 600
+# Entity attribute set while showing the restored snapshot
+ATTR_STALE: Final = "stale"
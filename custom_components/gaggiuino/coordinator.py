@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import asdict, dataclass, replace
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, Final
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from aiohttp import ClientConnectorError, ClientOSError, ServerDisconnectedError
 from gaggiuino_api import (
     GaggiuinoAPI,
     GaggiuinoBoilerSettings,
     GaggiuinoConnectionError,
     GaggiuinoConnectionTimeoutError,
+    GaggiuinoEndpointNotFoundError,
+    GaggiuinoError,
     GaggiuinoLedSettings,
     GaggiuinoProfile,
     GaggiuinoScalesSettings,
@@ -19,36 +27,160 @@ from gaggiuino_api import (
     GaggiuinoSystemSettings,
     GaggiuinoVersions,
 )
-from homeassistant.const import CONF_URL
+from homeassistant.const import CONF_URL, Platform
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .archive import GaggiuinoShotArchive
+from .breaker import CircuitBreaker
+from .common import get_profile_display_name
+from .const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_OFFLINE_SCAN_INTERVAL,
+    CONF_SHOT_SCAN_INTERVAL,
+    CONF_STREAMING,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_OFFLINE_SCAN_INTERVAL,
+    DEFAULT_SHOT_SCAN_INTERVAL,
+    DEFAULT_STREAMING,
+    DOMAIN,
+    ENDPOINT_FIRMWARE_PROGRESS,
+    ENDPOINT_HEALTH,
+    ENDPOINT_LATEST_SHOT_ID,
+    ENDPOINT_PROFILES,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+    ENDPOINT_TIERS,
+    EVENT_HEATED_UP,
+    EVENT_PREINFUSION_END,
+    EVENT_SHOT_FINISHED,
+    EVENT_STEAM_FINISHED,
+    EVENT_STEAM_STARTED,
+    FIRMWARE_STATUS_IN_PROGRESS,
+    MAX_CATCH_UP_SHOTS,
+    MIN_UPDATE_INTERVAL,
+    PROFILE_SAVE_PATH,
+    SETTINGS_GROUP_BOILER,
+    SETTINGS_GROUP_LED,
+    SETTINGS_GROUP_SCALES,
+    SETTINGS_GROUP_SYSTEM,
+    SETTINGS_WRITE_DEBOUNCE,
+    SHOT_ARCHIVE_FILE,
+    SHOTS_DIRECTORY,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    TIER_CONFIG,
+    TIER_FIRMWARE,
+    TIER_LIVE,
+    TIER_SCAN_INTERVALS,
+    TIER_STATE,
+    WARMUP_SCAN_INTERVAL,
+    WARMUP_TEMPERATURE_BAND,
+)
+from .data import GaggiuinoData
+from .heatup import GaggiuinoHeatUpModel
+from .live import ShotTracker
+from .shots import GaggiuinoShotStore, ShotSummary, StoredShot
+from .statistics import async_import_statistics, hour_start, shot_statistics
+from .stats import PollStats
+from .stream import GaggiuinoStatusStream
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .fleet import GaggiuinoFleet
+
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_INTERVAL: Final = timedelta(seconds=30)
 
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store of the last known state of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry.entry_id}")
+
+
+@dataclass
+class _PendingSettingsWrite:
+    """Field changes of one settings group waiting to be written."""
+
+    fields: dict[str, Any]
+    # Values to restore if the write fails
+    previous: Any
+    # Locally applied values, replaced by any poll in the meantime
+    optimistic: Any
+    done: asyncio.Future[bool]
+    cancel_timer: CALLBACK_TYPE
 
-class GaggiuinoDataUpdateCoordinator(DataUpdateCoordinator):
+
+class GaggiuinoDataUpdateCoordinator(DataUpdateCoordinator[GaggiuinoData]):
     """Class to manage fetching Gaggiuino data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        fleet: GaggiuinoFleet | None = None,
+    ) -> None:
+        """
+        Initialize.
+
+        With a fleet, the fleet schedules the polls and provides the HTTP session
+        and a cap on concurrent requests. Without one, the coordinator polls on its own.
+        """
+        tier_intervals = {
+            tier: float(entry.options.get(conf, default))
+            for tier, (conf, default) in TIER_SCAN_INTERVALS.items()
+        }
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=UPDATE_INTERVAL,
+            update_interval=(
+                None
+                if fleet is not None
+                else timedelta(seconds=tier_intervals[TIER_LIVE])
+            ),
+            # Skip notifying entities when a cycle changed nothing
+            always_update=False,
+        )
+        self._fleet = fleet
+        self._tier_intervals: dict[str, float] = tier_intervals
+        self._shot_interval: float = float(
+            entry.options.get(CONF_SHOT_SCAN_INTERVAL, DEFAULT_SHOT_SCAN_INTERVAL)
+        )
+        self._offline_interval: float = float(
+            entry.options.get(CONF_OFFLINE_SCAN_INTERVAL, DEFAULT_OFFLINE_SCAN_INTERVAL)
+        )
+        self.breaker = CircuitBreaker(self._offline_interval)
+        # Monotonic time at which each tier is next due; missing tiers are due now
+        self._tier_next_due: dict[str, float] = {}
+        # Long-lived session on Home Assistant's shared keep-alive connection pool
+        self._session = (
+            fleet.session if fleet is not None else async_create_clientsession(hass)
+        )
+        self.api: GaggiuinoAPI = GaggiuinoAPI(
+            base_url=entry.data[CONF_URL], session=self._session
         )
-        self.api: GaggiuinoAPI = GaggiuinoAPI(base_url=entry.data[CONF_URL])
         self.entry: ConfigEntry = entry
         self._status: GaggiuinoStatus | None = None
         self._profile: GaggiuinoProfile | None = None
         self._profiles: list[GaggiuinoProfile] | None = None
+        # Content hash of the cached profiles, and indexes rebuilt when it changes
+        self._profiles_fingerprint: int | None = None
+        self._profile_names: dict[int, str] = {}
+        # Global stop weight of each profile
+        self._profile_targets: dict[int, float] = {}
+        self._profile_options: dict[str, int] = {}
+        # Fetch profiles on the next cycle, outside their tier schedule
+        self._profiles_stale: bool = False
+        # Status profile last found missing from the cache
+        self._profile_miss: tuple[int, str] | None = None
         self.healthy: bool = False
         self._latest_shot_id: int | None = None
         self.gaggiuino_online: bool = False
@@ -60,61 +192,681 @@ class GaggiuinoDataUpdateCoordinator(DataUpdateCoordinator):
         self._scales_settings: GaggiuinoScalesSettings | None = None
         self._versions: GaggiuinoVersions | None = None
         self._firmware_progress: dict[str, Any] | None = None
+        # Live status stream
+        self._streaming: bool = entry.options.get(CONF_STREAMING, DEFAULT_STREAMING)
+        self._stream: GaggiuinoStatusStream | None = None
+        # Shot history
+        self.shot_store = GaggiuinoShotStore(
+            Path(hass.config.path(DOMAIN, entry.entry_id, SHOTS_DIRECTORY))
+        )
+        self.shot_archive = GaggiuinoShotArchive(
+            Path(hass.config.path(DOMAIN, entry.entry_id, SHOT_ARCHIVE_FILE))
+        )
+        self._stored_shot_id: int | None = None
+        self._last_shot_summary: ShotSummary | None = None
+        self._ingest_task: asyncio.Task | None = None
+        # Endpoint and poll cycle timings
+        self.stats = PollStats()
+        self.shot_tracker = ShotTracker()
+        self.heatup = GaggiuinoHeatUpModel(hass, entry.entry_id)
+        # Last good state, shown until the first poll after a restart
+        self._snapshot_store = snapshot_store(hass, entry)
+        self._snapshot_save_pending: bool = False
+        # True while the data comes from the snapshot rather than the machine
+        self.restored: bool = False
+        # Entity platforms set up for this entry
+        self.platforms: list[Platform] = []
+        # Caps the number of requests in flight to the machine at once
+        self._request_semaphore = asyncio.Semaphore(
+            entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+        )
+        # Settings group -> model and API call writing it
+        self._settings_writers: dict[
+            str, tuple[type, Callable[[Any], Awaitable[bool]]]
+        ] = {
+            SETTINGS_GROUP_BOILER: (
+                GaggiuinoBoilerSettings,
+                self.api.update_boiler_settings,
+            ),
+            SETTINGS_GROUP_SYSTEM: (
+                GaggiuinoSystemSettings,
+                self.api.update_system_settings,
+            ),
+            SETTINGS_GROUP_LED: (GaggiuinoLedSettings, self.api.update_led_settings),
+            SETTINGS_GROUP_SCALES: (
+                GaggiuinoScalesSettings,
+                self.api.update_scales_settings,
+            ),
+        }
+        self._pending_settings_writes: dict[str, _PendingSettingsWrite] = {}
+        # Keeps the writes of one group in order
+        self._settings_write_locks: dict[str, asyncio.Lock] = {
+            group: asyncio.Lock() for group in self._settings_writers
+        }
 
-    async def _async_update_data(self) -> dict[str, Any] | None:
-        """Update data via library."""
-        _LOGGER.debug("Gaggiuino _async_update_data")
+    def _endpoint_fetchers(
+        self, tiers: set[str]
+    ) -> dict[str, Callable[[], Awaitable[Any]]]:
+        """Return the API calls of the given tiers, keyed by endpoint."""
+        fetchers = {
+            ENDPOINT_STATUS: self.api.get_status,
+            ENDPOINT_PROFILES: self.api.get_profiles,
+            ENDPOINT_HEALTH: self.api.healthy,
+            ENDPOINT_LATEST_SHOT_ID: self.api.get_latest_shot_id,
+            ENDPOINT_SETTINGS: self.api.get_settings,
+            ENDPOINT_FIRMWARE_PROGRESS: self.api.get_firmware_progress,
+        }
+        return {
+            endpoint: fetch
+            for endpoint, fetch in fetchers.items()
+            if ENDPOINT_TIERS[endpoint] in tiers
+            or (endpoint == ENDPOINT_PROFILES and self._profiles_stale)
+        }
+
+    @property
+    def _firmware_in_progress(self) -> bool:
+        """Return True while a firmware update is running."""
+        return (
+            self._firmware_progress is not None
+            and self._firmware_progress.get("status") == FIRMWARE_STATUS_IN_PROGRESS
+        )
+
+    def _tier_interval(self, tier: str) -> float:
+        """Return the refresh interval of a tier in seconds."""
+        if tier == TIER_FIRMWARE and self._firmware_in_progress:
+            # Follow a running update closely
+            return self._tier_intervals[TIER_STATE]
+        return self._tier_intervals[tier]
+
+    def _due_tiers(self, now: float) -> set[str]:
+        """Return the tiers to fetch this cycle. The live tier is always due."""
+        return {TIER_LIVE} | {
+            tier
+            for tier in self._tier_intervals
+            if self._tier_next_due.get(tier, now) <= now
+        }
+
+    def _schedule_tiers(self, tiers: set[str], now: float) -> None:
+        """Schedule the next refresh of the given tiers."""
+        for tier in tiers:
+            self._tier_next_due[tier] = now + self._tier_interval(tier)
+
+    @property
+    def shot_active(self) -> bool:
+        """Return True while brewing or steaming."""
+        return self._status is not None and (
+            self._status.brewSwitchState or self._status.steamSwitchState
+        )
+
+    @property
+    def warming_up(self) -> bool:
+        """Return True while the boiler is still heating towards its target."""
+        return (
+            self._status is not None
+            and self._status.targetTemperature - self._status.temperature
+            > WARMUP_TEMPERATURE_BAND
+        )
+
+    def _live_interval(self) -> float:
+        """Return the live poll interval fitting the current machine state."""
+        if self.stream_connected:
+            # Status is pushed; polling only drives the slower tiers
+            return max(
+                self._tier_intervals[TIER_LIVE], self._tier_intervals[TIER_STATE]
+            )
+        if not self.gaggiuino_online:
+            if self.breaker.retry_in is not None:
+                return self.breaker.retry_in
+            return self._offline_interval
+        if self.shot_active:
+            return self._shot_interval
+        if self.warming_up:
+            return min(WARMUP_SCAN_INTERVAL, self._tier_intervals[TIER_LIVE])
+        return self._tier_intervals[TIER_LIVE]
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the seconds until the next poll should start."""
+        return self._live_interval()
+
+    def _adapt_update_interval(self) -> None:
+        """Apply the live poll interval to the next scheduled refresh."""
+        if self._fleet is not None:
+            self._fleet.async_reschedule(self)
+            return
+        interval = timedelta(seconds=max(self._live_interval(), MIN_UPDATE_INTERVAL))
+        if interval != self.update_interval:
+            _LOGGER.debug("Gaggiuino live poll interval -> %s", interval)
+            self.update_interval = interval
+
+    @property
+    def stream_connected(self) -> bool:
+        """Return True while the live status stream is connected."""
+        return self._stream is not None and self._stream.connected
+
+    @callback
+    def async_start_stream(self) -> None:
+        """Start the live status stream if enabled in the options."""
+        if not self._streaming or self._stream is not None:
+            return
+
+        self._stream = GaggiuinoStatusStream(
+            self._session,
+            self.api.base_url,
+            self._handle_stream_status,
+            self._handle_stream_connection,
+        )
+        self.entry.async_create_background_task(
+            self.hass,
+            self._stream.run(),
+            f"{DOMAIN} status stream {self.entry.entry_id}",
+        )
+
+    @callback
+    def _handle_stream_status(self, fields: dict[str, Any]) -> None:
+        """Merge a pushed status delta into the current status."""
+        if self._status is None:
+            # Wait for a full status from the poll
+            return
+
+        status = replace(self._status, **fields)
+        if status == self._status:
+            return
+
+        previous, self._status = self._status, status
+        self.gaggiuino_online = True
+        self.breaker.record_success()
+        self._track_status(previous)
+        # Not async_set_updated_data: it would postpone the tier poll on every push
+        self._async_publish()
+
+    @callback
+    def _handle_stream_connection(self, connected: bool) -> None:
+        """Switch between push and polling when the stream goes up or down."""
+        _LOGGER.debug("Gaggiuino stream connected: %s", connected)
+        self._adapt_update_interval()
+        if not connected and not self._shutdown_requested:
+            # Poll right away until the stream is back
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def mark_tier_due(self, tier: str) -> None:
+        """Fetch the given tier on the next poll cycle."""
+        self._tier_next_due.pop(tier, None)
+
+    async def _get(self, request: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Call a read-only API, retrying once on a stale keep-alive connection."""
         try:
-            async with self.api:
-                self._status = await self.api.get_status()
-                self._profiles = await self.api.get_profiles()
-                self._profile = self.api.profile
-                self.healthy = await self.api.healthy()
-                latest_shot_id_result = await self.api.get_latest_shot_id()
-                if latest_shot_id_result is not None:
-                    self._latest_shot_id = latest_shot_id_result.lastShotId
-                # Fetch settings data
-                self._settings = await self.api.get_settings()
-                if self._settings is not None:
-                    self._boiler_settings = self._settings.boiler
-                    self._system_settings = self._settings.system
-                    self._led_settings = self._settings.led
-                    self._scales_settings = self._settings.scales
-                    self._versions = self._settings.versions
-                # Fetch firmware progress
-                self._firmware_progress = await self.api.get_firmware_progress()
-                self.gaggiuino_online = True
-        except (GaggiuinoConnectionTimeoutError, GaggiuinoConnectionError) as err:
-            _LOGGER.debug("Gaggiuino _async_update_data %s", type(err))
+            return await request(*args)
+        except GaggiuinoConnectionError as err:
+            # The machine closes idle keep-alive connections. The pool discards
+            # the broken one, so the retry goes out on a fresh connection. An
+            # offline machine has no pooled connections and is not retried.
+            if not (self.gaggiuino_online and _stale_connection(err)):
+                raise
+            _LOGGER.debug("Gaggiuino reconnecting after %s", type(err.__cause__))
+            return await request(*args)
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Wait for a free request slot of this machine and of the fleet."""
+        fleet_slot = (
+            self._fleet.request_slots if self._fleet is not None else nullcontext()
+        )
+        async with self._request_semaphore, fleet_slot:
+            yield
+
+    async def _fetch_endpoint(
+        self, endpoint: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Call a single endpoint within the concurrency caps, timing the call."""
+        stats = self.stats.endpoint(endpoint)
+        async with self._request_slot():
+            started = time.monotonic()
+            try:
+                result = await self._get(fetch)
+            except Exception as err:
+                stats.record((time.monotonic() - started) * 1000, err)
+                raise
+            stats.record((time.monotonic() - started) * 1000)
+            return result
+
+    async def _fetch_endpoints(
+        self, fetchers: dict[str, Callable[[], Awaitable[Any]]]
+    ) -> dict[str, Any]:
+        """
+        Fetch endpoints concurrently.
+
+        Each value of the result is either the endpoint payload or the exception
+        raised while fetching it, so one failing endpoint does not discard the rest.
+        """
+        results = await asyncio.gather(
+            *(
+                self._fetch_endpoint(endpoint, fetch)
+                for endpoint, fetch in fetchers.items()
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(fetchers, results, strict=True))
+
+    def _apply_endpoint_result(self, endpoint: str, result: Any) -> None:
+        """Store a successfully fetched endpoint payload."""
+        if endpoint == ENDPOINT_STATUS:
+            previous, self._status = self._status, result
+            self._profile = self.api.profile
+            self._check_profiles_cache()
+            self._track_status(previous)
+        elif endpoint == ENDPOINT_PROFILES:
+            self._set_profiles(result)
+        elif endpoint == ENDPOINT_HEALTH:
+            self.healthy = result
+        elif endpoint == ENDPOINT_LATEST_SHOT_ID:
+            if result is not None:
+                self._latest_shot_id = result.lastShotId
+                self._schedule_shot_ingest()
+        elif endpoint == ENDPOINT_SETTINGS:
+            self._settings = result
+            if self._settings is not None:
+                self._boiler_settings = self._settings.boiler
+                self._system_settings = self._settings.system
+                self._led_settings = self._settings.led
+                self._scales_settings = self._settings.scales
+                self._versions = self._settings.versions
+        elif endpoint == ENDPOINT_FIRMWARE_PROGRESS:
+            was_in_progress = self._firmware_in_progress
+            self._firmware_progress = result
+            if was_in_progress and not self._firmware_in_progress:
+                # Versions and settings may have changed with the new firmware
+                self.mark_tier_due(TIER_CONFIG)
+
+    def _track_status(self, previous: GaggiuinoStatus | None) -> None:
+        """Feed a new status to the live shot metrics and fire lifecycle events."""
+        status = self._status
+        if status is None:
+            return
+        now = time.monotonic()
+        self.heatup.update(status, now)
+        for event in self.shot_tracker.update(
+            status, now, self._profile_targets.get(status.profileId)
+        ):
+            self._fire_event(event)
+
+        if previous is None:
+            return
+        if status.steamSwitchState != previous.steamSwitchState:
+            self._fire_event(
+                EVENT_STEAM_STARTED if status.steamSwitchState else EVENT_STEAM_FINISHED
+            )
+        if (
+            status.targetTemperature == previous.targetTemperature
+            and previous.targetTemperature - previous.temperature
+            > WARMUP_TEMPERATURE_BAND
+            and status.targetTemperature - status.temperature <= WARMUP_TEMPERATURE_BAND
+        ):
+            self._fire_event(EVENT_HEATED_UP)
+
+    def _fire_event(self, event: str) -> None:
+        """Fire a machine lifecycle event on the Home Assistant bus."""
+        status = self._status
+        tracker = self.shot_tracker
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self.entry.entry_id)}
+        )
+        data: dict[str, Any] = {
+            "entry_id": self.entry.entry_id,
+            "device_id": device.id if device is not None else None,
+            "profile_id": status.profileId if status is not None else None,
+            "profile_name": status.profileName if status is not None else None,
+        }
+        if event == EVENT_HEATED_UP and status is not None:
+            data["temperature"] = status.temperature
+            data["target_temperature"] = status.targetTemperature
+        elif event in (EVENT_PREINFUSION_END, EVENT_SHOT_FINISHED):
+            data["shot_time"] = tracker.shot_time
+            data["preinfusion_time"] = tracker.preinfusion_time
+            data["peak_pressure"] = tracker.peak_pressure
+            data["weight"] = tracker.weight
+            data["target_weight"] = tracker.target_weight
+        _LOGGER.debug("Gaggiuino %s: %s", event, data)
+        self.hass.bus.async_fire(event, data)
+
+    def _set_profiles(self, profiles: list[GaggiuinoProfile] | None) -> None:
+        """Cache fetched profiles, keeping the cached ones if nothing changed."""
+        self._profiles_stale = False
+        fingerprint = None if profiles is None else hash(repr(profiles))
+        if fingerprint == self._profiles_fingerprint:
+            return
+
+        self._profiles = profiles
+        self._profiles_fingerprint = fingerprint
+        self._profile_names = {profile.id: profile.name for profile in profiles or ()}
+        self._profile_targets = {
+            profile.id: float(weight)
+            for profile in profiles or ()
+            if (weight := (profile.globalStopConditions or {}).get("weight"))
+        }
+        self._profile_options = {
+            get_profile_display_name(profile): profile.id for profile in profiles or ()
+        }
+
+    def _check_profiles_cache(self) -> None:
+        """Refetch profiles when the status names a profile the cache lacks."""
+        if self._status is None or self._profiles is None:
+            return
+        selected = (self._status.profileId, self._status.profileName)
+        if self._profile_names.get(selected[0]) == selected[1]:
+            self._profile_miss = None
+        elif selected != self._profile_miss:
+            # Refetch once per unknown profile, not on every cycle
+            self._profile_miss = selected
+            self._profiles_stale = True
+
+    def _schedule_shot_ingest(self) -> None:
+        """Download new shots in the background once the latest shot ID advances."""
+        if self._latest_shot_id is None or (
+            self._stored_shot_id is not None
+            and self._latest_shot_id <= self._stored_shot_id
+        ):
+            return
+        if self._ingest_task is not None and not self._ingest_task.done():
+            return
+
+        self._ingest_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_ingest_shots(self._latest_shot_id),
+            f"{DOMAIN} shot ingest {self.entry.entry_id}",
+        )
+
+    async def _async_ingest_shots(self, latest_shot_id: int) -> None:
+        """Download and store every shot up to the given one not stored yet."""
+        if self._stored_shot_id is None:
+            (
+                self._stored_shot_id,
+                self._last_shot_summary,
+            ) = await self.hass.async_add_executor_job(self._load_shot_history)
+            self.async_update_listeners()
+
+        if self._stored_shot_id is None:
+            # Empty store: start with the latest shot instead of the whole history
+            first_shot_id = latest_shot_id
+        else:
+            # Catch up on shots made while Home Assistant was down
+            first_shot_id = max(
+                self._stored_shot_id + 1, latest_shot_id - MAX_CATCH_UP_SHOTS + 1
+            )
+
+        # Hours of the stored shots, whose statistics are imported in one batch
+        hours: set[int] = set()
+        for shot_id in range(first_shot_id, latest_shot_id + 1):
+            try:
+                async with self._request_slot():
+                    shot = await self._get(self.api.get_shot, shot_id)
+                stored = None if shot is None else StoredShot.from_api(shot)
+            except GaggiuinoEndpointNotFoundError:
+                stored = None
+            except GaggiuinoError as err:
+                # Retried once the next poll sees the latest shot ID again
+                _LOGGER.debug("Gaggiuino shot %s download failed: %s", shot_id, err)
+                break
+            except (TypeError, KeyError, ValueError) as err:
+                # Skipped, a malformed shot would hold back every later one
+                _LOGGER.warning("Gaggiuino shot %s is malformed: %s", shot_id, err)
+                stored = None
+
+            if stored is not None:
+                try:
+                    summary = await self.hass.async_add_executor_job(
+                        self._store_shot, stored
+                    )
+                except Exception:
+                    # Retried by the next poll, like a failed download
+                    _LOGGER.exception("Gaggiuino shot %s could not be stored", shot_id)
+                    break
+                self._last_shot_summary = summary
+                _LOGGER.debug("Gaggiuino stored shot %s", shot_id)
+                hours.add(hour_start(summary.timestamp))
+                self.async_update_listeners()
+            self._stored_shot_id = shot_id
+
+        await self._async_import_statistics(hours)
+
+    async def _async_import_statistics(self, hours: set[int]) -> None:
+        """Import the long-term statistics of the hours new shots were taken in."""
+        if not hours or "recorder" not in self.hass.config.components:
+            return
+        batches = await self.hass.async_add_executor_job(
+            shot_statistics,
+            self.shot_archive,
+            self.entry.entry_id,
+            self.entry.title,
+            hours,
+        )
+        async_import_statistics(self.hass, batches)
+
+    def _load_shot_history(self) -> tuple[int | None, ShotSummary | None]:
+        """Index stored shots and return the newest shot ID and summary."""
+        self.shot_archive.index_store(self.shot_store)
+        return self.shot_store.latest_shot_id(), self.shot_archive.latest()
+
+    def _store_shot(self, shot: StoredShot) -> ShotSummary:
+        """Store a shot and index its summary."""
+        self.shot_store.save(shot)
+        summary = ShotSummary.from_shot(shot)
+        self.shot_archive.add(summary)
+        return summary
+
+    def _reset_data(self) -> None:
+        """Forget all fetched data."""
+        self._status = None
+        self._profiles = None
+        self._profiles_fingerprint = None
+        self._profile_names = {}
+        self._profile_targets = {}
+        self._profile_options = {}
+        self._profiles_stale = False
+        self._profile_miss = None
+        self._profile = None
+        self._latest_shot_id = None
+        self._settings = None
+        self._boiler_settings = None
+        self._system_settings = None
+        self._led_settings = None
+        self._scales_settings = None
+        self._versions = None
+        self._firmware_progress = None
+        self.gaggiuino_online = False
+        self.healthy = False
+        self.restored = False
+        self._tier_next_due.clear()
+
+    async def _async_update_data(self) -> GaggiuinoData:
+        """Update data via library, timing the cycle."""
+        interval = self.poll_interval
+        started = time.monotonic()
+        error: Exception | None = None
+        try:
+            return await self._async_poll()
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            self.stats.cycle.record(elapsed * 1000, error)
+            if elapsed > interval:
+                self.stats.overruns += 1
+
+    async def _async_poll(self) -> GaggiuinoData:
+        """Fetch the due tiers and apply the results."""
+        _LOGGER.debug("Gaggiuino _async_update_data")
+        if self.breaker.is_open and not await self._async_probe():
+            self._adapt_update_interval()
+            return self._as_data()
+
+        now = time.monotonic()
+        due_tiers = self._due_tiers(now)
+        results = await self._fetch_endpoints(self._endpoint_fetchers(due_tiers))
+
+        # The status endpoint decides whether the machine is reachable at all
+        status = results.pop(ENDPOINT_STATUS)
+        if isinstance(
+            status, (GaggiuinoConnectionTimeoutError, GaggiuinoConnectionError)
+        ):
+            _LOGGER.debug("Gaggiuino _async_update_data %s", type(status))
             self.gaggiuino_online = False
+            self.breaker.record_failure()
+            # Refresh every tier once the machine is back
+            self._tier_next_due.clear()
+            self._adapt_update_interval()
             # this sets all entities to unknown
             # raise UpdateFailed(
             #     "GaggiuinoConnectionTimeoutError"
-            # ) from err
-        except Exception as err:
-            self._status = None
-            self._profiles = None
-            self._profile = None
-            self._latest_shot_id = None
-            self._settings = None
-            self._boiler_settings = None
-            self._system_settings = None
-            self._led_settings = None
-            self._scales_settings = None
-            self._versions = None
-            self._firmware_progress = None
-            self.gaggiuino_online = False
-            self.healthy = False
-            _LOGGER.debug("Error on _async_update_data: %s %s", type(err), err)
-            raise UpdateFailed(err) from err
+            # ) from status
+            return self._as_data()
+
+        if isinstance(status, Exception):
+            self._reset_data()
+            _LOGGER.debug("Error on _async_update_data: %s %s", type(status), status)
+            raise UpdateFailed(status) from status
+
+        # A tier with a failed fetch stays due and is retried next cycle
+        failed_tiers = {
+            ENDPOINT_TIERS[endpoint]
+            for endpoint, result in results.items()
+            if isinstance(result, Exception)
+            and not isinstance(result, GaggiuinoEndpointNotFoundError)
+        }
+        self._schedule_tiers(due_tiers - failed_tiers, now)
+        self._apply_endpoint_result(ENDPOINT_STATUS, status)
+        for endpoint, result in results.items():
+            if isinstance(result, Exception):
+                # Keep the previous value of this endpoint
+                _LOGGER.debug(
+                    "Gaggiuino %s fetch failed: %s %s", endpoint, type(result), result
+                )
+                if endpoint == ENDPOINT_HEALTH:
+                    self.healthy = False
+                continue
+
+            self._apply_endpoint_result(endpoint, result)
+
+        self.gaggiuino_online = True
+        self.restored = False
+        self.breaker.record_success()
+        self._schedule_snapshot_save()
+        self._adapt_update_interval()
+        return self._as_data()
 
+    async def _async_probe(self) -> bool:
+        """Return True if an unreachable machine answers its health endpoint."""
+        try:
+            await self._fetch_endpoint(ENDPOINT_HEALTH, self.api.healthy)
+        except (GaggiuinoConnectionTimeoutError, GaggiuinoConnectionError) as err:
+            _LOGGER.debug("Gaggiuino probe failed: %s", type(err))
+            self.breaker.record_failure()
+            return False
+        except GaggiuinoError as err:
+            # Any answer means the machine is reachable again
+            _LOGGER.debug("Gaggiuino probe answered with %s", type(err))
+        # The full poll that follows confirms it and closes the breaker
+        return True
+
+    @callback
+    def _async_publish(self) -> None:
+        """Pass changes made outside a poll cycle on to the entities."""
+        self.data = self._as_data()
+        self.async_update_listeners()
+
+    def _as_data(self) -> GaggiuinoData:
+        """Return the coordinator data."""
+        return GaggiuinoData(
+            status=self._status,
+            profile=self._profile,
+            profiles=self._profiles,
+            latest_shot_id=self._latest_shot_id,
+            online=self.gaggiuino_online,
+            healthy=self.healthy,
+            settings=self._settings,
+            boiler_settings=self._boiler_settings,
+            system_settings=self._system_settings,
+            led_settings=self._led_settings,
+            scales_settings=self._scales_settings,
+            firmware_progress=self._firmware_progress,
+            breaker=self.breaker.as_dict(),
+            restored=self.restored,
+        )
+
+    async def async_restore(self) -> bool:
+        """Restore the last saved state, returning False if there is none."""
+        if (snapshot := await self._snapshot_store.async_load()) is None:
+            return False
+
+        try:
+            status = snapshot.get("status")
+            profiles = snapshot.get("profiles")
+            settings = snapshot.get("settings")
+            self._status = None if status is None else GaggiuinoStatus.from_dict(status)
+            self._set_profiles(
+                None
+                if profiles is None
+                else [GaggiuinoProfile(**profile) for profile in profiles]
+            )
+            self._apply_endpoint_result(
+                ENDPOINT_SETTINGS,
+                None if settings is None else GaggiuinoSettings.from_dict(settings),
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring the saved Gaggiuino state: %s", err)
+            self._reset_data()
+            return False
+
+        if self._status is not None:
+            self._profile = GaggiuinoProfile(
+                id=self._status.profileId,
+                name=self._status.profileName,
+                selected=True,
+            )
+        self._latest_shot_id = snapshot.get("latest_shot_id")
+        self.restored = True
+        self.data = self._as_data()
+        return True
+
+    def _schedule_snapshot_save(self) -> None:
+        """Save the current state within SNAPSHOT_SAVE_DELAY seconds."""
+        if self._snapshot_save_pending:
+            return
+        self._snapshot_save_pending = True
+        self._snapshot_store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the state to save, called when the save is due."""
+        self._snapshot_save_pending = False
         return {
-            "status": self._status,
-            "profile": self._profile,
-            "profiles": self._profiles,
+            "status": None if self._status is None else asdict(self._status),
+            "profiles": (
+                None
+                if self._profiles is None
+                else [asdict(profile) for profile in self._profiles]
+            ),
+            "settings": None if self._settings is None else asdict(self._settings),
             "latest_shot_id": self._latest_shot_id,
         }
 
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and ignore new runs."""
+        # Write queued settings changes instead of dropping them
+        for group, pending in list(self._pending_settings_writes.items()):
+            pending.cancel_timer()
+            await self._async_flush_settings(group)
+        if self._snapshot_save_pending:
+            await self._snapshot_store.async_save(self._snapshot_data())
+        await super().async_shutdown()
+        if self._fleet is None:
+            # Release the session, leaving the shared connection pool open
+            self._session.detach()
+        await self.hass.async_add_executor_job(self.shot_archive.close)
+
     @property
     def status(self) -> GaggiuinoStatus | None:
         """Return the current status object."""
@@ -130,11 +882,31 @@ class GaggiuinoDataUpdateCoordinator(DataUpdateCoordinator):
         """Return the available profiles object."""
         return self._profiles
 
+    @property
+    def cycle_latency(self) -> float | None:
+        """Return the milliseconds the last poll cycle took."""
+        return self.stats.cycle.last
+
+    @property
+    def profile_options(self) -> dict[str, int]:
+        """Return the profile IDs keyed by display name."""
+        return self._profile_options
+
     @property
     def latest_shot_id(self) -> list[GaggiuinoProfile] | None:
         """Return the latest shot id."""
         return self._latest_shot_id
 
+    @property
+    def stored_shot_id(self) -> int | None:
+        """Return the ID of the newest shot in the local shot history."""
+        return self._stored_shot_id
+
+    @property
+    def last_shot_summary(self) -> ShotSummary | None:
+        """Return the summary of the newest stored shot."""
+        return self._last_shot_summary
+
     @property
     def boiler_settings(self) -> GaggiuinoBoilerSettings | None:
         """Return the boiler settings."""
@@ -178,82 +950,201 @@ class GaggiuinoDataUpdateCoordinator(DataUpdateCoordinator):
     async def select_profile(self, profile: GaggiuinoProfile | int) -> None:
         """Select a new profile."""
         try:
-            async with self.api:
-                if await self.api.select_profile(profile):
-                    self._profile = self.api.profile
-                    self.data["profile"] = self._profile
+            async with self._request_slot():
+                selected = await self.api.select_profile(profile)
         except GaggiuinoConnectionTimeoutError:
             _LOGGER.exception("Timeout setting profile")
             return
         except Exception as err:
             _LOGGER.exception("Exception while selecting a profile")
             raise UpdateFailed(err) from err
+        if selected:
+            self._profile = self.api.profile
+            self._async_publish()
+
+    async def async_fetch_profiles(self) -> list[GaggiuinoProfile]:
+        """Download every profile now, outside the poll schedule."""
+        async with self._request_slot():
+            profiles = await self._get(self.api.get_profiles)
+        self._set_profiles(profiles)
+        self._async_publish()
+        return profiles or []
+
+    async def async_save_profile(
+        self, recipe: dict[str, Any], profile_id: int | None = None
+    ) -> bool:
+        """
+        Save a profile on the machine.
+
+        The profile with the given ID is replaced; without an ID the profile is
+        added. gaggiuino_api has no call for this, so the request is sent to the
+        route the web UI profile editor uses.
+        """
+        payload = recipe if profile_id is None else {**recipe, "id": profile_id}
+        async with self._request_slot():
+            result = await self.api.post(
+                f"{self.api.api_base}{PROFILE_SAVE_PATH}", json_data=payload
+            )
+        # Pick up the saved profile and any ID the machine gave it
+        self._profiles_stale = True
+        return result
 
     async def health_ok(self) -> bool:
         """Return health ok boolean."""
         try:
-            async with self.api:
-                return await self.api.healthy()
+            return await self._get(self.api.healthy)
         except Exception as err:
             _LOGGER.debug("Exception while checking health: %s", type(err))
             return False
 
+    async def async_update_settings_fields(
+        self, group: str, fields: dict[str, Any]
+    ) -> bool:
+        """
+        Change fields of a settings group.
+
+        The change is applied locally at once and queued. Every change made to
+        the same group within SETTINGS_WRITE_DEBOUNCE seconds is merged into a
+        single write; all their callers get its result. A failed write restores
+        the previous values. A successful one is not read back; the next poll
+        cycle fetches the config tier to reconcile it.
+        """
+        model, _update = self._settings_writers[group]
+        attr = f"_{group}_settings"
+        if (current := getattr(self, attr)) is None:
+            msg = f"Gaggiuino {group} settings are not known yet"
+            raise UpdateFailed(msg)
+
+        if (pending := self._pending_settings_writes.get(group)) is None:
+            pending = _PendingSettingsWrite(
+                fields={},
+                previous=current,
+                optimistic=current,
+                done=self.hass.loop.create_future(),
+                cancel_timer=async_call_later(
+                    self.hass,
+                    SETTINGS_WRITE_DEBOUNCE,
+                    callback(lambda _now: self._schedule_settings_flush(group)),
+                ),
+            )
+            self._pending_settings_writes[group] = pending
+
+        pending.fields.update(fields)
+        pending.optimistic = model.from_dict(current.to_api_dict() | fields)
+        setattr(self, attr, pending.optimistic)
+        self._async_publish()
+
+        return await asyncio.shield(pending.done)
+
+    @callback
+    def _schedule_settings_flush(self, group: str) -> None:
+        """Write the queued changes of a settings group in the background."""
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_flush_settings(group),
+            f"{DOMAIN} {group} settings write {self.entry.entry_id}",
+        )
+
+    async def _async_flush_settings(self, group: str) -> None:
+        """Send the queued changes of a settings group in one request."""
+        if (pending := self._pending_settings_writes.pop(group, None)) is None:
+            return
+        _model, update = self._settings_writers[group]
+        attr = f"_{group}_settings"
+
+        async with self._settings_write_locks[group]:
+            try:
+                if (current := getattr(self, attr)) is None:
+                    msg = f"Gaggiuino {group} settings were reset before the write"
+                    raise UpdateFailed(msg)
+                # Start from the latest known values, a poll may have refreshed them
+                payload = current.to_api_dict() | pending.fields
+                async with self._request_slot():
+                    result = await update(payload)
+            except Exception as err:
+                self._rollback_settings(group, pending)
+                _LOGGER.exception("Exception while updating %s settings", group)
+                pending.done.set_exception(UpdateFailed(err))
+                # Already logged, do not report it again if nobody awaits it
+                pending.done.exception()
+                return
+
+        if result:
+            self.mark_tier_due(TIER_CONFIG)
+        else:
+            _LOGGER.warning("Gaggiuino rejected the %s settings", group)
+            self._rollback_settings(group, pending)
+        pending.done.set_result(result)
+
+    @callback
+    def _rollback_settings(self, group: str, pending: _PendingSettingsWrite) -> None:
+        """
+        Undo the fields of a failed write.
+
+        A newer change queued on top of the failed one keeps its own fields, but
+        drops the failed ones so they are not sent with it. Values a poll fetched
+        in the meantime are kept as they are.
+        """
+        model, _update = self._settings_writers[group]
+        attr = f"_{group}_settings"
+        current = getattr(self, attr)
+        if current is pending.optimistic:
+            setattr(self, attr, pending.previous)
+        elif (
+            newer := self._pending_settings_writes.get(group)
+        ) is not None and current is newer.optimistic:
+            previous = pending.previous.to_api_dict()
+            failed = {field: previous[field] for field in pending.fields}
+            newer.previous = model.from_dict(newer.previous.to_api_dict() | failed)
+            newer.optimistic = model.from_dict(
+                current.to_api_dict() | failed | newer.fields
+            )
+            setattr(self, attr, newer.optimistic)
+        else:
+            return
+        self._async_publish()
+
     async def update_boiler_settings(
         self, settings: GaggiuinoBoilerSettings | dict[str, Any]
     ) -> bool:
         """Update boiler settings."""
-        try:
-            async with self.api:
-                result = await self.api.update_boiler_settings(settings)
-                if result:
-                    self._boiler_settings = await self.api.get_boiler_settings()
-                    self.async_update_listeners()
-                return result
-        except Exception as err:
-            _LOGGER.exception("Exception while updating boiler settings")
-            raise UpdateFailed(err) from err
+        return await self.async_update_settings_fields(
+            SETTINGS_GROUP_BOILER, _settings_fields(settings)
+        )
 
     async def update_system_settings(
         self, settings: GaggiuinoSystemSettings | dict[str, Any]
     ) -> bool:
         """Update system settings."""
-        try:
-            async with self.api:
-                result = await self.api.update_system_settings(settings)
-                if result:
-                    self._system_settings = await self.api.get_system_settings()
-                    self.async_update_listeners()
-                return result
-        except Exception as err:
-            _LOGGER.exception("Exception while updating system settings")
-            raise UpdateFailed(err) from err
+        return await self.async_update_settings_fields(
+            SETTINGS_GROUP_SYSTEM, _settings_fields(settings)
+        )
 
     async def update_led_settings(
         self, settings: GaggiuinoLedSettings | dict[str, Any]
     ) -> bool:
         """Update LED settings."""
-        try:
-            async with self.api:
-                result = await self.api.update_led_settings(settings)
-                if result:
-                    self._led_settings = await self.api.get_led_settings()
-                    self.async_update_listeners()
-                return result
-        except Exception as err:
-            _LOGGER.exception("Exception while updating LED settings")
-            raise UpdateFailed(err) from err
+        return await self.async_update_settings_fields(
+            SETTINGS_GROUP_LED, _settings_fields(settings)
+        )
 
     async def update_scales_settings(
         self, settings: GaggiuinoScalesSettings | dict[str, Any]
     ) -> bool:
         """Update scales settings."""
-        try:
-            async with self.api:
-                result = await self.api.update_scales_settings(settings)
-                if result:
-                    self._scales_settings = await self.api.get_scales_settings()
-                    self.async_update_listeners()
-                return result
-        except Exception as err:
-            _LOGGER.exception("Exception while updating scales settings")
-            raise UpdateFailed(err) from err
+        return await self.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, _settings_fields(settings)
+        )
+
+
+def _settings_fields(settings: Any) -> dict[str, Any]:
+    """Return the API fields of a settings object or dict."""
+    return settings if isinstance(settings, dict) else settings.to_api_dict()
+
+
+def _stale_connection(err: GaggiuinoConnectionError) -> bool:
+    """Return True if the machine closed a pooled connection before answering."""
+    cause = err.__cause__
+    return isinstance(cause, (ServerDisconnectedError, ClientOSError)) and (
+        not isinstance(cause, ClientConnectorError)
+    )
@@ -0,0 +1,41 @@
+"""Coordinator data for Gaggiuino integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gaggiuino_api import (
+        GaggiuinoBoilerSettings,
+        GaggiuinoLedSettings,
+        GaggiuinoProfile,
+        GaggiuinoScalesSettings,
+        GaggiuinoSettings,
+        GaggiuinoStatus,
+        GaggiuinoSystemSettings,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class GaggiuinoData:
+    """
+    Everything entities read, as published by one poll cycle.
+
+    Comparing it with the previous data tells whether a cycle changed anything.
+    """
+
+    status: GaggiuinoStatus | None
+    profile: GaggiuinoProfile | None
+    profiles: list[GaggiuinoProfile] | None
+    latest_shot_id: int | None
+    online: bool
+    healthy: bool
+    settings: GaggiuinoSettings | None
+    boiler_settings: GaggiuinoBoilerSettings | None
+    system_settings: GaggiuinoSystemSettings | None
+    led_settings: GaggiuinoLedSettings | None
+    scales_settings: GaggiuinoScalesSettings | None
+    firmware_progress: dict[str, Any] | None
+    breaker: dict[str, Any]
+    restored: bool
@@ -0,0 +1,38 @@
+"""Diagnostics support for Gaggiuino integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_URL
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import GaggiuinoDataUpdateCoordinator
+
+TO_REDACT = {CONF_URL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GaggiuinoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "state": {
+            "online": coordinator.gaggiuino_online,
+            "healthy": coordinator.healthy,
+            "poll_interval": coordinator.poll_interval,
+            "streaming": coordinator.stream_connected,
+        },
+        "stats": coordinator.stats.as_dict(),
+    }
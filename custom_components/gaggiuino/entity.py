@@ -0,0 +1,54 @@
+"""Base entity for Gaggiuino integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE
+
+if TYPE_CHECKING:
+    from .coordinator import GaggiuinoDataUpdateCoordinator
+
+
+class GaggiuinoEntity(CoordinatorEntity["GaggiuinoDataUpdateCoordinator"]):
+    """Coordinator entity that only writes its state when it changed."""
+
+    def __init__(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._written_fingerprint: tuple[Any, ...] | None = None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the entity attributes, flagging a state restored from disk."""
+        attributes = self._entity_attributes()
+        if not self.coordinator.data.restored:
+            return attributes
+        return {**(attributes or {}), ATTR_STALE: True}
+
+    def _entity_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of this entity."""
+        return None
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return everything the written state of this entity is made of."""
+        return (
+            self.available,
+            self.state,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the entity's own values changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_fingerprint:
+            return
+
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()
@@ -0,0 +1,183 @@
+"""Streaming shot export for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+from importlib.util import find_spec
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final
+
+from .const import (
+    EXPORT_CHUNK_SHOTS,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_JSON,
+    EXPORT_FORMAT_PARQUET,
+)
+from .shots import DATAPOINT_SCALE, SHOT_CHANNELS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from .archive import GaggiuinoShotArchive
+    from .shots import GaggiuinoShotStore, StoredShot
+
+_LOGGER = logging.getLogger(__name__)
+
+# One row per datapoint, channels in real units
+EXPORT_COLUMNS: Final = (
+    "shot_id",
+    "timestamp",
+    "profile_id",
+    "profile_name",
+    *SHOT_CHANNELS,
+)
+
+
+def parquet_available() -> bool:
+    """Return True if pyarrow, which Parquet export needs, is installed."""
+    return find_spec("pyarrow") is not None
+
+
+def iter_shots(
+    archive: GaggiuinoShotArchive,
+    store: GaggiuinoShotStore,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+    profile_id: int | None = None,
+) -> Iterator[StoredShot]:
+    """Yield the stored shots of a range oldest first, loading one at a time."""
+    for summary in archive.iter_summaries(
+        start=start, end=end, profile_id=profile_id, chunk_size=EXPORT_CHUNK_SHOTS
+    ):
+        if (shot := store.load(summary.id)) is not None:
+            yield shot
+
+
+def iter_rows(shot: StoredShot) -> Iterator[tuple[Any, ...]]:
+    """Yield the datapoints of a shot as EXPORT_COLUMNS rows."""
+    channels = [shot.datapoints.get(name) for name in SHOT_CHANNELS]
+    length = max((len(values) for values in channels if values is not None), default=0)
+    prefix = (shot.id, shot.timestamp, shot.profile.get("id"), shot.profile.get("name"))
+    for index in range(length):
+        yield (
+            *prefix,
+            *(
+                values[index] / DATAPOINT_SCALE
+                if values is not None and index < len(values)
+                else None
+                for values in channels
+            ),
+        )
+
+
+def _write_csv(path: Path, shots: Iterable[StoredShot]) -> int:
+    count = 0
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_COLUMNS)
+        for shot in shots:
+            writer.writerows(iter_rows(shot))
+            count += 1
+    return count
+
+
+def _write_json(path: Path, shots: Iterable[StoredShot]) -> int:
+    """Write the shots as served by the machine, which Visualizer imports."""
+    count = 0
+    with path.open("w", encoding="utf-8") as file:
+        file.write("[")
+        for shot in shots:
+            if count:
+                file.write(",\n")
+            json.dump(
+                {
+                    "id": shot.id,
+                    "timestamp": shot.timestamp,
+                    "duration": shot.duration,
+                    "datapoints": {
+                        name: values.tolist()
+                        for name, values in shot.datapoints.items()
+                    },
+                    "profile": shot.profile,
+                },
+                file,
+                separators=(",", ":"),
+            )
+            count += 1
+        file.write("]\n")
+    return count
+
+
+def _write_parquet(path: Path, shots: Iterable[StoredShot]) -> int:
+    """Write one row group per EXPORT_CHUNK_SHOTS shots."""
+    # Optional and heavy, imported only when exporting
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("shot_id", pa.int32()),
+            ("timestamp", pa.int64()),
+            ("profile_id", pa.int32()),
+            ("profile_name", pa.string()),
+            *((name, pa.float32()) for name in SHOT_CHANNELS),
+        ]
+    )
+    count = 0
+    shots = iter(shots)
+    with pq.ParquetWriter(path, schema) as writer:
+        while chunk := list(islice(shots, EXPORT_CHUNK_SHOTS)):
+            rows = [row for shot in chunk for row in iter_rows(shot)]
+            columns = list(zip(*rows, strict=True)) or [()] * len(EXPORT_COLUMNS)
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(column, type=field.type)
+                        for column, field in zip(columns, schema, strict=True)
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(chunk)
+    return count
+
+
+_WRITERS: Final = {
+    EXPORT_FORMAT_CSV: _write_csv,
+    EXPORT_FORMAT_JSON: _write_json,
+    EXPORT_FORMAT_PARQUET: _write_parquet,
+}
+
+
+def export_shots(
+    archive: GaggiuinoShotArchive,
+    store: GaggiuinoShotStore,
+    path: Path,
+    export_format: str,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+    profile_id: int | None = None,
+) -> int:
+    """
+    Export a range of shots to a file. Return how many shots were exported.
+
+    Shots are streamed from the store one at a time, so memory use does not grow
+    with the range. The file only appears once complete. Does blocking I/O and
+    must run in an executor.
+    """
+    shots = iter_shots(archive, store, start=start, end=end, profile_id=profile_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.tmp")
+    try:
+        count = _WRITERS[export_format](partial, shots)
+    except Exception:
+        partial.unlink(missing_ok=True)
+        raise
+    partial.replace(path)
+    _LOGGER.debug("Gaggiuino exported %s shots to %s", count, path)
+    return count
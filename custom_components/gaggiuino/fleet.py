@@ -0,0 +1,156 @@
+"""Fleet scheduler for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .const import DOMAIN, FLEET_MAX_CONCURRENT_REQUESTS, FLEET_STAGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import GaggiuinoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GaggiuinoFleet:
+    """
+    Drives the polls of every Gaggiuino machine from one task.
+
+    Machines share one HTTP session and a cap on concurrent requests. Each machine is
+    polled at its own adaptive interval, and no two polls are scheduled within
+    FLEET_STAGGER seconds of each other, or less for machines polled faster.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_requests: int = FLEET_MAX_CONCURRENT_REQUESTS
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.session = async_create_clientsession(hass)
+        # Maximum concurrent requests across machines
+        self.request_slots = asyncio.Semaphore(max_requests)
+        # Config entries setting up with the fleet that it does not poll yet
+        self.pending_setups = 0
+        self._next_run: dict[GaggiuinoDataUpdateCoordinator, float] = {}
+        self._last_run: dict[GaggiuinoDataUpdateCoordinator, float] = {}
+        self._refreshing: dict[GaggiuinoDataUpdateCoordinator, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def machines(self) -> list[GaggiuinoDataUpdateCoordinator]:
+        """Return the coordinators driven by the fleet."""
+        return list(self._next_run)
+
+    @callback
+    def async_add(
+        self, coordinator: GaggiuinoDataUpdateCoordinator, *, poll_now: bool = False
+    ) -> None:
+        """Start polling a machine, right away or one poll interval from now."""
+        now = self.hass.loop.time()
+        self._last_run[coordinator] = now
+        self._next_run[coordinator] = self._staggered(
+            coordinator, now if poll_now else now + coordinator.poll_interval
+        )
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} fleet scheduler"
+            )
+        self._wake.set()
+
+    @callback
+    def async_remove(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
+        """Stop polling a machine."""
+        self._next_run.pop(coordinator, None)
+        self._last_run.pop(coordinator, None)
+        if (refresh := self._refreshing.pop(coordinator, None)) is not None:
+            refresh.cancel()
+        self._wake.set()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the scheduler once no machine is left."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        # Release the session, leaving the shared connection pool open
+        self.session.detach()
+
+    @callback
+    def async_reschedule(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
+        """Apply a changed poll interval of a machine."""
+        if coordinator not in self._next_run or coordinator in self._refreshing:
+            # A running poll is rescheduled once it is done
+            return
+        when = max(
+            self.hass.loop.time(),
+            self._last_run[coordinator] + coordinator.poll_interval,
+        )
+        if when != self._next_run[coordinator]:
+            self._next_run[coordinator] = self._staggered(coordinator, when)
+            self._wake.set()
+
+    def _staggered(
+        self, coordinator: GaggiuinoDataUpdateCoordinator, when: float
+    ) -> float:
+        """Return the first time from when that keeps clear of other polls."""
+        others = sorted(
+            next_run
+            for machine, next_run in self._next_run.items()
+            if machine is not coordinator
+        )
+        # Fit every machine into one interval, so shot-rate polls keep their rate
+        stagger = min(FLEET_STAGGER, coordinator.poll_interval / (len(others) + 1))
+        for other in others:
+            if abs(other - when) < stagger:
+                when = other + stagger
+        return when
+
+    async def _async_run(self) -> None:
+        """Start every poll that is due, then sleep until the next one."""
+        loop = self.hass.loop
+        while True:
+            self._wake.clear()
+            now = loop.time()
+            for coordinator, when in list(self._next_run.items()):
+                if when > now:
+                    continue
+                if coordinator in self._refreshing:
+                    _LOGGER.debug(
+                        "Gaggiuino %s poll still running, skipping a cycle",
+                        coordinator.entry.title,
+                    )
+                else:
+                    self._last_run[coordinator] = now
+                    self._refreshing[coordinator] = (
+                        self.hass.async_create_background_task(
+                            self._async_refresh(coordinator),
+                            f"{DOMAIN} fleet poll {coordinator.entry.entry_id}",
+                        )
+                    )
+                self._next_run[coordinator] = self._staggered(
+                    coordinator, now + coordinator.poll_interval
+                )
+
+            timeout = None
+            if self._next_run:
+                timeout = max(0.0, min(self._next_run.values()) - loop.time())
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    async def _async_refresh(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
+        """Poll one machine."""
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self._refreshing.pop(coordinator, None)
+            self.async_reschedule(coordinator)
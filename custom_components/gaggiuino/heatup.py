@@ -0,0 +1,143 @@
+"""Learned boiler warm-up model for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    HEATUP_LEARNING_RATE,
+    HEATUP_MAX_SAMPLE_GAP,
+    HEATUP_MIN_DURATION,
+    HEATUP_MIN_RISE,
+    HEATUP_SLOPE_WINDOW,
+    READY_MIN_TARGET_TEMPERATURE,
+    WARMUP_TEMPERATURE_BAND,
+)
+from .live import RunningSlope
+
+if TYPE_CHECKING:
+    from gaggiuino_api import GaggiuinoStatus
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION: Final = 1
+# Seconds a learned rate waits before it is saved
+SAVE_DELAY: Final = 10
+
+
+def heatup_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store of the warm-up model of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.heatup.{entry_id}")
+
+
+class GaggiuinoHeatUpModel:
+    """
+    Warm-up readiness and time to ready of one machine.
+
+    Each completed warm-up updates an exponentially weighted heating rate, which
+    is kept across restarts. While warming up, the time to ready is estimated
+    from that rate and the rate observed over the recent status samples.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+        self._store = heatup_store(hass, entry_id)
+        # Learned heating rate in degrees Celsius per second
+        self.rate: float | None = None
+        self.sessions = 0
+        self._slope = RunningSlope(HEATUP_SLOPE_WINDOW)
+        # Monotonic time, temperature and target at the start of the warm-up
+        self._start: tuple[float, float, float] | None = None
+        self._last_sample = 0.0
+        self.ready = False
+        # Seconds until ready, 0 once ready, None if unknown
+        self.eta: float | None = None
+
+    async def async_load(self) -> None:
+        """Load the learned rate from storage."""
+        if (data := await self._store.async_load()) is not None:
+            self.rate = data.get("rate")
+            self.sessions = data.get("sessions", 0)
+
+    def update(self, status: GaggiuinoStatus, now: float) -> None:
+        """Add a status sample taken at monotonic time now."""
+        target = status.targetTemperature
+        remaining = target - status.temperature - WARMUP_TEMPERATURE_BAND
+        self.ready = target >= READY_MIN_TARGET_TEMPERATURE and remaining <= 0
+        if self._start is not None and (
+            now - self._last_sample > HEATUP_MAX_SAMPLE_GAP or self._start[2] != target
+        ):
+            # The machine was off in between, or the target changed
+            self._abort()
+        self._last_sample = now
+
+        if self.ready:
+            if self._start is not None:
+                self._learn(now, status.temperature)
+            self.eta = 0
+            return
+        if target < READY_MIN_TARGET_TEMPERATURE:
+            self._abort()
+            self.eta = None
+            return
+
+        if self._start is None:
+            self._start = (now, status.temperature, target)
+        self._slope.add(now - self._start[0], status.temperature)
+        self.eta = self._estimate(remaining)
+
+    def _estimate(self, remaining: float) -> float | None:
+        """Return the seconds needed to heat up by remaining degrees."""
+        rates = [
+            rate
+            for rate in (self.rate, self._slope.slope)
+            if rate is not None and rate > 0
+        ]
+        if not rates:
+            return None
+        return round(remaining / (sum(rates) / len(rates)))
+
+    def _learn(self, now: float, temperature: float) -> None:
+        """Fold a completed warm-up into the learned rate."""
+        started, start_temperature, _target = self._start
+        self._abort()
+        duration = now - started
+        rise = temperature - start_temperature
+        if duration < HEATUP_MIN_DURATION or rise < HEATUP_MIN_RISE:
+            return
+
+        rate = rise / duration
+        self.rate = (
+            rate
+            if self.rate is None
+            else HEATUP_LEARNING_RATE * rate + (1 - HEATUP_LEARNING_RATE) * self.rate
+        )
+        self.sessions += 1
+        _LOGGER.debug(
+            "Gaggiuino warm-up of %.1f degrees took %.0f s, learned rate %.4f/s",
+            rise,
+            duration,
+            self.rate,
+        )
+        self._store.async_delay_save(self._stored_data, SAVE_DELAY)
+
+    def _abort(self) -> None:
+        """Forget the warm-up being observed."""
+        self._start = None
+        self._slope.clear()
+
+    def _stored_data(self) -> dict[str, Any]:
+        """Return the learned model to store."""
+        return {"rate": self.rate, "sessions": self.sessions}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model state as entity attributes."""
+        return {
+            "learned_rate": None if self.rate is None else round(self.rate, 4),
+            "learned_sessions": self.sessions,
+        }
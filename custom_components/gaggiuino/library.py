@@ -0,0 +1,135 @@
+"""Local profile library for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from gaggiuino_api import GaggiuinoProfile
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION: Final = 1
+STORAGE_KEY: Final = f"{DOMAIN}.profile_library"
+DATA_PROFILE_LIBRARY: Final = f"{DOMAIN}_profile_library"
+
+# Fields that identify a profile on one machine rather than describe the recipe
+MACHINE_FIELDS: Final = ("id", "selected")
+
+
+def profile_to_dict(profile: GaggiuinoProfile) -> dict[str, Any]:
+    """Return the recipe of a machine profile, without its machine-local fields."""
+    return {
+        key: value
+        for key, value in asdict(profile).items()
+        if key not in MACHINE_FIELDS and value is not None
+    }
+
+
+def profile_fingerprint(profile: dict[str, Any]) -> str:
+    """Return a content hash of a profile recipe."""
+    recipe = {key: value for key, value in profile.items() if key not in MACHINE_FIELDS}
+    return hashlib.sha256(
+        json.dumps(recipe, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+@dataclass
+class ProfileDiff:
+    """Differences between the library and the profiles of one machine."""
+
+    # Library profiles the machine lacks
+    missing: list[str] = field(default_factory=list)
+    # Profiles whose recipe differs, with their ID on the machine
+    changed: dict[str, int] = field(default_factory=dict)
+    unchanged: list[str] = field(default_factory=list)
+    # Machine profiles the library lacks
+    untracked: list[str] = field(default_factory=list)
+
+
+class GaggiuinoProfileLibrary:
+    """
+    Profile recipes kept in Home Assistant, shared by every machine.
+
+    Profiles are keyed by name, as profile IDs are local to each machine.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._profiles: dict[str, dict[str, Any]] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    @property
+    def profiles(self) -> dict[str, dict[str, Any]]:
+        """Return the library profiles keyed by name."""
+        return self._profiles
+
+    async def async_load(self) -> None:
+        """Load the library from storage."""
+        if (data := await self._store.async_load()) is not None:
+            self._profiles = data.get("profiles", {})
+        self._fingerprints = {
+            name: profile_fingerprint(profile)
+            for name, profile in self._profiles.items()
+        }
+
+    async def async_import(self, profiles: list[GaggiuinoProfile]) -> list[str]:
+        """Add or update machine profiles, returning the names that changed."""
+        changed: list[str] = []
+        seen: set[str] = set()
+        for profile in profiles:
+            if profile.name in seen:
+                _LOGGER.warning(
+                    "Gaggiuino profile name %s is not unique, skipping ID %s",
+                    profile.name,
+                    profile.id,
+                )
+                continue
+            seen.add(profile.name)
+            recipe = profile_to_dict(profile)
+            fingerprint = profile_fingerprint(recipe)
+            if self._fingerprints.get(profile.name) == fingerprint:
+                continue
+            self._profiles[profile.name] = recipe
+            self._fingerprints[profile.name] = fingerprint
+            changed.append(profile.name)
+
+        if changed:
+            await self._store.async_save({"profiles": self._profiles})
+        return changed
+
+    def diff(self, profiles: list[GaggiuinoProfile]) -> ProfileDiff:
+        """Compare the library with the profiles of a machine."""
+        result = ProfileDiff()
+        on_machine: dict[str, GaggiuinoProfile] = {}
+        for profile in profiles:
+            # Like async_import, the first profile of a name wins
+            on_machine.setdefault(profile.name, profile)
+        for name, fingerprint in self._fingerprints.items():
+            if (profile := on_machine.get(name)) is None:
+                result.missing.append(name)
+            elif profile_fingerprint(profile_to_dict(profile)) != fingerprint:
+                result.changed[name] = profile.id
+            else:
+                result.unchanged.append(name)
+        result.untracked = [name for name in on_machine if name not in self._profiles]
+        return result
+
+
+async def async_get_profile_library(hass: HomeAssistant) -> GaggiuinoProfileLibrary:
+    """Return the profile library, loading it on first use."""
+    if (library := hass.data.get(DATA_PROFILE_LIBRARY)) is None:
+        library = GaggiuinoProfileLibrary(hass)
+        await library.async_load()
+        hass.data[DATA_PROFILE_LIBRARY] = library
+    return library
@@ -10,9 +10,9 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SETTINGS_GROUP_LED
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -34,7 +34,7 @@ async def async_setup_entry(
     async_add_entities([GaggiuinoLedLight(coordinator)])
 
 
-class GaggiuinoLedLight(CoordinatorEntity, LightEntity):
+class GaggiuinoLedLight(GaggiuinoEntity, LightEntity):
     """Representation of a Gaggiuino LED light."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -54,9 +54,9 @@ class GaggiuinoLedLight(CoordinatorEntity, LightEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the light is on."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return None
-        return self.coordinator.led_settings.state
+        return self.coordinator.data.led_settings.state
 
     @property
     def brightness(self) -> int | None:
@@ -67,34 +67,30 @@ class GaggiuinoLedLight(CoordinatorEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the RGB color of the light."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return None
-        color = self.coordinator.led_settings.color
+        color = self.coordinator.data.led_settings.color
         return (color.R, color.G, color.B)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return
 
-        new_settings = self.coordinator.led_settings.to_api_dict()
-        new_settings["state"] = True
+        fields: dict[str, Any] = {"state": True}
 
         # Handle RGB color if provided
         if "rgb_color" in kwargs:
             r, g, b = kwargs["rgb_color"]
-            new_settings["color"] = {"R": r, "G": g, "B": b}
+            fields["color"] = {"R": r, "G": g, "B": b}
 
-        await self.coordinator.update_led_settings(new_settings)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings_fields(SETTINGS_GROUP_LED, fields)
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the light off."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return
 
-        new_settings = self.coordinator.led_settings.to_api_dict()
-        new_settings["state"] = False
-
-        await self.coordinator.update_led_settings(new_settings)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_LED, {"state": False}
+        )
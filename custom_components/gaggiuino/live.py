@@ -0,0 +1,163 @@
+"""Live shot metrics for Gaggiuino integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from .const import (
+    EVENT_PREINFUSION_END,
+    EVENT_SHOT_FINISHED,
+    EVENT_SHOT_STARTED,
+    SHOT_METRICS_WINDOW,
+)
+from .shots import PREINFUSION_END_PRESSURE
+
+if TYPE_CHECKING:
+    from gaggiuino_api import GaggiuinoStatus
+
+
+class RunningSlope:
+    """
+    Least-squares slope over the most recent points of a series.
+
+    Keeps running sums, so adding a point and dropping the oldest one is O(1).
+    """
+
+    __slots__ = ("_points", "_sum_t", "_sum_tt", "_sum_ty", "_sum_y", "_window")
+
+    def __init__(self, window: int) -> None:
+        """Initialize."""
+        self._window = window
+        self._points: deque[tuple[float, float]] = deque()
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+
+    def add(self, t: float, y: float) -> None:
+        """Add a point, dropping the oldest one once the window is full."""
+        if len(self._points) == self._window:
+            old_t, old_y = self._points.popleft()
+            self._sum_t -= old_t
+            self._sum_y -= old_y
+            self._sum_tt -= old_t * old_t
+            self._sum_ty -= old_t * old_y
+        self._points.append((t, y))
+        self._sum_t += t
+        self._sum_y += y
+        self._sum_tt += t * t
+        self._sum_ty += t * y
+
+    def clear(self) -> None:
+        """Forget all points."""
+        self._points.clear()
+        self._sum_t = self._sum_y = self._sum_tt = self._sum_ty = 0.0
+
+    @property
+    def slope(self) -> float | None:
+        """Return the slope, or None with fewer than two distinct times."""
+        count = len(self._points)
+        if count < 2:
+            return None
+        denominator = count * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-9:
+            return None
+        return (count * self._sum_ty - self._sum_t * self._sum_y) / denominator
+
+
+class ShotTracker:
+    """
+    Metrics of the running shot, derived from the status samples.
+
+    A shot runs while the brew switch is on. Times are seconds since it started.
+    """
+
+    __slots__ = (
+        "_pressure",
+        "_started",
+        "_weight",
+        "active",
+        "peak_pressure",
+        "preinfusion_time",
+        "shot_time",
+        "target_weight",
+        "weight",
+    )
+
+    def __init__(self, window: int = SHOT_METRICS_WINDOW) -> None:
+        """Initialize."""
+        self._weight = RunningSlope(window)
+        self._pressure = RunningSlope(window)
+        self._started = 0.0
+        self.active = False
+        # Seconds since the running shot started, or the length of the last one
+        self.shot_time: float | None = None
+        self.weight: float | None = None
+        self.peak_pressure: float | None = None
+        # Seconds until the pressure first reached PREINFUSION_END_PRESSURE
+        self.preinfusion_time: float | None = None
+        # Yield the shot stops at, from the profile's global stop conditions
+        self.target_weight: float | None = None
+
+    def update(
+        self, status: GaggiuinoStatus, now: float, target_weight: float | None
+    ) -> list[str]:
+        """
+        Add a status sample taken at monotonic time now.
+
+        Return the shot lifecycle events the sample caused.
+        """
+        events: list[str] = []
+        if not status.brewSwitchState:
+            if self.active:
+                self.active = False
+                self.shot_time = now - self._started
+                events.append(EVENT_SHOT_FINISHED)
+            return events
+
+        if not self.active:
+            self.active = True
+            self._started = now
+            self._weight.clear()
+            self._pressure.clear()
+            self.peak_pressure = None
+            self.preinfusion_time = None
+            events.append(EVENT_SHOT_STARTED)
+
+        elapsed = now - self._started
+        self.shot_time = elapsed
+        self.weight = status.weight
+        self.target_weight = target_weight
+        self._weight.add(elapsed, status.weight)
+        self._pressure.add(elapsed, status.pressure)
+        if self.peak_pressure is None or status.pressure > self.peak_pressure:
+            self.peak_pressure = status.pressure
+        if (
+            self.preinfusion_time is None
+            and status.pressure >= PREINFUSION_END_PRESSURE
+        ):
+            self.preinfusion_time = elapsed
+            events.append(EVENT_PREINFUSION_END)
+        return events
+
+    @property
+    def weight_flow(self) -> float | None:
+        """Return the yield rate in g/s during a shot."""
+        return self._weight.slope if self.active else None
+
+    @property
+    def pressure_slope(self) -> float | None:
+        """Return the pressure change in bar/s during a shot."""
+        return self._pressure.slope if self.active else None
+
+    @property
+    def projected_time(self) -> float | None:
+        """Return the projected total shot time at the current yield rate."""
+        flow = self.weight_flow
+        if (
+            flow is None
+            or flow <= 0
+            or self.target_weight is None
+            or self.weight is None
+            or self.shot_time is None
+        ):
+            return None
+        return self.shot_time + max(0.0, self.target_weight - self.weight) / flow
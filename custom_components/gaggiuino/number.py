@@ -7,9 +7,9 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import EntityCategory, UnitOfTemperature
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SETTINGS_GROUP_BOILER
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -31,7 +31,7 @@ async def async_setup_entry(
     async_add_entities([GaggiuinoSteamSetPointNumber(coordinator)])
 
 
-class GaggiuinoSteamSetPointNumber(CoordinatorEntity, NumberEntity):
+class GaggiuinoSteamSetPointNumber(GaggiuinoEntity, NumberEntity):
     """Representation of a Gaggiuino steam set point number entity."""
 
     _attr_native_min_value = 100.0
@@ -53,17 +53,15 @@ class GaggiuinoSteamSetPointNumber(CoordinatorEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current steam set point."""
-        if self.coordinator.boiler_settings is None:
+        if self.coordinator.data.boiler_settings is None:
             return None
-        return float(self.coordinator.boiler_settings.steamSetPoint)
+        return float(self.coordinator.data.boiler_settings.steamSetPoint)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the steam set point."""
-        if self.coordinator.boiler_settings is None:
+        if self.coordinator.data.boiler_settings is None:
             return
 
-        new_settings = self.coordinator.boiler_settings.to_api_dict()
-        new_settings["steamSetPoint"] = int(value)
-
-        await self.coordinator.update_boiler_settings(new_settings)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_BOILER, {"steamSetPoint": int(value)}
+        )
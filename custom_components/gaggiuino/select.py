@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING, ClassVar
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .common import get_profile_display_name
+from .const import DOMAIN, SETTINGS_GROUP_SYSTEM
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from gaggiuino_api import GaggiuinoProfile
@@ -38,12 +39,7 @@ async def async_setup_entry(
     )
 
 
-def _get_profile_display_name(profile: GaggiuinoProfile) -> str:
-    """Generate a unique display name for a profile."""
-    return f"{profile.name} (ID: {profile.id})"
-
-
-class GaggiuinoProfileSelect(CoordinatorEntity, SelectEntity):
+class GaggiuinoProfileSelect(GaggiuinoEntity, SelectEntity):
     """Representation of a Gaggiuino profile selector."""
 
     def __init__(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
@@ -55,43 +51,27 @@ class GaggiuinoProfileSelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{coordinator.entry.entry_id}_profile"
         self._attr_translation_key = "profile"
         self._attr_device_info = coordinator.device_info
-        self._profile_map: dict[str, int] = {}  # Maps display names to profile IDs
-
-    def _update_profile_map(self) -> None:
-        """Update the mapping of display names to profile IDs."""
-        if not (profiles := self.coordinator.profiles):
-            self._profile_map = {}
-            return
-
-        self._profile_map = {
-            _get_profile_display_name(profile): profile.id for profile in profiles
-        }
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected profile."""
-        if self.coordinator.profile is None:
+        if self.coordinator.data.profile is None:
             return None
 
-        profile: GaggiuinoProfile = self.coordinator.profile
-        return _get_profile_display_name(profile) if profile else None
+        profile: GaggiuinoProfile = self.coordinator.data.profile
+        return get_profile_display_name(profile) if profile else None
 
     @property
     def options(self) -> list[str]:
         """Return the list of available profiles."""
-        if self.coordinator.profiles is None:
-            return []
-
-        self._update_profile_map()
-        return list(self._profile_map.keys())
+        return list(self.coordinator.profile_options)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if option not in self._profile_map:
+        if (profile_id := self.coordinator.profile_options.get(option)) is None:
             msg = f"Invalid profile selection: {option}"
             raise ValueError(msg)
 
-        profile_id = self._profile_map[option]
         await self.coordinator.select_profile(profile_id)
         await self.coordinator.async_refresh()
 
@@ -104,7 +84,7 @@ RELEASE_CHANNEL_OPTIONS = {
 }
 
 
-class GaggiuinoReleaseChannelSelect(CoordinatorEntity, SelectEntity):
+class GaggiuinoReleaseChannelSelect(GaggiuinoEntity, SelectEntity):
     """Representation of a Gaggiuino release channel selector."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -123,10 +103,10 @@ class GaggiuinoReleaseChannelSelect(CoordinatorEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the currently selected release channel."""
-        if self.coordinator.system_settings is None:
+        if self.coordinator.data.system_settings is None:
             return None
 
-        channel_value = self.coordinator.system_settings.releaseChannel
+        channel_value = self.coordinator.data.system_settings.releaseChannel
         for name, value in RELEASE_CHANNEL_OPTIONS.items():
             if value == channel_value:
                 return name
@@ -138,11 +118,9 @@ class GaggiuinoReleaseChannelSelect(CoordinatorEntity, SelectEntity):
             msg = f"Invalid release channel selection: {option}"
             raise ValueError(msg)
 
-        if self.coordinator.system_settings is None:
+        if self.coordinator.data.system_settings is None:
             return
 
-        new_settings = self.coordinator.system_settings.to_api_dict()
-        new_settings["releaseChannel"] = RELEASE_CHANNEL_OPTIONS[option]
-
-        await self.coordinator.update_system_settings(new_settings)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SYSTEM, {"releaseChannel": RELEASE_CHANNEL_OPTIONS[option]}
+        )
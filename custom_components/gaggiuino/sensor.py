@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -20,13 +21,27 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
 
-from .common import get_status_attr
-from .const import DOMAIN
+from .common import get_shot_summary_attr, get_status_attr
+from .const import (
+    CONF_MIN_WRITE_INTERVAL,
+    DEFAULT_MIN_WRITE_INTERVAL,
+    DOMAIN,
+    ENDPOINT_FIRMWARE_PROGRESS,
+    ENDPOINT_HEALTH,
+    ENDPOINT_LATEST_SHOT_ID,
+    ENDPOINT_PROFILES,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+    SENSOR_DEADBANDS,
+)
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import datetime
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -36,6 +51,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+UNIT_GRAMS_PER_SECOND = "g/s"
+UNIT_BAR_PER_SECOND = "bar/s"
+
 
 @dataclass(frozen=True)
 class GaggiuinoSensorEntityDescription(SensorEntityDescription):
@@ -43,6 +61,31 @@ class GaggiuinoSensorEntityDescription(SensorEntityDescription):
 
     value_fn: Callable[[Any], Any] | None = None
     attr_name: str | None = None
+    attributes_fn: Callable[[Any], dict[str, Any] | None] | None = None
+
+
+def endpoint_latency_description(
+    endpoint: str, name: str
+) -> GaggiuinoSensorEntityDescription:
+    """Return the description of the latency sensor of an endpoint."""
+    return GaggiuinoSensorEntityDescription(
+        key=f"{endpoint}_latency",
+        translation_key=f"{endpoint}_latency",
+        name=f"{name} Latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.endpoint(endpoint).percentile(
+            50
+        ),
+        attributes_fn=lambda coordinator: coordinator.stats.endpoint(
+            endpoint
+        ).as_dict(),
+    )
 
 
 SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
@@ -57,6 +100,36 @@ SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
+    GaggiuinoSensorEntityDescription(
+        key="cycle_latency",
+        translation_key="cycle_latency",
+        name="Poll Cycle Latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.cycle_latency,
+        attributes_fn=lambda coordinator: coordinator.stats.cycle.as_dict(),
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="poll_overruns",
+        translation_key="poll_overruns",
+        name="Poll Overruns",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.overruns,
+    ),
+    endpoint_latency_description(ENDPOINT_STATUS, "Status"),
+    endpoint_latency_description(ENDPOINT_HEALTH, "Health"),
+    endpoint_latency_description(ENDPOINT_LATEST_SHOT_ID, "Latest Shot ID"),
+    endpoint_latency_description(ENDPOINT_PROFILES, "Profiles"),
+    endpoint_latency_description(ENDPOINT_SETTINGS, "Settings"),
+    endpoint_latency_description(ENDPOINT_FIRMWARE_PROGRESS, "Firmware Progress"),
     GaggiuinoSensorEntityDescription(
         key="profile_id",
         translation_key="profile_id",
@@ -135,6 +208,124 @@ SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
         value_fn=get_status_attr("weight"),
         suggested_display_precision=2,
     ),
+    GaggiuinoSensorEntityDescription(
+        key="eta_to_ready",
+        translation_key="eta_to_ready",
+        name="Time To Ready",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda coordinator: (
+            coordinator.heatup.eta if coordinator.data.online else None
+        ),
+        attributes_fn=lambda coordinator: coordinator.heatup.as_dict(),
+    ),
+    # Live shot metrics
+    GaggiuinoSensorEntityDescription(
+        key="shot_time",
+        translation_key="shot_time",
+        name="Shot Time",
+        icon="mdi:timer-play-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.shot_tracker.shot_time,
+        suggested_display_precision=1,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="shot_weight_flow",
+        translation_key="shot_weight_flow",
+        name="Shot Weight Flow",
+        icon="mdi:water-outline",
+        native_unit_of_measurement=UNIT_GRAMS_PER_SECOND,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.shot_tracker.weight_flow,
+        suggested_display_precision=2,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="shot_pressure_slope",
+        translation_key="shot_pressure_slope",
+        name="Shot Pressure Slope",
+        icon="mdi:chart-line",
+        native_unit_of_measurement=UNIT_BAR_PER_SECOND,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.shot_tracker.pressure_slope,
+        suggested_display_precision=2,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="shot_projected_time",
+        translation_key="shot_projected_time",
+        name="Shot Projected Time",
+        icon="mdi:timer-check-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.shot_tracker.projected_time,
+        suggested_display_precision=0,
+    ),
+    # Last shot summary sensors
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_duration",
+        translation_key="last_shot_duration",
+        name="Last Shot Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=get_shot_summary_attr("total_time"),
+        suggested_display_precision=1,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_preinfusion_time",
+        translation_key="last_shot_preinfusion_time",
+        name="Last Shot Preinfusion Time",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_registry_enabled_default=False,
+        value_fn=get_shot_summary_attr("preinfusion_time"),
+        suggested_display_precision=1,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_peak_pressure",
+        translation_key="last_shot_peak_pressure",
+        name="Last Shot Peak Pressure",
+        device_class=SensorDeviceClass.PRESSURE,
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        entity_registry_enabled_default=False,
+        value_fn=get_shot_summary_attr("peak_pressure"),
+        suggested_display_precision=1,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_yield",
+        translation_key="last_shot_yield",
+        name="Last Shot Yield",
+        icon="mdi:coffee-outline",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.GRAMS,
+        value_fn=get_shot_summary_attr("yield_weight"),
+        suggested_display_precision=1,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_ratio",
+        translation_key="last_shot_ratio",
+        name="Last Shot Ratio",
+        icon="mdi:scale-balance",
+        entity_registry_enabled_default=False,
+        value_fn=get_shot_summary_attr("ratio"),
+        suggested_display_precision=2,
+    ),
+    GaggiuinoSensorEntityDescription(
+        key="last_shot_mean_flow",
+        translation_key="last_shot_mean_flow",
+        name="Last Shot Mean Flow",
+        icon="mdi:water-outline",
+        native_unit_of_measurement=UNIT_GRAMS_PER_SECOND,
+        entity_registry_enabled_default=False,
+        value_fn=get_shot_summary_attr("mean_flow"),
+        suggested_display_precision=2,
+    ),
     # Version sensors (diagnostic)
     GaggiuinoSensorEntityDescription(
         key="core_version",
@@ -144,7 +335,9 @@ SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         value_fn=lambda coordinator: (
-            coordinator.versions.coreVersion if coordinator.versions else None
+            coordinator.data.settings.versions.coreVersion
+            if coordinator.data.settings
+            else None
         ),
     ),
     GaggiuinoSensorEntityDescription(
@@ -155,7 +348,9 @@ SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         value_fn=lambda coordinator: (
-            coordinator.versions.frontVersion if coordinator.versions else None
+            coordinator.data.settings.versions.frontVersion
+            if coordinator.data.settings
+            else None
         ),
     ),
     GaggiuinoSensorEntityDescription(
@@ -166,7 +361,9 @@ SENSORS: tuple[GaggiuinoSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         value_fn=lambda coordinator: (
-            coordinator.versions.staticVersion if coordinator.versions else None
+            coordinator.data.settings.versions.staticVersion
+            if coordinator.data.settings
+            else None
         ),
     ),
 )
@@ -186,7 +383,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GaggiuinoSensor(CoordinatorEntity, SensorEntity):
+class GaggiuinoSensor(GaggiuinoEntity, SensorEntity):
     """Representation of a Gaggiuino sensor."""
 
     entity_description: GaggiuinoSensorEntityDescription
@@ -207,14 +404,88 @@ class GaggiuinoSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = coordinator.device_info
         self._attr_device_class = description.device_class
         self._attr_entity_category = description.entity_category
+        # Deadband and write throttle of high-rate telemetry sensors
+        self._deadband: float | None = None
+        self._min_write_interval: float = 0.0
+        if (deadband := SENSOR_DEADBANDS.get(description.key)) is not None:
+            options = coordinator.entry.options
+            conf, default = deadband
+            self._deadband = float(options.get(conf, default))
+            self._min_write_interval = float(
+                options.get(CONF_MIN_WRITE_INTERVAL, DEFAULT_MIN_WRITE_INTERVAL)
+            )
+        self._written_value: float | None = None
+        self._written_context: tuple[Any, ...] | None = None
+        self._written_at: float = 0.0
+        self._pending_write: CALLBACK_TYPE | None = None
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.coordinator)
 
+    def _entity_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the sensor."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop changes within the deadband and throttle the remaining writes."""
+        if self._deadband is None:
+            super()._handle_coordinator_update()
+            return
+
+        value = self.native_value
+        if (
+            value is not None
+            and self._written_value is not None
+            and abs(value - self._written_value) < self._deadband
+            # The deadband only holds back the value, never the attributes
+            # (such as the stale flag) or the availability
+            and self._context_fingerprint() == self._written_context
+        ):
+            return
+
+        delay = self._written_at + self._min_write_interval - time.monotonic()
+        if delay > 0:
+            # Write the latest value once the interval has passed
+            if self._pending_write is None:
+                self._pending_write = async_call_later(
+                    self.hass, delay, self._async_write_pending
+                )
+            return
+
+        self._write_filtered_state()
+
+    @callback
+    def _async_write_pending(self, _now: datetime) -> None:
+        """Write the value held back by the throttle."""
+        self._pending_write = None
+        self._write_filtered_state()
 
-class GaggiuinoFirmwareStatusSensor(CoordinatorEntity, SensorEntity):
+    @callback
+    def _write_filtered_state(self) -> None:
+        """Write the current value and remember it as the deadband reference."""
+        self._written_value = self.native_value
+        self._written_context = self._context_fingerprint()
+        self._written_at = time.monotonic()
+        super()._handle_coordinator_update()
+
+    def _context_fingerprint(self) -> tuple[Any, ...]:
+        """Return the written state of this sensor apart from its value."""
+        return (self.available, self.extra_state_attributes)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a held back write."""
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+        await super().async_will_remove_from_hass()
+
+
+class GaggiuinoFirmwareStatusSensor(GaggiuinoEntity, SensorEntity):
     """Representation of a Gaggiuino firmware status sensor."""
 
     def __init__(self, coordinator: GaggiuinoDataUpdateCoordinator) -> None:
@@ -232,18 +503,17 @@ class GaggiuinoFirmwareStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if self.coordinator.firmware_progress is None:
+        if self.coordinator.data.firmware_progress is None:
             return None
-        return self.coordinator.firmware_progress.get("status")
+        return self.coordinator.data.firmware_progress.get("status")
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _entity_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes."""
-        if self.coordinator.firmware_progress is None:
+        if self.coordinator.data.firmware_progress is None:
             return None
         return {
-            "progress": self.coordinator.firmware_progress.get("progress"),
-            "type": self.coordinator.firmware_progress.get("type"),
+            "progress": self.coordinator.data.firmware_progress.get("progress"),
+            "type": self.coordinator.data.firmware_progress.get("type"),
             "possible_statuses": ["IDLE", "IN_PROGRESS", "ERROR"],
             "possible_types": ["F_FW", "F_FS", "C_FW"],
         }
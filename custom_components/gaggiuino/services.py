@@ -0,0 +1,291 @@
+"""Services for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import voluptuous as vol
+from gaggiuino_api import GaggiuinoError
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_PROFILE_PUSH,
+    DEFAULT_PROFILE_PUSH,
+    DOMAIN,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_PARQUET,
+    EXPORT_FORMATS,
+    EXPORTS_DIRECTORY,
+)
+from .coordinator import GaggiuinoDataUpdateCoordinator
+from .export import export_shots, parquet_available
+from .library import async_get_profile_library
+
+if TYPE_CHECKING:
+    from gaggiuino_api import GaggiuinoProfile
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_SHOTS: Final = "get_shots"
+SERVICE_EXPORT_SHOTS: Final = "export_shots"
+SERVICE_EXPORT_PROFILES: Final = "export_profiles"
+SERVICE_DIFF_PROFILES: Final = "diff_profiles"
+SERVICE_PUSH_PROFILES: Final = "push_profiles"
+
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_SHOT_ID: Final = "shot_id"
+ATTR_PROFILE_ID: Final = "profile_id"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
+ATTR_LIMIT: Final = "limit"
+ATTR_PROFILES: Final = "profiles"
+ATTR_FORMAT: Final = "format"
+ATTR_FILENAME: Final = "filename"
+
+DEFAULT_SHOTS_LIMIT: Final = 100
+
+GET_SHOTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SHOT_ID): cv.positive_int,
+        vol.Optional(ATTR_PROFILE_ID): vol.Coerce(int),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_SHOTS_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
+        ),
+    }
+)
+
+EXPORT_SHOTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FORMAT, default=EXPORT_FORMAT_CSV): vol.In(EXPORT_FORMATS),
+        vol.Optional(ATTR_PROFILE_ID): vol.Coerce(int),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+
+PROFILES_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+PUSH_PROFILES_SCHEMA = PROFILES_SCHEMA.extend(
+    {vol.Optional(ATTR_PROFILES): vol.All(cv.ensure_list, [cv.string])}
+)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> GaggiuinoDataUpdateCoordinator:
+    """Return the coordinator of the config entry targeted by a service call."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    # The domain data also holds the fleet shared by all entries
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(coordinator, GaggiuinoDataUpdateCoordinator):
+        msg = f"Gaggiuino config entry {entry_id} is not loaded"
+        raise ServiceValidationError(msg)
+    return coordinator
+
+
+async def _async_get_shots(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return shot summaries from the shot archive."""
+    coordinator = _get_coordinator(hass, call)
+    archive = coordinator.shot_archive
+
+    if (shot_id := call.data.get(ATTR_SHOT_ID)) is not None:
+        summary = await hass.async_add_executor_job(archive.get, shot_id)
+        summaries = [summary] if summary is not None else []
+    else:
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        summaries = await hass.async_add_executor_job(
+            lambda: archive.query(
+                start=int(dt_util.as_timestamp(start)) if start else None,
+                end=int(dt_util.as_timestamp(end)) if end else None,
+                profile_id=call.data.get(ATTR_PROFILE_ID),
+                limit=call.data[ATTR_LIMIT],
+            )
+        )
+
+    return {"shots": [asdict(summary) for summary in summaries]}
+
+
+async def _async_export_shots(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Stream a range of stored shots to a file in the config directory."""
+    coordinator = _get_coordinator(hass, call)
+    export_format = call.data[ATTR_FORMAT]
+    if export_format == EXPORT_FORMAT_PARQUET and not await hass.async_add_executor_job(
+        parquet_available
+    ):
+        msg = "Parquet export needs the pyarrow package"
+        raise ServiceValidationError(msg)
+
+    filename = call.data.get(ATTR_FILENAME) or (
+        f"{DOMAIN}_{coordinator.entry.entry_id.lower()}_"
+        f"{dt_util.now():%Y%m%d_%H%M%S}.{export_format}"
+    )
+    if Path(filename).name != filename or filename in {".", ".."}:
+        msg = f"Export file name {filename} must not contain a directory"
+        raise ServiceValidationError(msg)
+    path = Path(hass.config.path(DOMAIN, EXPORTS_DIRECTORY, filename))
+
+    start = call.data.get(ATTR_START)
+    end = call.data.get(ATTR_END)
+    try:
+        count = await hass.async_add_executor_job(
+            lambda: export_shots(
+                coordinator.shot_archive,
+                coordinator.shot_store,
+                path,
+                export_format,
+                start=int(dt_util.as_timestamp(start)) if start else None,
+                end=int(dt_util.as_timestamp(end)) if end else None,
+                profile_id=call.data.get(ATTR_PROFILE_ID),
+            )
+        )
+    except OSError as err:
+        msg = f"Could not export the Gaggiuino shots to {path}: {err}"
+        raise HomeAssistantError(msg) from err
+
+    return {"path": str(path), "shots": count}
+
+
+async def _async_fetch_profiles(
+    coordinator: GaggiuinoDataUpdateCoordinator,
+) -> list[GaggiuinoProfile]:
+    """Download every profile of a machine in one request."""
+    try:
+        return await coordinator.async_fetch_profiles()
+    except GaggiuinoError as err:
+        msg = f"Could not download the Gaggiuino profiles: {err}"
+        raise HomeAssistantError(msg) from err
+
+
+async def _async_export_profiles(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Copy every machine profile into the profile library."""
+    coordinator = _get_coordinator(hass, call)
+    library = await async_get_profile_library(hass)
+    profiles = await _async_fetch_profiles(coordinator)
+    changed = await library.async_import(profiles)
+    _LOGGER.debug("Gaggiuino exported profiles %s", changed)
+    return {"exported": changed, "unchanged": len(profiles) - len(changed)}
+
+
+async def _async_diff_profiles(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Compare the profile library with the profiles of a machine."""
+    coordinator = _get_coordinator(hass, call)
+    library = await async_get_profile_library(hass)
+    diff = library.diff(await _async_fetch_profiles(coordinator))
+    return {**asdict(diff), "changed": list(diff.changed)}
+
+
+async def _async_push_profiles(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Save the library profiles a machine lacks or differs on, and only those."""
+    coordinator = _get_coordinator(hass, call)
+    if not coordinator.entry.options.get(CONF_PROFILE_PUSH, DEFAULT_PROFILE_PUSH):
+        msg = (
+            f"Profile push is disabled for {coordinator.entry.title}, "
+            "enable Allow profile push in its options"
+        )
+        raise ServiceValidationError(msg)
+    library = await async_get_profile_library(hass)
+    diff = library.diff(await _async_fetch_profiles(coordinator))
+
+    # Library name -> ID of the machine profile to replace, None to add one
+    deltas: dict[str, int | None] = dict.fromkeys(diff.missing) | diff.changed
+    if (names := call.data.get(ATTR_PROFILES)) is not None:
+        if unknown := [name for name in names if name not in library.profiles]:
+            msg = f"Profiles not in the Gaggiuino profile library: {unknown}"
+            raise ServiceValidationError(msg)
+        deltas = {name: deltas[name] for name in names if name in deltas}
+
+    pushed: list[str] = []
+    failed: list[str] = []
+    # One at a time, the embedded web server handles little concurrency. A failed
+    # save is not retried: the machine may have stored it before the error.
+    for name, profile_id in deltas.items():
+        try:
+            saved = await coordinator.async_save_profile(
+                library.profiles[name], profile_id
+            )
+        except GaggiuinoError as err:
+            _LOGGER.warning("Could not save Gaggiuino profile %s: %s", name, err)
+            saved = False
+        (pushed if saved else failed).append(name)
+
+    return {"pushed": pushed, "failed": failed}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Gaggiuino services."""
+
+    async def async_get_shots(call: ServiceCall) -> ServiceResponse:
+        return await _async_get_shots(hass, call)
+
+    async def async_export_shots(call: ServiceCall) -> ServiceResponse:
+        return await _async_export_shots(hass, call)
+
+    async def async_export_profiles(call: ServiceCall) -> ServiceResponse:
+        return await _async_export_profiles(hass, call)
+
+    async def async_diff_profiles(call: ServiceCall) -> ServiceResponse:
+        return await _async_diff_profiles(hass, call)
+
+    async def async_push_profiles(call: ServiceCall) -> ServiceResponse:
+        return await _async_push_profiles(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SHOTS,
+        async_get_shots,
+        schema=GET_SHOTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SHOTS,
+        async_export_shots,
+        schema=EXPORT_SHOTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_PROFILES,
+        async_export_profiles,
+        schema=PROFILES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DIFF_PROFILES,
+        async_diff_profiles,
+        schema=PROFILES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PUSH_PROFILES,
+        async_push_profiles,
+        schema=PUSH_PROFILES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
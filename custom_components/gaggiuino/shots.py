@@ -0,0 +1,240 @@
+"""Shot history storage for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from gaggiuino_api import GaggiuinoShot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Datapoint series recorded by the machine. Values are integers scaled by 10.
+SHOT_CHANNELS: Final = (
+    "timeInShot",
+    "pressure",
+    "pumpFlow",
+    "weightFlow",
+    "shotWeight",
+    "temperature",
+    "targetPressure",
+    "targetPumpFlow",
+    "targetTemperature",
+    "waterPumped",
+)
+DATAPOINT_SCALE: Final = 10
+
+# Preinfusion is considered over once the pressure first reaches this (bar)
+PREINFUSION_END_PRESSURE: Final = 4.0
+
+SHOT_FILE_SUFFIX: Final = ".shot"
+_MAGIC: Final = b"GSHT"
+_FORMAT_VERSION: Final = 1
+# magic, format version, metadata length
+_HEADER: Final = struct.Struct("<4sBI")
+# Columns are stored as little-endian signed 32-bit integers
+_TYPECODE: Final = "i"
+
+
+@dataclass(frozen=True)
+class StoredShot:
+    """A shot as kept in the local store, one integer array per channel."""
+
+    id: int
+    timestamp: int
+    duration: int
+    profile: dict[str, Any]
+    datapoints: dict[str, array]
+
+    @classmethod
+    def from_api(cls, shot: GaggiuinoShot) -> StoredShot:
+        """Convert a shot returned by the API."""
+        raw = shot.datapoints
+        if not isinstance(raw, dict):
+            raw = asdict(raw)
+        datapoints = {
+            channel: array(_TYPECODE, (int(v) for v in values))
+            for channel in SHOT_CHANNELS
+            if (values := raw.get(channel)) is not None
+        }
+        profile = shot.profile
+        if not isinstance(profile, dict):
+            profile = asdict(profile)
+        return cls(
+            id=int(shot.id),
+            timestamp=int(shot.timestamp),
+            duration=int(shot.duration),
+            profile=profile,
+            datapoints=datapoints,
+        )
+
+    def channel(self, name: str) -> list[float]:
+        """Return a channel in real units."""
+        return [v / DATAPOINT_SCALE for v in self.datapoints.get(name, ())]
+
+
+@dataclass(frozen=True)
+class ShotSummary:
+    """Summary metrics of a shot, computed once when it is stored."""
+
+    id: int
+    timestamp: int
+    profile_id: int | None
+    profile_name: str | None
+    total_time: float
+    preinfusion_time: float | None
+    peak_pressure: float | None
+    yield_weight: float | None
+    dose: float | None
+    ratio: float | None
+    mean_flow: float | None
+
+    @classmethod
+    def from_shot(cls, shot: StoredShot) -> ShotSummary:
+        """Compute the summary of a stored shot."""
+        times = shot.channel("timeInShot")
+        pressures = shot.channel("pressure")
+        weights = shot.channel("shotWeight")
+        total_time = times[-1] if times else shot.duration / DATAPOINT_SCALE
+
+        preinfusion_time = next(
+            (
+                time
+                for time, pressure in zip(times, pressures, strict=False)
+                if pressure >= PREINFUSION_END_PRESSURE
+            ),
+            None,
+        )
+        yield_weight = max(weights) if weights else None
+
+        recipe = shot.profile.get("recipe") or {}
+        dose = recipe.get("coffeeIn") or None
+        ratio = None
+        if dose and yield_weight:
+            ratio = round(yield_weight / float(dose), 2)
+
+        mean_flow = None
+        extraction_time = total_time - (preinfusion_time or 0)
+        if yield_weight and extraction_time > 0:
+            mean_flow = round(yield_weight / extraction_time, 2)
+
+        return cls(
+            id=shot.id,
+            timestamp=shot.timestamp,
+            profile_id=shot.profile.get("id"),
+            profile_name=shot.profile.get("name"),
+            total_time=total_time,
+            preinfusion_time=preinfusion_time,
+            peak_pressure=max(pressures) if pressures else None,
+            yield_weight=yield_weight,
+            dose=float(dose) if dose else None,
+            ratio=ratio,
+            mean_flow=mean_flow,
+        )
+
+
+class GaggiuinoShotStore:
+    """
+    Directory of shot files, one per shot.
+
+    Each file holds a small JSON metadata block followed by the zlib-compressed
+    datapoint columns. All methods do blocking I/O and must run in an executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize."""
+        self.path = path
+
+    def _shot_path(self, shot_id: int) -> Path:
+        return self.path / f"{shot_id:08d}{SHOT_FILE_SUFFIX}"
+
+    def shot_ids(self) -> list[int]:
+        """Return the IDs of all stored shots in ascending order."""
+        if not self.path.is_dir():
+            return []
+        return sorted(
+            int(file.stem)
+            for file in self.path.glob(f"*{SHOT_FILE_SUFFIX}")
+            if file.stem.isdigit()
+        )
+
+    def latest_shot_id(self) -> int | None:
+        """Return the highest stored shot ID."""
+        ids = self.shot_ids()
+        return ids[-1] if ids else None
+
+    def contains(self, shot_id: int) -> bool:
+        """Return True if the shot is stored."""
+        return self._shot_path(shot_id).is_file()
+
+    def save(self, shot: StoredShot) -> None:
+        """Write a shot to the store."""
+        channels = list(shot.datapoints.items())
+        meta = json.dumps(
+            {
+                "id": shot.id,
+                "timestamp": shot.timestamp,
+                "duration": shot.duration,
+                "profile": shot.profile,
+                "channels": [[name, len(values)] for name, values in channels],
+            },
+            separators=(",", ":"),
+        ).encode()
+        columns = bytearray()
+        for _name, values in channels:
+            column = array(_TYPECODE, values)
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns += column.tobytes()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self._shot_path(shot.id)
+        partial = target.with_suffix(".tmp")
+        partial.write_bytes(
+            _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(meta))
+            + meta
+            + zlib.compress(bytes(columns))
+        )
+        partial.replace(target)
+
+    def load(self, shot_id: int) -> StoredShot | None:
+        """Read a shot from the store."""
+        try:
+            data = self._shot_path(shot_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        magic, version, meta_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            _LOGGER.warning("Unsupported shot file for shot %s", shot_id)
+            return None
+
+        meta_end = _HEADER.size + meta_len
+        meta = json.loads(data[_HEADER.size : meta_end])
+        columns = memoryview(zlib.decompress(data[meta_end:]))
+        datapoints: dict[str, array] = {}
+        offset = 0
+        for name, length in meta["channels"]:
+            column = array(_TYPECODE)
+            size = length * column.itemsize
+            column.frombytes(columns[offset : offset + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            datapoints[name] = column
+            offset += size
+
+        return StoredShot(
+            id=meta["id"],
+            timestamp=meta["timestamp"],
+            duration=meta["duration"],
+            profile=meta["profile"],
+            datapoints=datapoints,
+        )
@@ -0,0 +1,191 @@
+"""Long-term shot statistics for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from operator import attrgetter
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.const import UnitOfMass, UnitOfPressure, UnitOfTime
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import (
+    DurationConverter,
+    MassConverter,
+    PressureConverter,
+)
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .archive import GaggiuinoShotArchive
+    from .shots import ShotSummary
+
+_LOGGER = logging.getLogger(__name__)
+
+# The recorder keeps external statistics in hourly rows
+HOUR: Final = 3600
+
+
+@dataclass(frozen=True, slots=True)
+class ShotStatistic:
+    """A per-shot metric, kept as the hourly mean, minimum and maximum."""
+
+    key: str
+    name: str
+    unit: str
+    unit_class: str
+    value: Callable[[ShotSummary], float | None]
+
+
+SHOT_STATISTICS: Final = (
+    ShotStatistic(
+        "shot_yield",
+        "Shot Yield",
+        UnitOfMass.GRAMS,
+        MassConverter.UNIT_CLASS,
+        attrgetter("yield_weight"),
+    ),
+    ShotStatistic(
+        "shot_duration",
+        "Shot Duration",
+        UnitOfTime.SECONDS,
+        DurationConverter.UNIT_CLASS,
+        attrgetter("total_time"),
+    ),
+    ShotStatistic(
+        "shot_peak_pressure",
+        "Shot Peak Pressure",
+        UnitOfPressure.BAR,
+        PressureConverter.UNIT_CLASS,
+        attrgetter("peak_pressure"),
+    ),
+)
+SHOT_COUNT_KEY: Final = "shot_count"
+
+# Metadata and hourly rows of one statistic
+StatisticBatch = tuple[dict[str, Any], list[dict[str, Any]]]
+
+
+def statistic_id(entry_id: str, key: str) -> str:
+    """Return the external statistic ID of a config entry."""
+    return f"{DOMAIN}:{entry_id.lower()}_{key}"
+
+
+def hour_start(timestamp: int) -> int:
+    """Return the start of the hour a timestamp falls in."""
+    return timestamp - timestamp % HOUR
+
+
+def _metadata(
+    entry_id: str,
+    title: str,
+    key: str,
+    name: str,
+    unit: str | None,
+    unit_class: str | None,
+    *,
+    mean: bool,
+) -> dict[str, Any]:
+    return {
+        "has_mean": mean,
+        "has_sum": not mean,
+        "name": f"{title} {name}",
+        "source": DOMAIN,
+        "statistic_id": statistic_id(entry_id, key),
+        "unit_class": unit_class,
+        "unit_of_measurement": unit,
+    }
+
+
+def shot_statistics(
+    archive: GaggiuinoShotArchive, entry_id: str, title: str, hours: set[int]
+) -> list[StatisticBatch]:
+    """
+    Build the statistics of the given hours from the shot archive.
+
+    Every hour is rebuilt from all its archived shots, so importing it again
+    replaces the row. The shot count is a sum, which statistics graphs turn into
+    shots per day. Does blocking I/O and must run in an executor.
+    """
+    rows: dict[str, list[dict[str, Any]]] = {stat.key: [] for stat in SHOT_STATISTICS}
+    counts: list[dict[str, Any]] = []
+    for hour in sorted(hours):
+        shots = archive.query(start=hour, end=hour + HOUR)
+        start = dt_util.utc_from_timestamp(hour)
+        for stat in SHOT_STATISTICS:
+            values = [v for shot in shots if (v := stat.value(shot)) is not None]
+            if values:
+                rows[stat.key].append(
+                    {
+                        "start": start,
+                        "mean": round(fmean(values), 2),
+                        "min": min(values),
+                        "max": max(values),
+                    }
+                )
+        counts.append(
+            {
+                "start": start,
+                "state": len(shots),
+                "sum": archive.count(end=hour + HOUR),
+            }
+        )
+
+    batches = [
+        (
+            _metadata(
+                entry_id,
+                title,
+                stat.key,
+                stat.name,
+                stat.unit,
+                stat.unit_class,
+                mean=True,
+            ),
+            rows[stat.key],
+        )
+        for stat in SHOT_STATISTICS
+        if rows[stat.key]
+    ]
+    if counts:
+        batches.append(
+            (
+                _metadata(
+                    entry_id, title, SHOT_COUNT_KEY, "Shots", None, None, mean=False
+                ),
+                counts,
+            )
+        )
+    return batches
+
+
+def async_import_statistics(hass: HomeAssistant, batches: list[StatisticBatch]) -> None:
+    """Queue the statistics in the recorder, one write per statistic."""
+    # Imported on first use: the recorder pulls in SQLAlchemy
+    from homeassistant.components.recorder import models
+    from homeassistant.components.recorder.statistics import (
+        async_add_external_statistics,
+    )
+
+    # Recorders reject metadata keys they do not know: mean_type arrived in
+    # Home Assistant 2025.4, unit_class later still
+    metadata_type = models.StatisticMetaData
+    known = metadata_type.__required_keys__ | metadata_type.__optional_keys__
+    for metadata, rows in batches:
+        if "mean_type" in known:
+            metadata = {
+                **metadata,
+                "mean_type": models.StatisticMeanType.ARITHMETIC
+                if metadata["has_mean"]
+                else models.StatisticMeanType.NONE,
+            }
+        async_add_external_statistics(
+            hass, {key: value for key, value in metadata.items() if key in known}, rows
+        )
+    _LOGGER.debug("Gaggiuino imported %s statistics", len(batches))
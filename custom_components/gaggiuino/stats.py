@@ -0,0 +1,84 @@
+"""Poll loop instrumentation for Gaggiuino integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Final
+
+# Latency samples kept per endpoint for the percentiles
+STATS_WINDOW: Final = 200
+
+
+class LatencyStats:
+    """Latencies of the most recent calls, with request and error counts."""
+
+    __slots__ = ("errors", "last_error", "requests", "samples")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Milliseconds
+        self.samples: deque[float] = deque(maxlen=STATS_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.last_error: str | None = None
+
+    def record(self, milliseconds: float, error: BaseException | None = None) -> None:
+        """Record one call."""
+        self.samples.append(milliseconds)
+        self.requests += 1
+        if error is not None:
+            self.errors += 1
+            self.last_error = type(error).__name__
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a latency percentile in milliseconds, nearest rank."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = round(percent / 100 * len(ordered)) - 1
+        return round(ordered[max(0, min(len(ordered) - 1, rank))], 1)
+
+    @property
+    def last(self) -> float | None:
+        """Return the latency of the last call in milliseconds."""
+        return round(self.samples[-1], 1) if self.samples else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": round(max(self.samples), 1) if self.samples else None,
+            "requests": self.requests,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+class PollStats:
+    """Per-endpoint and per-cycle statistics of one coordinator."""
+
+    __slots__ = ("cycle", "endpoints", "overruns")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, LatencyStats] = {}
+        self.cycle = LatencyStats()
+        # Cycles that took longer than the poll interval they started with
+        self.overruns = 0
+
+    def endpoint(self, endpoint: str) -> LatencyStats:
+        """Return the statistics of an endpoint."""
+        if (stats := self.endpoints.get(endpoint)) is None:
+            stats = self.endpoints[endpoint] = LatencyStats()
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "cycle": self.cycle.as_dict(),
+            "overruns": self.overruns,
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()
+            },
+        }
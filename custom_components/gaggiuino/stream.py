@@ -0,0 +1,116 @@
+"""Live status stream for Gaggiuino integration."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Final
+
+from aiohttp import ClientError, WSMsgType
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+_LOGGER = logging.getLogger(__name__)
+
+STREAM_PATH: Final = "/ws"
+STREAM_HEARTBEAT: Final = 15
+STREAM_RECONNECT_MIN: Final = 1.0
+STREAM_RECONNECT_MAX: Final = 60.0
+
+# Web UI message fields mapped to GaggiuinoStatus fields and their types
+STREAM_STATUS_FIELDS: Final[dict[str, tuple[str, Callable[[Any], Any]]]] = {
+    "temperature": ("temperature", float),
+    "targetTemperature": ("targetTemperature", float),
+    "pressure": ("pressure", float),
+    "weight": ("weight", float),
+    "shotWeight": ("weight", float),
+    "waterLevel": ("waterLevel", int),
+    "brewActive": ("brewSwitchState", bool),
+    "steamActive": ("steamSwitchState", bool),
+    "timeAlive": ("upTime", int),
+}
+STREAM_STATUS_ACTIONS: Final = (
+    "sensor_data_update",
+    "shot_data_update",
+    "system_state_update",
+)
+
+
+def parse_status_message(message: dict[str, Any]) -> dict[str, Any]:
+    """Return the status fields carried by a web UI message, keyed by status field."""
+    if message.get("action") not in STREAM_STATUS_ACTIONS:
+        return {}
+    data = message.get("data")
+    if not isinstance(data, dict):
+        return {}
+
+    fields: dict[str, Any] = {}
+    for key, (status_field, convert) in STREAM_STATUS_FIELDS.items():
+        if (value := data.get(key)) is None:
+            continue
+        try:
+            fields[status_field] = convert(value)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Gaggiuino stream ignored %s=%r: %s", key, value, err)
+    return fields
+
+
+class GaggiuinoStatusStream:
+    """
+    WebSocket client of the Gaggiuino web UI live data channel.
+
+    Status deltas are passed to on_status. on_connection reports when the stream
+    goes up or down, so the caller can fall back to polling.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        base_url: str,
+        on_status: Callable[[dict[str, Any]], None],
+        on_connection: Callable[[bool], None],
+    ) -> None:
+        """Initialize."""
+        self._session = session
+        self._url = f"{base_url.rstrip('/')}{STREAM_PATH}"
+        self._on_status = on_status
+        self._on_connection = on_connection
+        self.connected = False
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected != self.connected:
+            self.connected = connected
+            self._on_connection(connected)
+
+    async def run(self) -> None:
+        """Keep the stream connected until cancelled."""
+        delay = STREAM_RECONNECT_MIN
+        while True:
+            try:
+                async with self._session.ws_connect(
+                    self._url, heartbeat=STREAM_HEARTBEAT
+                ) as websocket:
+                    _LOGGER.debug("Gaggiuino stream connected to %s", self._url)
+                    delay = STREAM_RECONNECT_MIN
+                    self._set_connected(True)
+                    async for msg in websocket:
+                        if msg.type != WSMsgType.TEXT:
+                            continue
+                        try:
+                            message = json.loads(msg.data)
+                        except ValueError:
+                            continue
+                        if isinstance(message, dict) and (
+                            fields := parse_status_message(message)
+                        ):
+                            self._on_status(fields)
+            except (ClientError, TimeoutError) as err:
+                _LOGGER.debug("Gaggiuino stream error: %s %s", type(err), err)
+            finally:
+                self._set_connected(False)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_RECONNECT_MAX)
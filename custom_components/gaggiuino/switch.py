@@ -7,9 +7,9 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SETTINGS_GROUP_LED, SETTINGS_GROUP_SCALES
+from .entity import GaggiuinoEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -38,7 +38,7 @@ async def async_setup_entry(
     )
 
 
-class GaggiuinoLedDiscoSwitch(CoordinatorEntity, SwitchEntity):
+class GaggiuinoLedDiscoSwitch(GaggiuinoEntity, SwitchEntity):
     """Representation of a Gaggiuino LED disco switch."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -56,32 +56,30 @@ class GaggiuinoLedDiscoSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return None
-        return self.coordinator.led_settings.disco
+        return self.coordinator.data.led_settings.disco
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return
 
-        new_settings = self.coordinator.led_settings.to_api_dict()
-        new_settings["disco"] = True
-
-        await self.coordinator.update_led_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_LED, {"disco": True}
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the switch off."""
-        if self.coordinator.led_settings is None:
+        if self.coordinator.data.led_settings is None:
             return
 
-        new_settings = self.coordinator.led_settings.to_api_dict()
-        new_settings["disco"] = False
-
-        await self.coordinator.update_led_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_LED, {"disco": False}
+        )
 
 
-class GaggiuinoForcePredictiveSwitch(CoordinatorEntity, SwitchEntity):
+class GaggiuinoForcePredictiveSwitch(GaggiuinoEntity, SwitchEntity):
     """Representation of a Gaggiuino force predictive switch."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -99,32 +97,30 @@ class GaggiuinoForcePredictiveSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return None
-        return self.coordinator.scales_settings.forcePredictive
+        return self.coordinator.data.scales_settings.forcePredictive
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["forcePredictive"] = True
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"forcePredictive": True}
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the switch off."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["forcePredictive"] = False
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"forcePredictive": False}
+        )
 
 
-class GaggiuinoHwScalesEnabledSwitch(CoordinatorEntity, SwitchEntity):
+class GaggiuinoHwScalesEnabledSwitch(GaggiuinoEntity, SwitchEntity):
     """Representation of a Gaggiuino hardware scales enabled switch."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -142,32 +138,30 @@ class GaggiuinoHwScalesEnabledSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return None
-        return self.coordinator.scales_settings.hwScalesEnabled
+        return self.coordinator.data.scales_settings.hwScalesEnabled
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["hwScalesEnabled"] = True
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"hwScalesEnabled": True}
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the switch off."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["hwScalesEnabled"] = False
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"hwScalesEnabled": False}
+        )
 
 
-class GaggiuinoBtScalesEnabledSwitch(CoordinatorEntity, SwitchEntity):
+class GaggiuinoBtScalesEnabledSwitch(GaggiuinoEntity, SwitchEntity):
     """Representation of a Gaggiuino Bluetooth scales enabled switch."""
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -185,26 +179,24 @@ class GaggiuinoBtScalesEnabledSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return None
-        return self.coordinator.scales_settings.btScalesEnabled
+        return self.coordinator.data.scales_settings.btScalesEnabled
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["btScalesEnabled"] = True
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"btScalesEnabled": True}
+        )
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the switch off."""
-        if self.coordinator.scales_settings is None:
+        if self.coordinator.data.scales_settings is None:
             return
 
-        new_settings = self.coordinator.scales_settings.to_api_dict()
-        new_settings["btScalesEnabled"] = False
-
-        await self.coordinator.update_scales_settings(new_settings)
+        await self.coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"btScalesEnabled": False}
+        )
@@ -0,0 +1,263 @@
+"""Benchmark harness for the Gaggiuino coordinator poll loop."""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from custom_components.gaggiuino import (
+    binary_sensor,
+    light,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.gaggiuino.const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity
+
+    from custom_components.gaggiuino.coordinator import (
+        GaggiuinoDataUpdateCoordinator,
+    )
+
+    from .fake_gaggiuino import FakeGaggiuino
+
+PLATFORM_MODULES = (binary_sensor, light, number, select, sensor, switch)
+
+
+@dataclass
+class TimingStats:
+    """Summary of a series of timings, in milliseconds."""
+
+    samples: list[float] = field(default_factory=list)
+
+    def add(self, seconds: float) -> None:
+        """Record one timing."""
+        self.samples.append(seconds * 1000)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean."""
+        return statistics.fmean(self.samples) if self.samples else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return the given percentile, nearest rank."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    @property
+    def maximum(self) -> float:
+        """Return the slowest timing."""
+        return max(self.samples, default=0.0)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the summary as a dict."""
+        return {
+            "count": len(self.samples),
+            "mean_ms": round(self.mean, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "max_ms": round(self.maximum, 3),
+        }
+
+
+@dataclass
+class CycleResult:
+    """Result of a poll loop benchmark."""
+
+    latency: TimingStats
+    requests: int
+    cycles: int
+    failures: int
+    max_in_flight: int
+
+    @property
+    def requests_per_cycle(self) -> float:
+        """Return the mean number of HTTP requests per cycle."""
+        return self.requests / self.cycles if self.cycles else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as a dict."""
+        return {
+            **self.latency.as_dict(),
+            "requests_per_cycle": round(self.requests_per_cycle, 2),
+            "failures": self.failures,
+            "max_in_flight": self.max_in_flight,
+        }
+
+
+@dataclass
+class FanOutResult:
+    """Result of an entity update fan-out benchmark."""
+
+    entities: int
+    dispatch: TimingStats
+    writes: int
+    rounds: int
+
+    @property
+    def writes_per_round(self) -> float:
+        """Return the mean number of state writes per coordinator update."""
+        return self.writes / self.rounds if self.rounds else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as a dict."""
+        return {
+            "entities": self.entities,
+            **self.dispatch.as_dict(),
+            "writes_per_round": round(self.writes_per_round, 2),
+        }
+
+
+async def refresh(coordinator: GaggiuinoDataUpdateCoordinator) -> None:
+    """Run one poll cycle and wait for the shot downloads it started."""
+    coordinator.data = await coordinator._async_update_data()
+    if coordinator._ingest_task is not None:
+        await coordinator._ingest_task
+
+
+async def measure_cycles(
+    coordinator: GaggiuinoDataUpdateCoordinator,
+    server: FakeGaggiuino,
+    cycles: int,
+    between: Callable[[int], None] | None = None,
+) -> CycleResult:
+    """
+    Run _async_update_data repeatedly and time each cycle.
+
+    between is called with the cycle number before each cycle, to change the
+    machine state while the loop runs.
+    """
+    latency = TimingStats()
+    failures = 0
+    server.reset_counters()
+    for cycle in range(cycles):
+        if between is not None:
+            between(cycle)
+        started = time.perf_counter()
+        try:
+            coordinator.data = await coordinator._async_update_data()
+        except Exception:
+            failures += 1
+        latency.add(time.perf_counter() - started)
+    return CycleResult(
+        latency=latency,
+        requests=server.total_requests,
+        cycles=cycles,
+        failures=failures,
+        max_in_flight=server.max_in_flight,
+    )
+
+
+async def create_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> list[Entity]:
+    """
+    Create the entities of every platform, without registering them.
+
+    Like a fresh install, entities disabled by default are left out.
+    """
+    entities: list[Entity] = []
+
+    def add_entities(new_entities: Any, _update_before_add: bool = False) -> None:
+        entities.extend(
+            entity for entity in new_entities if entity.entity_registry_enabled_default
+        )
+
+    for module in PLATFORM_MODULES:
+        await module.async_setup_entry(hass, entry, add_entities)
+    return entities
+
+
+async def measure_fan_out(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    rounds: int,
+    mutate: Callable[[int], Awaitable[None]],
+) -> FanOutResult:
+    """
+    Time how long a coordinator update takes to reach every entity.
+
+    State writes are counted instead of reaching the state machine, but the
+    entity state and attributes are still computed like a real write would.
+    mutate is awaited before each round to produce new coordinator data.
+    """
+    coordinator: GaggiuinoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    entities = await create_entities(hass, entry)
+    writes = 0
+
+    def counting_writer(entity: Entity) -> Callable[[], None]:
+        def write() -> None:
+            nonlocal writes
+            writes += 1
+            _ = (entity.available, entity.state, entity.extra_state_attributes)
+
+        return write
+
+    unsubscribe = []
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"bench.{DOMAIN}_{index}"
+        entity.async_write_ha_state = counting_writer(entity)  # type: ignore[method-assign]
+        unsubscribe.append(
+            coordinator.async_add_listener(entity._handle_coordinator_update)
+        )
+
+    dispatch = TimingStats()
+    try:
+        for round_number in range(rounds):
+            await mutate(round_number)
+            started = time.perf_counter()
+            coordinator.async_update_listeners()
+            dispatch.add(time.perf_counter() - started)
+    finally:
+        for remove in unsubscribe:
+            remove()
+        for entity in entities:
+            if (
+                will_remove := getattr(entity, "async_will_remove_from_hass", None)
+            ) is not None:
+                await will_remove()
+
+    return FanOutResult(
+        entities=len(entities), dispatch=dispatch, writes=writes, rounds=rounds
+    )
+
+
+async def measure_memory(
+    create: Callable[[], Awaitable[GaggiuinoDataUpdateCoordinator]],
+    count: int,
+) -> float:
+    """Return the memory held per coordinator after one refresh, in KiB."""
+    coordinators = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(count):
+            coordinator = await create()
+            coordinator.data = await coordinator._async_update_data()
+            coordinators.append(coordinator)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+    return total / count / 1024
@@ -0,0 +1,114 @@
+"""Fixtures for the Gaggiuino benchmarks."""
+
+from __future__ import annotations
+
+import inspect
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_URL
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.gaggiuino.const import DOMAIN, TIER_SCAN_INTERVALS
+from custom_components.gaggiuino.coordinator import GaggiuinoDataUpdateCoordinator
+from custom_components.gaggiuino.fleet import GaggiuinoFleet
+
+from .fake_gaggiuino import FakeGaggiuino
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+    from pathlib import Path
+
+    CoordinatorFactory = Callable[..., Awaitable[GaggiuinoDataUpdateCoordinator]]
+    RecordBenchmark = Callable[[str, dict[str, Any]], None]
+
+BENCHMARK_RESULTS: dict[str, dict[str, Any]] = {}
+# Makes every endpoint due on every cycle
+ALL_TIERS_DUE = {conf: 0 for conf, _default in TIER_SCAN_INTERVALS.values()}
+
+
+def make_config_entry(url: str, options: dict[str, Any] | None = None) -> ConfigEntry:
+    """Return a config entry for the fake server, across Home Assistant versions."""
+    kwargs: dict[str, Any] = {
+        "version": 2,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": "Gaggiuino",
+        "data": {CONF_URL: url},
+        "source": config_entries.SOURCE_USER,
+        "options": options or {},
+        "unique_id": None,
+    }
+    parameters = inspect.signature(ConfigEntry).parameters
+    if "discovery_keys" in parameters:
+        kwargs["discovery_keys"] = {}
+    if "subentries_data" in parameters:
+        kwargs["subentries_data"] = None
+    entry = ConfigEntry(**kwargs)
+    config_entries.current_entry.set(entry)
+    return entry
+
+
+@pytest.fixture
+async def hass(tmp_path: Path) -> AsyncIterator[HomeAssistant]:
+    """Return a bare Home Assistant instance with its registries loaded."""
+    instance = HomeAssistant(str(tmp_path))
+    instance.data[DOMAIN] = {}
+    await dr.async_load(instance)
+    await er.async_load(instance)
+    yield instance
+    await instance.async_stop(force=True)
+
+
+@pytest.fixture
+async def fake_gaggiuino() -> AsyncIterator[FakeGaggiuino]:
+    """Return a running fake Gaggiuino server."""
+    server = FakeGaggiuino()
+    await server.start()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+def coordinator_factory(
+    hass: HomeAssistant, fake_gaggiuino: FakeGaggiuino
+) -> Callable[..., Awaitable[GaggiuinoDataUpdateCoordinator]]:
+    """Return a factory of coordinators polling the fake server."""
+
+    async def create(
+        options: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        fleet: GaggiuinoFleet | None = None,
+    ) -> GaggiuinoDataUpdateCoordinator:
+        entry = make_config_entry(fake_gaggiuino.url, options)
+        coordinator = GaggiuinoDataUpdateCoordinator(hass, entry, fleet)
+        if timeout is not None:
+            coordinator.api.timeout = timeout
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+        return coordinator
+
+    return create
+
+
+@pytest.fixture
+def record_benchmark() -> Callable[[str, dict[str, Any]], None]:
+    """Return a function storing a benchmark result for the terminal summary."""
+
+    def record(name: str, result: dict[str, Any]) -> None:
+        BENCHMARK_RESULTS[name] = result
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Print the benchmark results."""
+    if not BENCHMARK_RESULTS:
+        return
+    terminalreporter.section("Gaggiuino benchmarks")
+    for name, result in BENCHMARK_RESULTS.items():
+        terminalreporter.write_line(f"{name}: {json.dumps(result)}")
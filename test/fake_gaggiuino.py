@@ -0,0 +1,307 @@
+"""Local stand-in for the Gaggiuino web server."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Final, Literal
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+FaultKind = Literal["timeout", "error", "disconnect"]
+
+DEFAULT_STATUS: Final = {
+    "upTime": "1000",
+    "profileId": "1",
+    "profileName": "Profile 1",
+    "targetTemperature": "93.000000",
+    "temperature": "92.950000",
+    "pressure": "0.000000",
+    "waterLevel": "80",
+    "weight": "0.000000",
+    "brewSwitchState": False,
+    "steamSwitchState": False,
+}
+
+DEFAULT_SETTINGS: Final = {
+    "boiler": {
+        "steamSetPoint": 145,
+        "offsetTemp": 5,
+        "hpwr": 1200,
+        "mainDivider": 2,
+        "brewDivider": 4,
+        "brewDeltaState": True,
+        "dreamSteamState": False,
+        "startupHeatDelta": 10,
+    },
+    "system": {
+        "pumpFlowAtZero": 0.5,
+        "timezoneOffsetMinutes": 0,
+        "sprofilerToken": "",
+        "visualizerToken": "",
+        "servicesState": True,
+        "wifiEnabled": True,
+        "releaseChannel": 0,
+    },
+    "led": {
+        "color": {"R": 255, "G": 128, "B": 0},
+        "state": True,
+        "disco": False,
+        "tof": {"max": 100, "min": 10},
+    },
+    "scales": {
+        "forcePredictive": False,
+        "hwScalesEnabled": True,
+        "hwScalesF1": 1000,
+        "hwScalesF2": 2000,
+        "btScalesEnabled": False,
+        "btScalesAutoConnect": False,
+    },
+    "display": {
+        "lcdBrightness": 80,
+        "lcdDarkMode": False,
+        "lcdSleep": 10,
+        "lcdGoHome": 5,
+    },
+    "theme": {"colourPrimary": 31, "colourSecondary": 63488},
+    "versions": {
+        "coreVersion": "a06f97fd",
+        "frontVersion": "a06f97fd",
+        "staticVersion": "a06f97fd",
+    },
+}
+
+
+def make_profile(profile_id: int, name: str | None = None) -> dict[str, Any]:
+    """Return a profile as served by /api/profiles/all."""
+    return {
+        "id": profile_id,
+        "name": name or f"Profile {profile_id}",
+        "selected": profile_id == 1,
+        "globalStopConditions": {"weight": 36},
+        "phases": [
+            {
+                "restriction": 2,
+                "skip": False,
+                "stopConditions": {"pressureAbove": 2, "time": 15000},
+                "target": {"curve": "INSTANT", "end": 2, "time": 10000},
+                "type": "FLOW",
+            },
+            {
+                "restriction": 9,
+                "skip": False,
+                "stopConditions": {},
+                "target": {"curve": "LINEAR", "end": 9, "start": 2, "time": 5000},
+                "type": "PRESSURE",
+            },
+        ],
+        "recipe": {"coffeeIn": 18, "coffeeOut": 36},
+        "waterTemperature": 93,
+    }
+
+
+def make_shot(shot_id: int, samples: int = 300) -> dict[str, Any]:
+    """Return a shot as served by /api/shots/{id}, values scaled by 10."""
+    time_in_shot = [i * 1 for i in range(samples)]
+    pressure = [min(90, i * 2) for i in range(samples)]
+    weight = [max(0, (i - 60) * 2) for i in range(samples)]
+    return {
+        "id": shot_id,
+        "timestamp": 1_700_000_000 + shot_id * 600,
+        "duration": samples,
+        "profile": make_profile(1, "Default"),
+        "datapoints": {
+            "timeInShot": time_in_shot,
+            "pressure": pressure,
+            "pumpFlow": [20] * samples,
+            "weightFlow": [20 if w else 0 for w in weight],
+            "shotWeight": weight,
+            "temperature": [930] * samples,
+            "targetPressure": [90] * samples,
+            "targetPumpFlow": [20] * samples,
+            "targetTemperature": [930] * samples,
+            "waterPumped": [i * 2 for i in range(samples)],
+        },
+    }
+
+
+@dataclass
+class Fault:
+    """A failure injected into one endpoint."""
+
+    kind: FaultKind
+    rate: float = 1.0
+
+
+class FakeGaggiuino:
+    """
+    Emulates the REST endpoints used by gaggiuino_api.
+
+    Every response is delayed by latency plus a random jitter. Faults make an
+    endpoint hang (timeout), answer 500 (error) or drop the connection
+    (disconnect) for the given share of requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        timeout_delay: float = 30.0,
+        profiles: int = 5,
+        seed: int = 0,
+    ) -> None:
+        """Initialize."""
+        self.latency = latency
+        self.jitter = jitter
+        self.timeout_delay = timeout_delay
+        self.status: dict[str, Any] = dict(DEFAULT_STATUS)
+        self.settings: dict[str, Any] = copy.deepcopy(DEFAULT_SETTINGS)
+        self.profiles: list[dict[str, Any]] = [
+            make_profile(i) for i in range(1, profiles + 1)
+        ]
+        self.latest_shot_id = 1
+        # Served instead of the generated shot with the same ID
+        self.shots: dict[int, Any] = {}
+        # Web UI messages sent on /ws before closing it, None without the stream
+        self.stream_messages: list[dict[str, Any]] | None = None
+        self.firmware_progress: dict[str, Any] = {
+            "progress": 0,
+            "status": "IDLE",
+            "type": "F_FW",
+        }
+        self.faults: dict[str, Fault] = {}
+        self.requests: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._random = random.Random(seed)
+        self._server: TestServer | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the running server."""
+        if self._server is None:
+            msg = "Fake Gaggiuino server is not started"
+            raise RuntimeError(msg)
+        return str(self._server.make_url("")).rstrip("/")
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests served."""
+        return sum(self.requests.values())
+
+    def inject_fault(self, path: str, kind: FaultKind, rate: float = 1.0) -> None:
+        """Make requests to path fail."""
+        self.faults[path] = Fault(kind, rate)
+
+    def clear_faults(self) -> None:
+        """Remove all injected faults."""
+        self.faults.clear()
+
+    def reset_counters(self) -> None:
+        """Forget request statistics."""
+        self.requests.clear()
+        self.max_in_flight = 0
+
+    async def start(self) -> str:
+        """Start the server and return its base URL."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._server = TestServer(app)
+        await self._server.start_server()
+        return self.url
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        path = request.path
+        self.requests[f"{request.method} {path}"] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(
+                self.latency + self._random.uniform(0, self.jitter)
+                if self.jitter
+                else self.latency
+            )
+            if (fault := self.faults.get(path)) is not None and (
+                self._random.random() < fault.rate
+            ):
+                return await self._fail(request, fault)
+            return await self._route(request)
+        finally:
+            self.in_flight -= 1
+
+    async def _fail(self, request: web.Request, fault: Fault) -> web.StreamResponse:
+        if fault.kind == "timeout":
+            await asyncio.sleep(self.timeout_delay)
+            return web.Response(status=504)
+        if fault.kind == "disconnect":
+            if request.transport is not None:
+                request.transport.close()
+            return web.Response(status=500)
+        return web.Response(status=500, text="injected error")
+
+    def _save_profile(self, profile: dict[str, Any]) -> dict[str, Any]:
+        """Replace the profile with the same ID, or add it with a new ID."""
+        for index, existing in enumerate(self.profiles):
+            if existing["id"] == profile.get("id"):
+                self.profiles[index] = {**existing, **profile}
+                return self.profiles[index]
+        profile["id"] = max((p["id"] for p in self.profiles), default=0) + 1
+        self.profiles.append(profile)
+        return profile
+
+    async def _route(self, request: web.Request) -> web.StreamResponse:
+        path = request.path.removeprefix("/api")
+        method = request.method
+
+        if path == "/system/status":
+            return web.json_response([self.status])
+        if path == "/profiles/all":
+            return web.json_response(self.profiles)
+        if path == "/profiles/save" and method == "POST":
+            return web.json_response(self._save_profile(await request.json()))
+        if path.startswith("/profile-select/"):
+            profile_id = int(path.rsplit("/", 1)[1])
+            if method == "POST":
+                self.status["profileId"] = str(profile_id)
+            return web.json_response({})
+        if path == "/health":
+            return web.json_response({"status": "ok"})
+        if path == "/shots/latest":
+            return web.json_response([{"lastShotId": str(self.latest_shot_id)}])
+        if path.startswith("/shots/"):
+            shot_id = int(path.rsplit("/", 1)[1])
+            if not 0 < shot_id <= self.latest_shot_id:
+                return web.Response(status=404)
+            return web.json_response(self.shots.get(shot_id) or make_shot(shot_id))
+        if path == "/settings":
+            return web.json_response(self.settings)
+        if path.startswith("/settings/"):
+            group = path.rsplit("/", 1)[1]
+            if group not in self.settings:
+                return web.Response(status=404)
+            if method == "POST":
+                self.settings[group] = await request.json()
+            return web.json_response(self.settings[group])
+        if path == "/firmware/progress":
+            return web.json_response(self.firmware_progress)
+        if path == "/ws" and self.stream_messages is not None:
+            websocket = web.WebSocketResponse()
+            await websocket.prepare(request)
+            for message in self.stream_messages:
+                await websocket.send_json(message)
+            await websocket.close()
+            return websocket
+        if path == "/firmware/update-all":
+            return web.json_response({})
+        return web.Response(status=404)
@@ -0,0 +1,545 @@
+"""Benchmarks of the Gaggiuino coordinator poll loop against a fake machine."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from dataclasses import replace
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from gaggiuino_api import GaggiuinoStatus
+
+from custom_components.gaggiuino import coordinator as coordinator_module
+from custom_components.gaggiuino import fleet as fleet_module
+from custom_components.gaggiuino import (
+    sensor,
+)
+from custom_components.gaggiuino.const import (
+    BREAKER_FAILURE_THRESHOLD,
+    CONF_LIVE_SCAN_INTERVAL,
+    CONF_MIN_WRITE_INTERVAL,
+    DOMAIN,
+    SETTINGS_GROUP_LED,
+    SETTINGS_GROUP_SCALES,
+)
+from custom_components.gaggiuino.coordinator import GaggiuinoDataUpdateCoordinator
+from custom_components.gaggiuino.fleet import GaggiuinoFleet
+from custom_components.gaggiuino.heatup import GaggiuinoHeatUpModel
+from custom_components.gaggiuino.live import ShotTracker
+from custom_components.gaggiuino.services import async_setup_services
+from custom_components.gaggiuino.statistics import shot_statistics
+
+from .benchmark import measure_cycles, measure_fan_out, measure_memory, refresh
+from .conftest import ALL_TIERS_DUE
+from .fake_gaggiuino import make_profile
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory, RecordBenchmark
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+CYCLES = 50
+PROFILES_REQUEST = "GET /api/profiles/all"
+
+
+# Run in a fresh interpreter, with the Home Assistant modules preloaded like at startup
+IMPORT_SCRIPT = """
+import json, sys, time
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+started = time.perf_counter()
+import custom_components.gaggiuino
+print(json.dumps({
+    "ms": (time.perf_counter() - started) * 1000,
+    "deferred": [name for name in ("httpx", "sqlite3") if name not in sys.modules],
+}))
+"""
+
+
+async def test_integration_import_time(record_benchmark: RecordBenchmark) -> None:
+    """Time loading the integration module and check heavy modules stay unloaded."""
+    timings = []
+    for _ in range(3):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            IMPORT_SCRIPT,
+            cwd=Path(__file__).parent.parent,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        output, _stderr = await process.communicate()
+        assert process.returncode == 0
+        result = json.loads(output)
+        timings.append(result["ms"])
+    record_benchmark(
+        "integration import",
+        {"min_ms": round(min(timings), 1), "deferred": result["deferred"]},
+    )
+
+    assert result["deferred"] == ["httpx", "sqlite3"]
+
+
+async def test_poll_cycle_latency(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time poll cycles against a machine with realistic latency and jitter."""
+    fake_gaggiuino.latency = 0.005
+    fake_gaggiuino.jitter = 0.01
+    coordinator = await coordinator_factory()
+
+    result = await measure_cycles(coordinator, fake_gaggiuino, CYCLES)
+    record_benchmark("poll cycle", result.as_dict())
+
+    assert result.failures == 0
+    assert coordinator.gaggiuino_online
+    assert result.requests_per_cycle >= 1
+    await coordinator.async_shutdown()
+
+
+async def test_requests_per_cycle(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Count the requests of the first and of the following poll cycles."""
+    coordinator = await coordinator_factory()
+
+    first = await measure_cycles(coordinator, fake_gaggiuino, 1)
+    steady = await measure_cycles(coordinator, fake_gaggiuino, CYCLES)
+    record_benchmark(
+        "requests per cycle",
+        {
+            "first": first.requests_per_cycle,
+            "steady": round(steady.requests_per_cycle, 2),
+            "by_endpoint": dict(fake_gaggiuino.requests),
+        },
+    )
+
+    assert first.failures == steady.failures == 0
+    assert steady.requests_per_cycle <= first.requests_per_cycle
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.parametrize("kind", ["timeout", "error", "disconnect"])
+async def test_poll_cycle_with_faults(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+    kind: Any,
+) -> None:
+    """Time poll cycles while the health endpoint fails."""
+    fake_gaggiuino.timeout_delay = 1.0
+    fake_gaggiuino.inject_fault("/api/health", kind, rate=0.5)
+    coordinator = await coordinator_factory(ALL_TIERS_DUE, timeout=0.1)
+
+    result = await measure_cycles(coordinator, fake_gaggiuino, 10)
+    record_benchmark(f"poll cycle, health {kind}", result.as_dict())
+
+    # A failing health check does not fail the cycle
+    assert result.failures == 0
+    await coordinator.async_shutdown()
+
+
+async def test_poll_cycle_machine_offline(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time poll cycles while the machine drops every status request."""
+    fake_gaggiuino.inject_fault("/api/system/status", "disconnect")
+    coordinator = await coordinator_factory()
+
+    result = await measure_cycles(coordinator, fake_gaggiuino, 10)
+    record_benchmark("poll cycle, offline", result.as_dict())
+
+    assert result.failures == 0
+    assert not coordinator.gaggiuino_online
+    await coordinator.async_shutdown()
+
+
+async def test_offline_circuit_breaker(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Count the requests to a switched off machine while the circuit is open."""
+    for path in ("/api/system/status", "/api/health"):
+        fake_gaggiuino.inject_fault(path, "disconnect")
+    coordinator = await coordinator_factory()
+    await measure_cycles(coordinator, fake_gaggiuino, BREAKER_FAILURE_THRESHOLD)
+    assert coordinator.breaker.is_open
+
+    backoff: list[float] = []
+    result = await measure_cycles(
+        coordinator,
+        fake_gaggiuino,
+        CYCLES,
+        between=lambda _cycle: backoff.append(coordinator.poll_interval),
+    )
+    probes = dict(fake_gaggiuino.requests)
+    record_benchmark(
+        "offline, circuit open",
+        {
+            "requests_per_cycle": round(result.requests_per_cycle, 2),
+            "by_endpoint": probes,
+            "first_backoff_s": backoff[0],
+            "last_backoff_s": backoff[-1],
+        },
+    )
+
+    # Only the health endpoint is probed, once per cycle
+    assert result.requests_per_cycle <= 1
+    await coordinator.async_shutdown()
+
+
+async def test_restore_snapshot(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time restoring the last known state while the machine is switched off."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await coordinator.async_shutdown()
+
+    fake_gaggiuino.reset_counters()
+    fake_gaggiuino.timeout_delay = 1.0
+    fake_gaggiuino.inject_fault("/api/system/status", "timeout")
+    restarted = GaggiuinoDataUpdateCoordinator(hass, coordinator.entry)
+    started = time.perf_counter()
+    assert await restarted.async_restore()
+    restore_ms = (time.perf_counter() - started) * 1000
+    record_benchmark("restore snapshot", {"ms": round(restore_ms, 3)})
+
+    assert fake_gaggiuino.total_requests == 0
+    await restarted.async_shutdown()
+
+
+async def test_data_reads(
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time the status reads of entity states and size the data of one cycle."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    data = coordinator.data
+    readers = [
+        description.value_fn
+        for description in sensor.SENSORS
+        if description.value_fn is not None
+    ]
+    reads = 100_000
+    started = time.perf_counter()
+    for _ in range(reads // len(readers)):
+        for read in readers:
+            read(coordinator)
+    read_ns = (time.perf_counter() - started) * 1e9 / reads
+    record_benchmark(
+        "data reads",
+        {"read_ns": round(read_ns, 1), "data_bytes": sys.getsizeof(data)},
+    )
+    await coordinator.async_shutdown()
+
+
+async def test_live_shot_metrics(
+    fake_gaggiuino: FakeGaggiuino,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time the live metrics per status sample."""
+    tracker = ShotTracker()
+    samples = 100_000
+    brewing = GaggiuinoStatus.from_dict(
+        {**fake_gaggiuino.status, "brewSwitchState": True}
+    )
+    statuses = [
+        replace(brewing, weight=2.0 * (index / 10), pressure=9.0 - index / 100)
+        for index in range(400)
+    ]
+    started = time.perf_counter()
+    for index in range(samples):
+        tracker.update(statuses[index % 400], index / 10, 36.0)
+    update_ns = (time.perf_counter() - started) * 1e9 / samples
+    record_benchmark("live shot metrics", {"update_ns": round(update_ns, 1)})
+
+    assert tracker.active
+
+
+async def test_heatup_model(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time the warm-up model per status sample."""
+    cold = GaggiuinoStatus.from_dict(
+        {**fake_gaggiuino.status, "targetTemperature": "93.0", "temperature": "25.0"}
+    )
+    warm_up = [
+        replace(cold, temperature=min(93.0, 25.0 + 0.25 * seconds))
+        for seconds in range(0, 300, 2)
+    ]
+    model = GaggiuinoHeatUpModel(hass, "machine")
+    started = time.perf_counter()
+    for index, status in enumerate(warm_up):
+        model.update(status, index * 2)
+    update_ns = (time.perf_counter() - started) * 1e9 / len(warm_up)
+    record_benchmark("heat-up model", {"update_ns": round(update_ns)})
+
+    assert model.ready
+
+
+async def test_shot_statistics(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Count the recorder writes of a download batch and time building them."""
+    imports: list[list[tuple[dict[str, Any], list[dict[str, Any]]]]] = []
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_import_statistics",
+        lambda _hass, batches: imports.append(batches),
+    )
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await hass.async_block_till_done()
+    hass.config.components.add("recorder")
+    fake_gaggiuino.latest_shot_id = 13
+    await coordinator._async_ingest_shots(13)
+
+    hours = {int(row["start"].timestamp()) for row in imports[0][-1][1]}
+    started = time.perf_counter()
+    await hass.async_add_executor_job(
+        shot_statistics, coordinator.shot_archive, "machine", "Gaggiuino", hours
+    )
+    build_ms = (time.perf_counter() - started) * 1000
+    record_benchmark(
+        "shot statistics",
+        {"shots": 12, "writes": len(imports[0]), "ms": round(build_ms, 3)},
+    )
+
+    assert len(imports) == 1
+    await coordinator.async_shutdown()
+
+
+async def test_export_shots(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time exporting the curves of stored shots to CSV."""
+    async_setup_services(hass)
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await hass.async_block_till_done()
+    fake_gaggiuino.latest_shot_id = 13
+    await coordinator._async_ingest_shots(13)
+
+    started = time.perf_counter()
+    result = await hass.services.async_call(
+        DOMAIN,
+        "export_shots",
+        {"config_entry_id": coordinator.entry.entry_id, "format": "csv"},
+        blocking=True,
+        return_response=True,
+    )
+    export_ms = (time.perf_counter() - started) * 1000
+    size = Path(result["path"]).stat().st_size
+    record_benchmark(
+        "export shots",
+        {
+            "shots": result["shots"],
+            "kib": round(size / 1024),
+            "ms": round(export_ms, 1),
+        },
+    )
+
+    assert result["shots"] == 13
+    await coordinator.async_shutdown()
+
+
+async def test_entity_fan_out(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Time the dispatch of coordinator updates to every entity."""
+    # Without throttling, every change reaches the state machine
+    coordinator = await coordinator_factory({CONF_MIN_WRITE_INTERVAL: 0})
+    # Let the first shot download settle so it does not count as a change
+    await refresh(coordinator)
+
+    async def unchanged(_round: int) -> None:
+        coordinator.data = await coordinator._async_update_data()
+
+    async def changed(round_number: int) -> None:
+        fake_gaggiuino.status["temperature"] = f"{90 + round_number % 5}.000000"
+        fake_gaggiuino.status["waterLevel"] = str(50 + round_number % 7)
+        coordinator.data = await coordinator._async_update_data()
+
+    idle = await measure_fan_out(hass, coordinator.entry, CYCLES, unchanged)
+    busy = await measure_fan_out(hass, coordinator.entry, CYCLES, changed)
+    record_benchmark("fan-out, unchanged", idle.as_dict())
+    record_benchmark("fan-out, changed", busy.as_dict())
+
+    assert idle.entities > 0
+    # Every entity writes once when first updated, then only on changes
+    assert idle.writes <= idle.entities
+    await coordinator.async_shutdown()
+
+
+async def test_memory_per_coordinator(
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Measure the memory one refreshed coordinator holds."""
+    per_coordinator = await measure_memory(coordinator_factory, 5)
+    record_benchmark("memory", {"kib_per_coordinator": round(per_coordinator, 1)})
+
+    assert per_coordinator > 0
+
+
+async def test_settings_write_requests(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Count the requests of one settings write."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    assert coordinator.led_settings is not None
+    fake_gaggiuino.reset_counters()
+
+    assert await coordinator.async_update_settings_fields(
+        SETTINGS_GROUP_LED, {"state": False}
+    )
+    record_benchmark("led toggle", {"requests": fake_gaggiuino.total_requests})
+
+    assert fake_gaggiuino.total_requests == 1
+    await coordinator.async_shutdown()
+
+
+async def test_coalesced_settings_writes(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Count the requests of several changes made to one group at once."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    fake_gaggiuino.reset_counters()
+
+    changes = [
+        {"hwScalesEnabled": False},
+        {"btScalesEnabled": True},
+        {"forcePredictive": True},
+    ]
+    results = await asyncio.gather(
+        *(
+            coordinator.async_update_settings_fields(SETTINGS_GROUP_SCALES, change)
+            for change in changes
+        )
+    )
+    record_benchmark(
+        "scales switches", {"changes": 3, "requests": fake_gaggiuino.total_requests}
+    )
+
+    assert all(results)
+    assert fake_gaggiuino.total_requests == 1
+    await coordinator.async_shutdown()
+
+
+async def test_profile_sync_requests(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+) -> None:
+    """Count profile downloads while polling and after a profile is added."""
+    fake_gaggiuino.profiles = [make_profile(i) for i in range(1, 51)]
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    await measure_cycles(coordinator, fake_gaggiuino, CYCLES)
+    steady = fake_gaggiuino.requests[PROFILES_REQUEST]
+
+    fake_gaggiuino.profiles.append(make_profile(51))
+    fake_gaggiuino.status.update(profileId="51", profileName="Profile 51")
+    await measure_cycles(coordinator, fake_gaggiuino, 3)
+    added = fake_gaggiuino.requests[PROFILES_REQUEST]
+    record_benchmark(
+        "profile downloads", {"steady": steady, "after selecting a new profile": added}
+    )
+
+    assert steady == 0
+    assert added == 1
+    await coordinator.async_shutdown()
+
+
+async def test_fleet_polls(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    record_benchmark: RecordBenchmark,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Drive several machines from one fleet and check staggering and concurrency."""
+    stagger = 0.05
+    monkeypatch.setattr(fleet_module, "FLEET_STAGGER", stagger)
+    fake_gaggiuino.latency = 0.01
+    fleet = GaggiuinoFleet(hass, max_requests=2)
+    starts: list[float] = []
+    coordinators = []
+    for _ in range(4):
+        coordinator = await coordinator_factory(
+            {CONF_LIVE_SCAN_INTERVAL: 0.2}, fleet=fleet
+        )
+        await refresh(coordinator)
+        refresh_now = coordinator.async_refresh
+
+        async def timed_refresh(refresh_now: Any = refresh_now) -> None:
+            starts.append(hass.loop.time())
+            await refresh_now()
+
+        coordinator.async_refresh = timed_refresh  # type: ignore[method-assign]
+        coordinators.append(coordinator)
+        fleet.async_add(coordinator)
+
+    fake_gaggiuino.reset_counters()
+    await asyncio.sleep(1)
+    gaps = [later - earlier for earlier, later in pairwise(sorted(starts))]
+    record_benchmark(
+        "fleet",
+        {
+            "machines": len(coordinators),
+            "polls": len(starts),
+            "min_gap_ms": round(min(gaps) * 1000, 1),
+            "max_in_flight": fake_gaggiuino.max_in_flight,
+            "cycle_latency_ms": [round(c.cycle_latency, 1) for c in coordinators],
+        },
+    )
+
+    assert len(starts) >= 2 * len(coordinators)
+    # Without staggering the polls would start together; allow for loop wake-up lag
+    assert min(gaps) >= stagger / 2
+    assert fake_gaggiuino.max_in_flight <= 2
+    for coordinator in coordinators:
+        fleet.async_remove(coordinator)
+        await coordinator.async_shutdown()
+    assert not fleet.machines
+    fleet.async_stop()
@@ -0,0 +1,73 @@
+"""Tests of the Gaggiuino circuit breaker."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.gaggiuino.breaker import CircuitBreaker
+from custom_components.gaggiuino.const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN,
+)
+
+from .benchmark import measure_cycles, refresh
+
+if TYPE_CHECKING:
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_backoff() -> None:
+    """Open after the threshold, then double the jittered delay up to the cap."""
+    breaker = CircuitBreaker(10.0, threshold=3, max_backoff=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert not breaker.is_open
+    assert breaker.retry_in is None
+
+    backoffs = []
+    for _ in range(6):
+        breaker.record_failure()
+        backoffs.append(breaker.retry_in)
+    assert breaker.state == BREAKER_OPEN
+    for backoff, ceiling in zip(backoffs, (10, 20, 40, 60, 60, 60), strict=True):
+        assert ceiling / 2 <= backoff <= ceiling
+
+    # Weeks offline at the longest backoff
+    for _ in range(5000):
+        breaker.record_failure()
+    assert 30 <= breaker.retry_in <= 60
+
+    breaker.record_success()
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.failures == 0
+    assert breaker.retry_in is None
+
+
+async def test_probe_until_back(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Only probe the health endpoint while open, and poll fully once it answers."""
+    for path in ("/api/system/status", "/api/health"):
+        fake_gaggiuino.inject_fault(path, "disconnect")
+    coordinator = await coordinator_factory()
+    await measure_cycles(coordinator, fake_gaggiuino, BREAKER_FAILURE_THRESHOLD)
+    assert coordinator.breaker.is_open
+
+    await measure_cycles(coordinator, fake_gaggiuino, 5)
+    assert set(fake_gaggiuino.requests) == {"GET /api/health"}
+    assert coordinator.poll_interval == coordinator.breaker.retry_in
+
+    fake_gaggiuino.clear_faults()
+    await refresh(coordinator)
+    assert coordinator.gaggiuino_online
+    assert not coordinator.breaker.is_open
+    assert fake_gaggiuino.requests["GET /api/profiles/all"] == 1
+    await coordinator.async_shutdown()
@@ -0,0 +1,127 @@
+"""Tests of the Gaggiuino data update coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.gaggiuino.const import (
+    DEFAULT_LIVE_SCAN_INTERVAL,
+    DEFAULT_SHOT_SCAN_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    TIER_CONFIG,
+)
+from custom_components.gaggiuino.coordinator import GaggiuinoDataUpdateCoordinator
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_restore_snapshot(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Show the last known state of a switched off machine after a restart."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await coordinator.async_shutdown()
+
+    fake_gaggiuino.reset_counters()
+    fake_gaggiuino.inject_fault("/api/system/status", "disconnect")
+    restarted = GaggiuinoDataUpdateCoordinator(hass, coordinator.entry)
+    assert await restarted.async_restore()
+    assert fake_gaggiuino.total_requests == 0
+    assert restarted.restored
+    assert restarted.data.restored
+    assert restarted.status == coordinator.status
+    assert restarted.profile_options == coordinator.profile_options
+    assert restarted.boiler_settings == coordinator.boiler_settings
+
+    fake_gaggiuino.clear_faults()
+    await refresh(restarted)
+    assert not restarted.restored
+    assert restarted.data.status == coordinator.status
+    await restarted.async_shutdown()
+
+
+async def test_nothing_to_restore(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Report a first start without a saved state."""
+    coordinator = await coordinator_factory()
+    assert not await coordinator.async_restore()
+    assert not coordinator.restored
+    assert fake_gaggiuino.total_requests == 0
+    await coordinator.async_shutdown()
+
+
+async def test_failed_tier_stays_due(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Fetch a failed endpoint again on the next cycle, not a tier interval later."""
+    coordinator = await coordinator_factory()
+    fake_gaggiuino.inject_fault("/api/settings", "error")
+    await refresh(coordinator)
+    assert coordinator.boiler_settings is None
+
+    fake_gaggiuino.clear_faults()
+    await refresh(coordinator)
+    assert fake_gaggiuino.requests["GET /api/settings"] == 2
+    assert coordinator.boiler_settings is not None
+
+    await refresh(coordinator)
+    assert fake_gaggiuino.requests["GET /api/settings"] == 2
+    # The state tier succeeded and keeps its own interval
+    assert fake_gaggiuino.requests["GET /api/health"] == 1
+    await coordinator.async_shutdown()
+
+
+async def test_shot_interval(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Poll faster while brewing, at most once a second without a fleet."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_LIVE_SCAN_INTERVAL)
+
+    fake_gaggiuino.status["brewSwitchState"] = True
+    await refresh(coordinator)
+    assert coordinator.poll_interval == DEFAULT_SHOT_SCAN_INTERVAL
+    assert coordinator.update_interval == timedelta(seconds=MIN_UPDATE_INTERVAL)
+
+    fake_gaggiuino.status["brewSwitchState"] = False
+    await refresh(coordinator)
+    assert coordinator.poll_interval == DEFAULT_LIVE_SCAN_INTERVAL
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_LIVE_SCAN_INTERVAL)
+    await coordinator.async_shutdown()
+
+
+async def test_stale_connection_retried(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Retry a read once when a reachable machine drops the connection."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    fake_gaggiuino.reset_counters()
+    fake_gaggiuino.inject_fault("/api/settings", "disconnect")
+    coordinator.mark_tier_due(TIER_CONFIG)
+    await refresh(coordinator)
+    assert fake_gaggiuino.requests["GET /api/settings"] == 2
+    await coordinator.async_shutdown()
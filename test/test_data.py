@@ -0,0 +1,55 @@
+"""Tests of the Gaggiuino coordinator data."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.gaggiuino.const import SETTINGS_GROUP_LED
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_data_frozen(coordinator_factory: CoordinatorFactory) -> None:
+    """Publish one immutable, slotted object per cycle."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    data = coordinator.data
+
+    assert not hasattr(data, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        data.online = False  # type: ignore[misc]
+    await coordinator.async_shutdown()
+
+
+async def test_data_follows_writes(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Publish optimistic and rolled back settings to the entities at once."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    write = asyncio.create_task(
+        coordinator.async_update_settings_fields(SETTINGS_GROUP_LED, {"state": False})
+    )
+    await asyncio.sleep(0)
+    assert coordinator.data.led_settings.state is False
+    assert await write
+
+    fake_gaggiuino.inject_fault("/api/settings/led", "error")
+    assert not await coordinator.async_update_settings_fields(
+        SETTINGS_GROUP_LED, {"state": True}
+    )
+    assert coordinator.data.led_settings.state is False
+    await coordinator.async_shutdown()
@@ -0,0 +1,121 @@
+"""Tests of the Gaggiuino shot export service."""
+
+from __future__ import annotations
+
+import csv
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.gaggiuino import export as export_module
+from custom_components.gaggiuino.const import DATA_FLEET, DOMAIN
+from custom_components.gaggiuino.export import EXPORT_COLUMNS, parquet_available
+from custom_components.gaggiuino.fleet import GaggiuinoFleet
+from custom_components.gaggiuino.services import async_setup_services
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_export_shots(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stream a range of stored shots to CSV and JSON files, a few at a time."""
+    monkeypatch.setattr(export_module, "EXPORT_CHUNK_SHOTS", 5)
+    async_setup_services(hass)
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await hass.async_block_till_done()
+    fake_gaggiuino.latest_shot_id = 13
+    await coordinator._async_ingest_shots(13)
+
+    # Shots 3 to 12, taken ten minutes apart
+    first = coordinator.shot_archive.get(3)
+    service_data = {
+        "config_entry_id": coordinator.entry.entry_id,
+        "start": datetime.fromtimestamp(first.timestamp, UTC),
+        "end": datetime.fromtimestamp(first.timestamp + 10 * 600, UTC),
+    }
+    result = await hass.services.async_call(
+        DOMAIN,
+        "export_shots",
+        {**service_data, "format": "csv", "filename": "shots.csv"},
+        blocking=True,
+        return_response=True,
+    )
+    path = Path(result["path"])
+    assert path.parent == Path(hass.config.path(DOMAIN, "exports"))
+    assert result["shots"] == 10
+    rows = list(csv.reader(path.read_text(encoding="utf-8").splitlines()))
+    assert tuple(rows[0]) == EXPORT_COLUMNS
+    assert [int(shot_id) for shot_id in dict.fromkeys(r[0] for r in rows[1:])] == list(
+        range(3, 13)
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        "export_shots",
+        {**service_data, "format": "json"},
+        blocking=True,
+        return_response=True,
+    )
+    shots = json.loads(Path(result["path"]).read_text(encoding="utf-8"))
+    assert [shot["id"] for shot in shots] == list(range(3, 13))
+    assert set(shots[0]) == {"id", "timestamp", "duration", "datapoints", "profile"}
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "export_shots",
+            {**service_data, "filename": "../shots.csv"},
+            blocking=True,
+            return_response=True,
+        )
+    if not parquet_available():
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "export_shots",
+                {**service_data, "format": "parquet"},
+                blocking=True,
+                return_response=True,
+            )
+    await coordinator.async_shutdown()
+
+
+async def test_unknown_entry(
+    hass: HomeAssistant,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Reject entry IDs that do not name a loaded Gaggiuino."""
+    async_setup_services(hass)
+    fleet = GaggiuinoFleet(hass)
+    coordinator = await coordinator_factory(fleet=fleet)
+    hass.data[DOMAIN][DATA_FLEET] = fleet
+    for entry_id in ("missing", DATA_FLEET):
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                "get_shots",
+                {"config_entry_id": entry_id},
+                blocking=True,
+                return_response=True,
+            )
+    hass.data[DOMAIN].pop(DATA_FLEET)
+    await coordinator.async_shutdown()
+    fleet.async_stop()
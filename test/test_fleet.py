@@ -0,0 +1,66 @@
+"""Tests of the Gaggiuino fleet scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.gaggiuino.const import DEFAULT_SHOT_SCAN_INTERVAL
+from custom_components.gaggiuino.fleet import GaggiuinoFleet
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+DURATION = 2.0
+
+
+async def test_brewing_machines_keep_shot_rate(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Poll two brewing machines at the shot interval, still apart from each other."""
+    fake_gaggiuino.status["brewSwitchState"] = True
+    fleet = GaggiuinoFleet(hass)
+    starts: list[tuple[float, int]] = []
+    coordinators = []
+    for machine in range(2):
+        coordinator = await coordinator_factory(fleet=fleet)
+        await refresh(coordinator)
+        assert coordinator.poll_interval == DEFAULT_SHOT_SCAN_INTERVAL
+        refresh_now = coordinator.async_refresh
+
+        async def timed_refresh(
+            refresh_now: Any = refresh_now, machine: int = machine
+        ) -> None:
+            starts.append((hass.loop.time(), machine))
+            await refresh_now()
+
+        coordinator.async_refresh = timed_refresh  # type: ignore[method-assign]
+        coordinators.append(coordinator)
+        fleet.async_add(coordinator)
+
+    await asyncio.sleep(DURATION)
+    polls = Counter(machine for _start, machine in starts)
+    for machine in range(len(coordinators)):
+        assert polls[machine] >= DURATION / DEFAULT_SHOT_SCAN_INTERVAL - 1
+    gaps = [later - earlier for (earlier, _), (later, _) in pairwise(sorted(starts))]
+    # Allow for loop wake-up lag
+    assert min(gaps) >= DEFAULT_SHOT_SCAN_INTERVAL / len(coordinators) / 2
+
+    for coordinator in coordinators:
+        fleet.async_remove(coordinator)
+        await coordinator.async_shutdown()
+    fleet.async_stop()
@@ -0,0 +1,63 @@
+"""Tests of the Gaggiuino warm-up model."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+from gaggiuino_api import GaggiuinoStatus
+
+from custom_components.gaggiuino import heatup as heatup_module
+from custom_components.gaggiuino.heatup import GaggiuinoHeatUpModel
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_learned_rate_predicts_warm_up(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Learn the warm-up rate of a machine and predict the next warm-up."""
+    monkeypatch.setattr(heatup_module, "SAVE_DELAY", 0)
+    cold = GaggiuinoStatus.from_dict(
+        {**fake_gaggiuino.status, "targetTemperature": "93.0", "temperature": "25.0"}
+    )
+    # Heats at 0.25 degrees per second, sampled every 2 s
+    warm_up = [
+        replace(cold, temperature=min(93.0, 25.0 + 0.25 * seconds))
+        for seconds in range(0, 300, 2)
+    ]
+
+    model = GaggiuinoHeatUpModel(hass, "machine")
+    for index, status in enumerate(warm_up):
+        model.update(status, index * 2)
+    assert model.ready
+    assert model.eta == 0
+    assert model.rate == pytest.approx(0.25, rel=0.05)
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    # The next day, the learned rate predicts the warm-up from the first sample
+    restarted = GaggiuinoHeatUpModel(hass, "machine")
+    await restarted.async_load()
+    restarted.update(warm_up[0], 100_000)
+    predicted = restarted.eta
+    for index, status in enumerate(warm_up):
+        restarted.update(status, 100_000 + index * 2)
+    actual = next(index * 2 for index, s in enumerate(warm_up) if s.temperature >= 92)
+
+    assert predicted == pytest.approx(actual, rel=0.1)
+    assert restarted.sessions == 2
+    # An idle profile is never ready
+    restarted.update(replace(cold, targetTemperature=15.0), 100_400)
+    assert not restarted.ready
+    assert restarted.eta is None
@@ -0,0 +1,74 @@
+"""Tests of the Gaggiuino integration setup."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import Platform
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.gaggiuino import (
+    PLATFORMS,
+    async_get_enabled_platforms,
+    async_setup_entry,
+)
+from custom_components.gaggiuino.const import DATA_FLEET, DOMAIN
+from custom_components.gaggiuino.fleet import GaggiuinoFleet
+
+from .conftest import make_config_entry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_disabled_platforms_skipped(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+) -> None:
+    """Leave out the platforms whose entities are all disabled."""
+    registry = er.async_get(hass)
+    entry = make_config_entry(fake_gaggiuino.url)
+    assert async_get_enabled_platforms(hass, entry) == PLATFORMS
+
+    for unique_id in ("led", "steam"):
+        registry.async_get_or_create(
+            "light" if unique_id == "led" else "number",
+            DOMAIN,
+            unique_id,
+            config_entry=entry,
+            disabled_by=(er.RegistryEntryDisabler.USER if unique_id == "led" else None),
+        )
+
+    platforms = async_get_enabled_platforms(hass, entry)
+    assert Platform.LIGHT not in platforms
+    assert Platform.NUMBER in platforms
+    assert Platform.SWITCH in platforms
+
+
+async def test_failed_setup_releases_fleet(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+) -> None:
+    """Stop the fleet a failed setup created, unless another entry is setting up."""
+    for path in ("/api/health", "/api/system/status"):
+        fake_gaggiuino.inject_fault(path, "error")
+
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, make_config_entry(fake_gaggiuino.url))
+    assert DATA_FLEET not in hass.data[DOMAIN]
+
+    # Another entry still setting up keeps the fleet and its session
+    fleet = hass.data[DOMAIN][DATA_FLEET] = GaggiuinoFleet(hass)
+    fleet.pending_setups += 1
+    with pytest.raises(ConfigEntryNotReady):
+        await async_setup_entry(hass, make_config_entry(fake_gaggiuino.url))
+    assert hass.data[DOMAIN][DATA_FLEET] is fleet
+    assert not fleet.session.closed
+    fleet.async_stop()
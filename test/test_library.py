@@ -0,0 +1,105 @@
+"""Tests of the Gaggiuino profile library services."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.gaggiuino.const import CONF_PROFILE_PUSH, DOMAIN
+from custom_components.gaggiuino.services import async_setup_services
+
+from .benchmark import refresh
+from .fake_gaggiuino import make_profile
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_push_profiles(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Push only the profiles a machine lacks or has a different version of."""
+    async_setup_services(hass)
+    fake_gaggiuino.profiles = [make_profile(i) for i in range(1, 21)]
+    coordinator = await coordinator_factory({CONF_PROFILE_PUSH: True})
+    await refresh(coordinator)
+    target = {"config_entry_id": coordinator.entry.entry_id}
+
+    exported = await hass.services.async_call(
+        DOMAIN, "export_profiles", target, blocking=True, return_response=True
+    )
+    assert len(exported["exported"]) == 20
+
+    # The machine drifts away from the library: one edit, one deletion
+    fake_gaggiuino.profiles[0]["waterTemperature"] = 88
+    del fake_gaggiuino.profiles[1]
+    fake_gaggiuino.reset_counters()
+    pushed = await hass.services.async_call(
+        DOMAIN, "push_profiles", target, blocking=True, return_response=True
+    )
+
+    assert sorted(pushed["pushed"]) == ["Profile 1", "Profile 2"]
+    # One download to diff, then only the two deltas
+    assert fake_gaggiuino.total_requests == 3
+    diff = await hass.services.async_call(
+        DOMAIN, "diff_profiles", target, blocking=True, return_response=True
+    )
+    assert diff["changed"] == diff["missing"] == []
+    await coordinator.async_shutdown()
+
+
+async def test_push_needs_opt_in(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Refuse to push profiles unless enabled in the machine options."""
+    async_setup_services(hass)
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    fake_gaggiuino.reset_counters()
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "push_profiles",
+            {"config_entry_id": coordinator.entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )
+    assert fake_gaggiuino.total_requests == 0
+    await coordinator.async_shutdown()
+
+
+async def test_failed_push_not_retried(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Send every profile once, even if the machine drops the connection."""
+    async_setup_services(hass)
+    coordinator = await coordinator_factory({CONF_PROFILE_PUSH: True})
+    await refresh(coordinator)
+    target = {"config_entry_id": coordinator.entry.entry_id}
+    await hass.services.async_call(
+        DOMAIN, "export_profiles", target, blocking=True, return_response=True
+    )
+
+    fake_gaggiuino.profiles = fake_gaggiuino.profiles[2:]
+    fake_gaggiuino.inject_fault("/api/profiles/save", "disconnect")
+    pushed = await hass.services.async_call(
+        DOMAIN, "push_profiles", target, blocking=True, return_response=True
+    )
+    assert sorted(pushed["failed"]) == ["Profile 1", "Profile 2"]
+    assert fake_gaggiuino.requests["POST /api/profiles/save"] == 2
+    await coordinator.async_shutdown()
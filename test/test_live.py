@@ -0,0 +1,131 @@
+"""Tests of the Gaggiuino live shot metrics."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+from gaggiuino_api import GaggiuinoStatus
+from homeassistant.const import MATCH_ALL
+
+from custom_components.gaggiuino.const import (
+    EVENT_HEATED_UP,
+    EVENT_PREINFUSION_END,
+    EVENT_SHOT_FINISHED,
+    EVENT_SHOT_STARTED,
+    EVENT_STEAM_FINISHED,
+    EVENT_STEAM_STARTED,
+)
+from custom_components.gaggiuino.live import RunningSlope, ShotTracker
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+EVENTS = {
+    EVENT_HEATED_UP,
+    EVENT_PREINFUSION_END,
+    EVENT_SHOT_FINISHED,
+    EVENT_SHOT_STARTED,
+    EVENT_STEAM_FINISHED,
+    EVENT_STEAM_STARTED,
+}
+
+
+async def test_running_slope() -> None:
+    """Fit the slope over the last points only."""
+    slope = RunningSlope(3)
+    slope.add(0, 0)
+    assert slope.slope is None
+    for t, y in ((1, 1), (2, 2), (3, 10), (4, 18)):
+        slope.add(t, y)
+    assert slope.slope == pytest.approx(8.0)
+    slope.clear()
+    assert slope.slope is None
+
+
+async def test_steady_shot(fake_gaggiuino: FakeGaggiuino) -> None:
+    """Track a steady 2 g/s shot sampled 10 times per second."""
+    tracker = ShotTracker()
+    brewing = GaggiuinoStatus.from_dict(
+        {**fake_gaggiuino.status, "brewSwitchState": True}
+    )
+    for index in range(50):
+        status = replace(brewing, weight=index / 5, pressure=9.0 - index / 100)
+        tracker.update(status, 1000 + index / 10, 36.0)
+
+    assert tracker.shot_time == pytest.approx(4.9)
+    assert tracker.weight_flow == pytest.approx(2.0)
+    assert tracker.pressure_slope == pytest.approx(-0.1)
+    assert tracker.projected_time == pytest.approx(18.0)
+
+    tracker.update(replace(brewing, brewSwitchState=False), 1005, None)
+    assert not tracker.active
+    assert tracker.shot_time == pytest.approx(5.0)
+    assert tracker.weight_flow is None
+    assert tracker.projected_time is None
+
+
+async def test_coordinator_tracks_shot(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Feed the polled status to the shot tracker."""
+    coordinator = await coordinator_factory()
+    fake_gaggiuino.status["brewSwitchState"] = True
+    await refresh(coordinator)
+    assert coordinator.shot_tracker.active
+    fake_gaggiuino.status["brewSwitchState"] = False
+    await refresh(coordinator)
+    assert not coordinator.shot_tracker.active
+    assert coordinator.shot_tracker.weight_flow is None
+    await coordinator.async_shutdown()
+
+
+async def test_lifecycle_events(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Fire lifecycle events from a warm-up, a shot and steaming."""
+    fired: list[Event] = []
+    hass.bus.async_listen(MATCH_ALL, fired.append)
+    coordinator = await coordinator_factory()
+    steps = [
+        {"temperature": "80.0"},
+        {"temperature": "92.5"},
+        {"brewSwitchState": True, "pressure": "2.0"},
+        {"pressure": "9.0", "weight": "5.0"},
+        {"pressure": "8.5", "weight": "36.0"},
+        {"brewSwitchState": False, "pressure": "0.0"},
+        {"steamSwitchState": True},
+        {"steamSwitchState": False},
+    ]
+    for step in steps:
+        fake_gaggiuino.status.update(step)
+        await refresh(coordinator)
+    await hass.async_block_till_done()
+
+    events = [event.event_type for event in fired if event.event_type in EVENTS]
+
+    assert events == [
+        EVENT_HEATED_UP,
+        EVENT_SHOT_STARTED,
+        EVENT_PREINFUSION_END,
+        EVENT_SHOT_FINISHED,
+        EVENT_STEAM_STARTED,
+        EVENT_STEAM_FINISHED,
+    ]
+    finished = next(event for event in fired if event.event_type == EVENT_SHOT_FINISHED)
+    assert finished.data["entry_id"] == coordinator.entry.entry_id
+    assert finished.data["peak_pressure"] == 9.0
+    assert finished.data["weight"] == 36.0
+    await coordinator.async_shutdown()
@@ -0,0 +1,88 @@
+"""Tests of the Gaggiuino profile cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .benchmark import refresh
+from .conftest import ALL_TIERS_DUE
+from .fake_gaggiuino import make_profile
+
+if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+
+    from gaggiuino_api import GaggiuinoProfile
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+PROFILES_REQUEST = "GET /api/profiles/all"
+
+
+async def test_unchanged_profiles_keep_index(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Check that downloading the same profiles again keeps the cached index."""
+    coordinator = await coordinator_factory(ALL_TIERS_DUE)
+    await refresh(coordinator)
+    profiles = coordinator.profiles
+    options = coordinator.profile_options
+
+    await refresh(coordinator)
+
+    assert fake_gaggiuino.requests[PROFILES_REQUEST] == 2
+    assert coordinator.profiles is profiles
+    assert coordinator.profile_options is options
+    await coordinator.async_shutdown()
+
+
+async def test_new_profile_refetched(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Refetch the profiles once when the machine selects an unknown profile."""
+    fake_gaggiuino.profiles = [make_profile(i) for i in range(1, 4)]
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    options = coordinator.profile_options
+
+    fake_gaggiuino.profiles.append(make_profile(4))
+    fake_gaggiuino.status.update(profileId="4", profileName="Profile 4")
+    await refresh(coordinator)
+    await refresh(coordinator)
+
+    assert fake_gaggiuino.requests[PROFILES_REQUEST] == 2
+    assert coordinator.profile_options is not options
+    assert coordinator.profile_options["Profile 4 (ID: 4)"] == 4
+    await coordinator.async_shutdown()
+
+
+async def test_select_profile_published(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Pass a selected profile on to the entities within the request limits."""
+    coordinator = await coordinator_factory(ALL_TIERS_DUE)
+    await refresh(coordinator)
+    updates: list[GaggiuinoProfile | None] = []
+    coordinator.async_add_listener(lambda: updates.append(coordinator.data.profile))
+    slots = 0
+    request_slot = coordinator._request_slot
+
+    def counted_slot() -> AbstractAsyncContextManager[None]:
+        nonlocal slots
+        slots += 1
+        return request_slot()
+
+    coordinator._request_slot = counted_slot
+    await coordinator.select_profile(2)
+    assert fake_gaggiuino.status["profileId"] == "2"
+    assert slots == 1
+    assert updates == [coordinator.api.profile]
+    await coordinator.async_shutdown()
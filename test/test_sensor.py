@@ -0,0 +1,120 @@
+"""Tests of the Gaggiuino sensors."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from custom_components.gaggiuino.const import (
+    ATTR_STALE,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_PRESSURE_DEADBAND,
+)
+from custom_components.gaggiuino.sensor import SENSORS, GaggiuinoSensor
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.gaggiuino.coordinator import (
+        GaggiuinoDataUpdateCoordinator,
+    )
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+DEADBAND = 0.5
+
+
+def _pressure_sensor(
+    hass: HomeAssistant, coordinator: GaggiuinoDataUpdateCoordinator
+) -> tuple[GaggiuinoSensor, list[tuple[Any, dict[str, Any] | None]]]:
+    """Return the pressure sensor and the list of states it writes."""
+    description = next(d for d in SENSORS if d.key == "pressure")
+    sensor = GaggiuinoSensor(coordinator, description)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.gaggiuino_pressure"
+    writes: list[tuple[Any, dict[str, Any] | None]] = []
+    sensor.async_write_ha_state = lambda: writes.append(
+        (sensor.native_value, sensor.extra_state_attributes)
+    )
+    return sensor, writes
+
+
+async def _poll_pressure(
+    fake: FakeGaggiuino,
+    coordinator: GaggiuinoDataUpdateCoordinator,
+    sensor: GaggiuinoSensor,
+    pressure: float,
+) -> None:
+    fake.status["pressure"] = str(pressure)
+    await refresh(coordinator)
+    sensor._handle_coordinator_update()
+
+
+async def test_deadband(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Hold back changes smaller than the deadband, measured from the last write."""
+    coordinator = await coordinator_factory(
+        {CONF_PRESSURE_DEADBAND: DEADBAND, CONF_MIN_WRITE_INTERVAL: 0}
+    )
+    sensor, writes = _pressure_sensor(hass, coordinator)
+
+    for pressure in (1.0, 1.3, 1.6, 1.9, 2.0, 1.0):
+        await _poll_pressure(fake_gaggiuino, coordinator, sensor, pressure)
+    # 1.3 and 1.9 are within the deadband of the value written before them,
+    # and 2.0 is held back as nothing else changed
+    assert [value for value, _attributes in writes] == [1.0, 1.6, 1.0]
+    await coordinator.async_shutdown()
+
+
+async def test_stale_flag_cleared(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Write a restored state again once a poll confirms it, within the deadband."""
+    coordinator = await coordinator_factory(
+        {CONF_PRESSURE_DEADBAND: DEADBAND, CONF_MIN_WRITE_INTERVAL: 0}
+    )
+    sensor, writes = _pressure_sensor(hass, coordinator)
+    await refresh(coordinator)
+    coordinator.data = replace(coordinator.data, restored=True)
+    sensor._handle_coordinator_update()
+    assert writes[-1][1] == {ATTR_STALE: True}
+
+    await _poll_pressure(fake_gaggiuino, coordinator, sensor, 0.1)
+    assert len(writes) == 2
+    assert not writes[-1][1]
+    await coordinator.async_shutdown()
+
+
+async def test_throttle(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Write at most once per interval, then the latest value."""
+    coordinator = await coordinator_factory(
+        {CONF_PRESSURE_DEADBAND: DEADBAND, CONF_MIN_WRITE_INTERVAL: 0.2}
+    )
+    sensor, writes = _pressure_sensor(hass, coordinator)
+
+    for pressure in (1.0, 3.0, 5.0):
+        await _poll_pressure(fake_gaggiuino, coordinator, sensor, pressure)
+    assert [value for value, _attributes in writes] == [1.0]
+
+    await asyncio.sleep(0.3)
+    assert [value for value, _attributes in writes] == [1.0, 5.0]
+    await sensor.async_will_remove_from_hass()
+    await coordinator.async_shutdown()
@@ -0,0 +1,150 @@
+"""Tests of the Gaggiuino settings writes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.gaggiuino.const import SETTINGS_GROUP_LED, SETTINGS_GROUP_SCALES
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_optimistic_write(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Apply a written value at once and keep it once the machine accepts it."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    assert await coordinator.async_update_settings_fields(
+        SETTINGS_GROUP_LED, {"state": False}
+    )
+    assert coordinator.led_settings.state is False
+    assert fake_gaggiuino.settings["led"]["state"] is False
+    await coordinator.async_shutdown()
+
+
+async def test_failed_write_rolls_back(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Restore the previous value when the machine rejects a write."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    state = coordinator.led_settings.state
+
+    fake_gaggiuino.inject_fault("/api/settings/led", "error")
+    assert not await coordinator.async_update_settings_fields(
+        SETTINGS_GROUP_LED, {"state": not state}
+    )
+    assert coordinator.led_settings.state is state
+    assert fake_gaggiuino.settings["led"]["state"] is state
+    await coordinator.async_shutdown()
+
+
+async def test_dropped_write_not_repeated(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Send a write once, even if the connection drops before the answer."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    state = coordinator.led_settings.state
+
+    fake_gaggiuino.inject_fault("/api/settings/led", "disconnect")
+    with pytest.raises(UpdateFailed):
+        await coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_LED, {"state": not state}
+        )
+    assert fake_gaggiuino.requests["POST /api/settings/led"] == 1
+    assert coordinator.led_settings.state is state
+    await coordinator.async_shutdown()
+
+
+async def test_coalesced_writes(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Write every change made to one group at once, and report to every caller."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    results = await asyncio.gather(
+        coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"hwScalesEnabled": False}
+        ),
+        coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"btScalesEnabled": True}
+        ),
+        coordinator.async_update_settings_fields(
+            SETTINGS_GROUP_SCALES, {"forcePredictive": True}
+        ),
+    )
+
+    assert results == [True, True, True]
+    scales = fake_gaggiuino.settings["scales"]
+    assert scales["hwScalesEnabled"] is False
+    assert scales["btScalesEnabled"] is True
+    assert scales["forcePredictive"] is True
+    await coordinator.async_shutdown()
+
+
+async def test_failed_write_not_resent(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Leave the fields of a failed write out of the change queued behind it."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    fake_gaggiuino.latency = 0.2
+    fake_gaggiuino.inject_fault("/api/settings/led", "error")
+
+    failed = asyncio.create_task(
+        coordinator.async_update_settings_fields(SETTINGS_GROUP_LED, {"state": False})
+    )
+    while not fake_gaggiuino.in_flight:
+        await asyncio.sleep(0.01)
+    queued = asyncio.create_task(
+        coordinator.async_update_settings_fields(SETTINGS_GROUP_LED, {"disco": True})
+    )
+    assert not await failed
+    fake_gaggiuino.clear_faults()
+    assert coordinator.led_settings.state is True
+    assert coordinator.led_settings.disco is True
+
+    assert await queued
+    assert fake_gaggiuino.settings["led"]["state"] is True
+    assert fake_gaggiuino.settings["led"]["disco"] is True
+    await coordinator.async_shutdown()
+
+
+async def test_write_after_reset(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Fail a queued write whose settings were forgotten before it was sent."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    write = asyncio.create_task(
+        coordinator.async_update_settings_fields(SETTINGS_GROUP_LED, {"state": False})
+    )
+    await asyncio.sleep(0)
+    coordinator._reset_data()
+    with pytest.raises(UpdateFailed):
+        await asyncio.wait_for(write, 5)
+    assert coordinator.led_settings is None
+    assert fake_gaggiuino.requests["POST /api/settings/led"] == 0
+    await coordinator.async_shutdown()
@@ -0,0 +1,67 @@
+"""Tests of the Gaggiuino shot downloads."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .benchmark import refresh
+from .fake_gaggiuino import make_shot
+
+if TYPE_CHECKING:
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_malformed_shot_skipped(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Store the shots after a malformed one instead of stalling on it."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    fake_gaggiuino.shots[2] = {"id": 2, "unexpected": True}
+    fake_gaggiuino.shots[3] = {**make_shot(3), "timestamp": "soon"}
+    fake_gaggiuino.latest_shot_id = 4
+    await coordinator._async_ingest_shots(4)
+    assert coordinator.shot_archive.shot_ids() == {1, 4}
+    assert coordinator.last_shot_summary.id == 4
+
+    # Not downloaded again
+    fake_gaggiuino.reset_counters()
+    await coordinator._async_ingest_shots(4)
+    assert fake_gaggiuino.total_requests == 0
+    await coordinator.async_shutdown()
+
+
+async def test_store_failure_retried(
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Download a shot again on the next poll when storing it failed."""
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+
+    save = coordinator.shot_store.save
+
+    def full_disk(shot: object) -> None:
+        monkeypatch.setattr(coordinator.shot_store, "save", save)
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    monkeypatch.setattr(coordinator.shot_store, "save", full_disk)
+    fake_gaggiuino.latest_shot_id = 3
+    await coordinator._async_ingest_shots(3)
+    assert coordinator.shot_archive.shot_ids() == {1}
+    assert coordinator._stored_shot_id == 1
+
+    await coordinator._async_ingest_shots(3)
+    assert coordinator.shot_archive.shot_ids() == {1, 2, 3}
+    assert coordinator._stored_shot_id == 3
+    await coordinator.async_shutdown()
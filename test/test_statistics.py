@@ -0,0 +1,180 @@
+"""Tests of the Gaggiuino long-term shot statistics."""
+
+from __future__ import annotations
+
+import sys
+from enum import IntEnum
+from types import ModuleType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import pytest
+
+from custom_components.gaggiuino import coordinator as coordinator_module
+from custom_components.gaggiuino.const import DOMAIN
+from custom_components.gaggiuino.statistics import HOUR, async_import_statistics
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_import_per_download(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Import downloaded shots as hourly statistics, one batch per download."""
+    imports: list[list[tuple[dict[str, Any], list[dict[str, Any]]]]] = []
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_import_statistics",
+        lambda _hass, batches: imports.append(batches),
+    )
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await hass.async_block_till_done()
+    hass.config.components.add("recorder")
+
+    # Twelve shots, ten minutes apart, spread over three hours
+    fake_gaggiuino.latest_shot_id = 13
+    await coordinator._async_ingest_shots(13)
+    assert len(imports) == 1
+    batches = {metadata["statistic_id"]: rows for metadata, rows in imports[0]}
+    prefix = f"{DOMAIN}:{coordinator.entry.entry_id.lower()}"
+    counts = batches[f"{prefix}_shot_count"]
+    assert [row["state"] for row in counts] == [4, 6, 3]
+    assert [row["sum"] for row in counts] == [4, 10, 13]
+    assert all(row["start"].timestamp() % HOUR == 0 for row in counts)
+    assert len(batches[f"{prefix}_shot_yield"]) == 3
+    unit_classes = {
+        metadata["statistic_id"]: metadata["unit_class"] for metadata, _ in imports[0]
+    }
+    assert unit_classes == {
+        f"{prefix}_shot_yield": "mass",
+        f"{prefix}_shot_duration": "duration",
+        f"{prefix}_shot_peak_pressure": "pressure",
+        f"{prefix}_shot_count": None,
+    }
+    assert len(batches[f"{prefix}_shot_peak_pressure"]) == 3
+
+    # Nothing new, nothing imported
+    await coordinator._async_ingest_shots(13)
+    assert len(imports) == 1
+    await coordinator.async_shutdown()
+
+
+async def test_no_import_without_recorder(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Skip the statistics when the recorder is not loaded."""
+    imports: list[Any] = []
+    monkeypatch.setattr(
+        coordinator_module,
+        "async_import_statistics",
+        lambda _hass, batches: imports.append(batches),
+    )
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    await hass.async_block_till_done()
+
+    fake_gaggiuino.latest_shot_id = 3
+    await coordinator._async_ingest_shots(3)
+    assert coordinator.stored_shot_id == 3
+    assert imports == []
+    await coordinator.async_shutdown()
+
+
+class _StatisticMeanType(IntEnum):
+    NONE = 0
+    ARITHMETIC = 1
+
+
+class _StatisticMetaData(TypedDict):
+    has_mean: bool
+    mean_type: _StatisticMeanType
+    unit_class: str | None
+
+
+async def test_mean_type(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tell a recorder that knows mean_type how each statistic is averaged."""
+    added: list[dict[str, Any]] = []
+    recorder = ModuleType("recorder")
+    statistics = ModuleType("statistics")
+    statistics.async_add_external_statistics = (  # type: ignore[attr-defined]
+        lambda _hass, metadata, _rows: added.append(metadata)
+    )
+    models = ModuleType("models")
+    models.StatisticMeanType = _StatisticMeanType  # type: ignore[attr-defined]
+    models.StatisticMetaData = _StatisticMetaData  # type: ignore[attr-defined]
+    recorder.models = models  # type: ignore[attr-defined]
+    for name, module in (
+        ("", recorder),
+        (".statistics", statistics),
+        (".models", models),
+    ):
+        monkeypatch.setitem(
+            sys.modules, f"homeassistant.components.recorder{name}", module
+        )
+
+    async_import_statistics(
+        hass,
+        [
+            ({"has_mean": True, "unit_class": "mass", "name": "Yield"}, []),
+            ({"has_mean": False, "unit_class": None, "name": "Shots"}, []),
+        ],
+    )
+    assert added == [
+        {
+            "has_mean": True,
+            "mean_type": _StatisticMeanType.ARITHMETIC,
+            "unit_class": "mass",
+        },
+        {"has_mean": False, "mean_type": _StatisticMeanType.NONE, "unit_class": None},
+    ]
+
+
+async def test_recorder_accepts_metadata(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Import statistics whose metadata the installed recorder can store."""
+    pytest.importorskip("sqlalchemy")
+    from homeassistant.components.recorder import statistics as recorder_statistics
+    from homeassistant.components.recorder.db_schema import StatisticsMeta
+
+    stored: list[StatisticsMeta] = []
+    monkeypatch.setattr(
+        recorder_statistics,
+        "get_instance",
+        lambda _hass: SimpleNamespace(
+            async_import_statistics=lambda metadata, _rows, _table: stored.append(
+                StatisticsMeta.from_meta(metadata)
+            )
+        ),
+    )
+    coordinator = await coordinator_factory()
+    await refresh(coordinator)
+    hass.config.components.add("recorder")
+
+    fake_gaggiuino.latest_shot_id = 3
+    await coordinator._async_ingest_shots(3)
+    assert sorted(meta.unit_of_measurement or "" for meta in stored) == [
+        "",
+        "bar",
+        "g",
+        "s",
+    ]
+    await coordinator.async_shutdown()
@@ -0,0 +1,52 @@
+"""Tests of the Gaggiuino poll statistics and diagnostics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.gaggiuino.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .benchmark import measure_cycles
+from .conftest import ALL_TIERS_DUE
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_endpoint_stats(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Check the per-endpoint statistics against the requests the machine saw."""
+    fake_gaggiuino.latency = 0.002
+    fake_gaggiuino.inject_fault("/api/health", "disconnect")
+    coordinator = await coordinator_factory(ALL_TIERS_DUE)
+
+    result = await measure_cycles(coordinator, fake_gaggiuino, 10)
+    stats = coordinator.stats.as_dict()
+
+    assert result.failures == 0
+    assert stats["cycle"]["requests"] == 10
+    status = stats["endpoints"]["status"]
+    assert status["requests"] == 10
+    assert status["errors"] == 0
+    assert status["p50"] >= 2
+    health = stats["endpoints"]["health"]
+    assert health["errors"] == health["requests"] == 10
+    assert health["last_error"] is not None
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, coordinator.entry)
+    assert diagnostics["entry"]["data"]["url"] == "**REDACTED**"
+    assert diagnostics["stats"] == coordinator.stats.as_dict()
+    await coordinator.async_shutdown()
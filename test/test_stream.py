@@ -0,0 +1,151 @@
+"""Tests of the Gaggiuino live status stream."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.gaggiuino import stream as stream_module
+from custom_components.gaggiuino.const import CONF_STREAMING, DEFAULT_LIVE_SCAN_INTERVAL
+from custom_components.gaggiuino.stream import (
+    STREAM_RECONNECT_MAX,
+    STREAM_RECONNECT_MIN,
+    GaggiuinoStatusStream,
+    parse_status_message,
+)
+
+from .benchmark import refresh
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .conftest import CoordinatorFactory
+    from .fake_gaggiuino import FakeGaggiuino
+
+# Fixtures live on the session event loop, see pyproject.toml
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+async def test_parse_status_message() -> None:
+    """Map web UI fields to status fields, skipping what cannot be parsed."""
+    assert parse_status_message(
+        {
+            "action": "sensor_data_update",
+            "data": {
+                "temperature": 92.5,
+                "pressure": "9.1",
+                "shotWeight": 36,
+                "brewActive": 1,
+                "unknownField": 3,
+            },
+        }
+    ) == {
+        "temperature": 92.5,
+        "pressure": 9.1,
+        "weight": 36.0,
+        "brewSwitchState": True,
+    }
+    # Unusable values are dropped, the rest of the message is kept
+    assert parse_status_message(
+        {
+            "action": "system_state_update",
+            "data": {"waterLevel": "full", "temperature": None, "timeAlive": "120"},
+        }
+    ) == {"upTime": 120}
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        {"action": "log_record", "data": {"temperature": 92.5}},
+        {"data": {"temperature": 92.5}},
+        {"action": "sensor_data_update", "data": [92.5]},
+        {"action": "sensor_data_update"},
+    ],
+)
+async def test_parse_unusable_message(message: dict[str, object]) -> None:
+    """Ignore unknown actions and messages without a data object."""
+    assert parse_status_message(message) == {}
+
+
+def _stop_after(
+    monkeypatch: pytest.MonkeyPatch, reconnects: int
+) -> tuple[list[float], asyncio.Event]:
+    """Record the reconnect delays of the stream, ending it after a few."""
+    delays: list[float] = []
+    stopped = asyncio.Event()
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == reconnects:
+            stopped.set()
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(stream_module, "asyncio", SimpleNamespace(sleep=sleep))
+    return delays, stopped
+
+
+async def test_stream_unavailable(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Back off between attempts when the firmware has no stream."""
+    coordinator = await coordinator_factory()
+    delays, _stopped = _stop_after(monkeypatch, 8)
+    connections: list[bool] = []
+    stream = GaggiuinoStatusStream(
+        coordinator._session,
+        fake_gaggiuino.url,
+        lambda _fields: None,
+        connections.append,
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await stream.run()
+    assert delays == [
+        min(STREAM_RECONNECT_MIN * 2**attempt, STREAM_RECONNECT_MAX)
+        for attempt in range(8)
+    ]
+    assert fake_gaggiuino.requests["GET /ws"] == 8
+    assert not connections
+    assert not stream.connected
+    await coordinator.async_shutdown()
+
+
+async def test_stream_closed_falls_back_to_polling(
+    hass: HomeAssistant,
+    fake_gaggiuino: FakeGaggiuino,
+    coordinator_factory: CoordinatorFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Apply pushed status, then poll again once the machine closes the stream."""
+    coordinator = await coordinator_factory({CONF_STREAMING: True})
+    await refresh(coordinator)
+    delays, stopped = _stop_after(monkeypatch, 1)
+    fake_gaggiuino.stream_messages = [
+        {"action": "sensor_data_update", "data": {"temperature": 80.5}},
+    ]
+    fake_gaggiuino.reset_counters()
+
+    temperatures: list[float] = []
+    coordinator.async_add_listener(
+        lambda: temperatures.append(coordinator.status.temperature)
+    )
+
+    coordinator.async_start_stream()
+    await asyncio.wait_for(stopped.wait(), 5)
+    await hass.async_block_till_done()
+    assert temperatures[0] == 80.5
+    assert delays == [STREAM_RECONNECT_MIN]
+    assert not coordinator.stream_connected
+    assert coordinator.update_interval == timedelta(seconds=DEFAULT_LIVE_SCAN_INTERVAL)
+    # Polled right away instead of waiting for the next scheduled refresh
+    assert fake_gaggiuino.requests["GET /api/system/status"] == 1
+    assert coordinator.status.temperature == float(fake_gaggiuino.status["temperature"])
+    await coordinator.async_shutdown()